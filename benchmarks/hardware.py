@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""hardware.py -- Benchmarks for the hardware simulation
+
+Compare the ways of running the simulated Computer: pulling values through
+the Component hierarchy, evaluating its flattened netlist in full or only
+where values change, and running code generated from the netlist.  Also compare
+evaluating input vectors one at a time against bit-sliced evaluation.  Run
+with -h to see the available benchmarks.
+"""
+import argparse
+import random
+import sys
+import time
+
+from ternary.hardware import codegen, netlist
+from ternary.hardware.arithmetic import Add12
+from ternary.hardware.computer import Computer
+from ternary.trit import ZERO, POS
+
+
+# Multiply RAM[0] by RAM[1] and store the result in RAM[3].
+MUL_PROGRAM = (
+        '-00000000000'  # 01. MOV 0 A
+        '+000000-00++'  # 02. MOV -77 D
+        '00++0++00000'  # 03. CPY D M
+        '-0000000000+'  # 04. MOV 1 A
+        '+000000000+0'  # 05. MOV 3 D
+        '00++0++00000'  # 06. CPY D M
+        '-000000000+0'  # 07. MOV 3 A
+        '00++++-00000'  # 08. CLR M
+        '-0000000000+'  # 09. MOV 1 A
+        '0+0+0++00000'  # 10. CPY M D
+        '-000000000+-'  # 11. MOV 2 A
+        '00++0++00000'  # 12. CPY D M
+        '-00000000000'  # 13. LOOP: MOV 0 A
+        '0+0+0++00000'  # 14. CPY M D
+        '-000000000+0'  # 15. MOV 3 A
+        '000+00+00000'  # 16. ADD D M M
+        '-000000000+-'  # 17. MOV 2 A
+        '0+00-0000000'  # 18. DEC M D
+        '00++0++00000'  # 19. CPY D M
+        '---------00-'  # 20. MOV LOOP A
+        '0+++0++000+-'  # 21. CHK D JGT
+        )
+
+
+def make_pull(comp: Computer):
+    return comp
+
+
+def make_netlist(comp: Computer):
+    return netlist.Evaluator(netlist.Netlist(comp))
+
+
+def make_event(comp: Computer):
+    return netlist.EventEvaluator(netlist.Netlist(comp))
+
+
+def make_codegen(comp: Computer):
+    return codegen.CompiledEvaluator(netlist.Netlist(comp))
+
+
+RUNNERS = {
+        'pull': make_pull,
+        'netlist': make_netlist,
+        'event': make_event,
+        'codegen': make_codegen,
+        }
+
+
+def measure_cycles(make, cycles: int) -> tuple[float, float]:
+    """Return the set-up time and the clock cycles per second of a runner."""
+    comp = Computer()
+    comp.load_program(MUL_PROGRAM)
+    start = time.perf_counter()
+    runner = make(comp)
+    setup = time.perf_counter() - start
+    runner.set_inputs(POS)
+    runner.tick()
+    runner.set_inputs(ZERO)
+    start = time.perf_counter()
+    for _ in range(cycles):
+        runner.tick()
+    return (setup, cycles / (time.perf_counter() - start))
+
+
+def bench_cycles(args: argparse.Namespace) -> None:
+    """Clock cycles per second of the Computer, for each way of running it.
+
+    The pull-based Component is slow enough that it only runs a tenth as many
+    cycles as the others.
+    """
+    print(f"{'runner':>8} {'setup':>9} {'cycles/s':>10} {'speedup':>8}")
+    base = None
+    for name, make in RUNNERS.items():
+        cycles = args.cycles // 10 if name == 'pull' else args.cycles
+        setup, rate = measure_cycles(make, max(cycles, 1))
+        if base is None:
+            base = rate
+        print(f"{name:>8} {setup:>8.4f}s {rate:>10.0f} {rate / base:>7.1f}x")
+
+
+def bench_vectors(args: argparse.Namespace) -> None:
+    """Input vectors per second through Add12, one at a time or bit-sliced."""
+    vectors = [
+            tuple(random.choices('-0+', k=24)) for _ in range(args.vectors)]
+    comp = Add12()
+    start = time.perf_counter()
+    for inputs in vectors[:args.vectors // 100 or 1]:
+        comp.clear_cache()
+        comp.get_outputs(inputs)
+    pull = (args.vectors // 100 or 1) / (time.perf_counter() - start)
+
+    sim = netlist.SlicedEvaluator(netlist.Netlist(Add12()))
+    start = time.perf_counter()
+    sim.evaluate(vectors)
+    sliced = args.vectors / (time.perf_counter() - start)
+    print(f"{'pull':>10} {'sliced':>10} {'speedup':>8}")
+    print(f"{pull:>10.0f} {sliced:>10.0f} {sliced / pull:>7.1f}x")
+
+
+BENCHMARKS = {
+        'cycles': bench_cycles,
+        'vectors': bench_vectors,
+        }
+
+
+def cli():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+            'names', nargs='*', metavar='name',
+            help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument(
+            '-c', '--cycles', type=int, default=500,
+            help="Clock cycles to run")
+    parser.add_argument(
+            '-v', '--vectors', type=int, default=10000,
+            help="Input vectors for the vectors benchmark")
+    parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    random.seed(args.seed)
+    for name in args.names or BENCHMARKS:
+        print(f"{name}: {BENCHMARKS[name].__doc__.splitlines()[0]}")
+        BENCHMARKS[name](args)
+        print()
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    cli()
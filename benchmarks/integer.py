@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""integer.py -- Benchmarks for balanced ternary integer arithmetic
+
+Compare the current Int arithmetic against the naive methods it replaced, on
+operands of increasing size.  Run with -h to see the available benchmarks.
+"""
+import argparse
+import random
+import sys
+import time
+
+from ternary import integer
+from ternary.integer import Int
+
+
+def random_int(size: int) -> Int:
+    """Return a random positive Int of exactly 'size' trits."""
+    return Int('+' + ''.join(random.choice('-0+') for _ in range(size - 1)))
+
+
+def measure(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def naive_divmod(a: Int, b: Int) -> tuple[Int, Int]:
+    """Divide positive Ints by repeated subtraction."""
+    remain = Int(a)
+    quotient = integer.INT_ZERO
+    while remain >= b:
+        remain -= b
+        quotient += integer.INT_ONE
+    return (quotient, remain)
+
+
+def naive_pow(base: Int, exponent: int, modulus: Int = None) -> Int:
+    """Raise an Int to a power by repeated multiplication."""
+    result = integer.INT_ONE
+    for _ in range(exponent):
+        result = result * base
+        if modulus is not None:
+            result = result % modulus
+    return result
+
+
+def bench_divmod(args: argparse.Namespace) -> None:
+    """Long division against repeated subtraction.
+
+    The naive method is O(quotient), so we keep its quotient down to about six
+    trits, and also show long division with a quotient half the size of the
+    dividend, where the naive method is hopeless.
+    """
+    print(f"{'trits':>6} {'naive':>10} {'long':>10} {'speedup':>8} "
+          f"{'long (n/2)':>11}")
+    for size in args.sizes:
+        a = random_int(size)
+        b = random_int(size - 6)
+        naive = measure(naive_divmod, a, b)
+        long = measure(divmod, a, b)
+        half = measure(divmod, a, random_int(size // 2))
+        print(f"{size:>6} {naive:>9.4f}s {long:>9.4f}s {naive / long:>7.1f}x "
+              f"{half:>10.4f}s")
+
+
+def bench_mul(args: argparse.Namespace) -> None:
+    """Karatsuba and Toom-3 multiplication against the schoolbook method."""
+    print(f"{'trits':>6} {'schoolbook':>11} {'karatsuba':>10} {'toom-3':>10} "
+          f"{'auto':>10}")
+    for size in args.sizes:
+        a = random_int(size)
+        b = random_int(size)
+        school = measure(Int.schoolbook_multiply, a, b)
+        kara = measure(Int.karatsuba_multiply, a, b)
+        toom = measure(Int.toom3_multiply, a, b)
+        auto = measure(Int.__mul__, a, b)
+        print(f"{size:>6} {school:>10.4f}s {kara:>9.4f}s {toom:>9.4f}s "
+              f"{auto:>9.4f}s")
+
+
+def bench_pow(args: argparse.Namespace) -> None:
+    """Square-and-multiply powers against repeated multiplication.
+
+    The base is a small Int, so that the naive method is not swamped by the
+    cost of multiplying huge numbers.  The modular power reduces by a 30 trit
+    modulus after every multiplication.
+    """
+    base = random_int(5)
+    modulus = random_int(30)
+    print(f"{'exponent':>8} {'naive':>10} {'square':>10} {'speedup':>8} "
+          f"{'naive mod':>10} {'square mod':>11} {'speedup':>8}")
+    for exponent in args.exponents:
+        naive = measure(naive_pow, base, exponent)
+        square = measure(pow, base, exponent)
+        naive_mod = measure(naive_pow, base, exponent, modulus)
+        square_mod = measure(pow, base, exponent, modulus)
+        print(f"{exponent:>8} {naive:>9.4f}s {square:>9.4f}s "
+              f"{naive / square:>7.1f}x {naive_mod:>9.4f}s "
+              f"{square_mod:>10.4f}s {naive_mod / square_mod:>7.1f}x")
+
+
+BENCHMARKS = {
+        'divmod': bench_divmod,
+        'mul': bench_mul,
+        'pow': bench_pow,
+        }
+
+
+def cli():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+            'names', nargs='*', metavar='name',
+            help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument(
+            '-s', '--sizes', type=int, nargs='+', default=[50, 100, 200, 500],
+            help="Operand sizes in trits")
+    parser.add_argument(
+            '-e', '--exponents', type=int, nargs='+',
+            default=[1000, 2000, 5000],
+            help="Exponents for the pow benchmark")
+    parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    random.seed(args.seed)
+    for name in args.names or BENCHMARKS:
+        print(f"{name}: {BENCHMARKS[name].__doc__.splitlines()[0]}")
+        BENCHMARKS[name](args)
+        print()
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    cli()
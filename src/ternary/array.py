@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Arrays of trits
+===============
+
+This module provides TritArray, a container for large batches of trits backed
+by a NumPy array, for when looping over Trits objects one value at a time is
+too slow.
+
+Each element of a TritArray is an int8 holding -1, 0 or +1.  The last axis of
+the array runs across the trits of a sequence, in the same order as a Trits
+object or a '-0+' string, from most significant to least significant.  So a
+batch of one million 12-trit words is a TritArray of shape (1000000, 12).
+
+All of the logical operations follow the same Kleene logic as Trit, and are
+evaluated for every element of the array at once:
+
+  * AND is the minimum of the two inputs,
+  * OR is the maximum of the two inputs,
+  * XOR is the negated product of the two inputs, and
+  * NOT is negation.
+
+NumPy is an optional dependency of this package.  The rest of the package does
+not use this module, and works as normal without NumPy installed.
+"""
+from ternary import integer, trit
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+# The widest word whose integer value is guaranteed to fit in an int64.
+MAX_INT64_WIDTH = 39
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError(
+                "TritArray requires NumPy, which is not installed.")
+
+
+def glyph_table():
+    """Return a 256-entry lookup table from ASCII codes to trit values.
+
+    Characters that are not trit glyphs map to a value of 2, so that they can
+    be detected in the same pass.
+    """
+    table = np.full(256, 2, dtype=np.int8)
+    table[ord(trit.NEG)] = -1
+    table[ord(trit.ZERO)] = 0
+    table[ord(trit.POS)] = 1
+    return table
+
+
+class TritArray(object):
+    """An array of trits, stored as a NumPy int8 array.
+
+    The 'data' argument may be anything that NumPy can convert into an array
+    of integers.  Each value is converted to a trit according to its sign,
+    just like Trit.make() does for numbers.
+    """
+    def __init__(self, data):
+        require_numpy()
+        self.data = np.sign(np.asarray(data)).astype(np.int8)
+
+    @classmethod
+    def wrap(cls, data):
+        """Return a TritArray around 'data' without copying or checking it.
+
+        'data' must already be an int8 array of -1, 0 and +1 values.
+        """
+        result = cls.__new__(cls)
+        result.data = data
+        return result
+
+    @classmethod
+    def from_string(cls, text):
+        """Return a 1-dimensional TritArray from a string of trit glyphs."""
+        require_numpy()
+        raw = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+        values = glyph_table()[raw]
+        if (values == 2).any():
+            index = int(np.argmax(values == 2))
+            raise ValueError(
+                    "Failed to parse {!r} as a trit at offset {}.".format(
+                        text[index], index))
+        return cls.wrap(values)
+
+    @classmethod
+    def from_strings(cls, strings):
+        """Return a 2-dimensional TritArray from equal length glyph strings."""
+        strings = list(strings)
+        width = len(strings[0]) if strings else 0
+        for i, text in enumerate(strings):
+            if len(text) != width:
+                raise ValueError(
+                        "Cannot make a TritArray from strings of unequal "
+                        "length: item {} has length {}, expected {}.".format(
+                            i, len(text), width))
+        flat = cls.from_string(''.join(strings))
+        return cls.wrap(flat.data.reshape(len(strings), width))
+
+    @classmethod
+    def from_trits(cls, trits, length=None):
+        """Return a 1-dimensional TritArray from a Trits sequence."""
+        if not isinstance(trits, trit.Trits):
+            trits = trit.Trits(trits, length)
+        elif length is not None:
+            trits = trit.Trits(trits, length)
+        return cls.from_string(trits.glyphs)
+
+    @classmethod
+    def from_ints(cls, values, width):
+        """Return a TritArray of 'width'-trit words from integer values.
+
+        'values' may be a single integer, or any array-like of integers.  Each
+        integer must be representable in 'width' trits, otherwise a
+        ValueError is raised.
+        """
+        require_numpy()
+        if isinstance(values, integer.Int):
+            values = int(values)
+        limit = (3 ** width) // 2
+        dtype = object if width > MAX_INT64_WIDTH else np.int64
+        values = np.asarray(values, dtype=dtype)
+        # Shift to the unsigned equivalent, and peel off one unsigned digit
+        # at a time for the whole array.
+        unsigned = values.reshape(-1) + limit
+        if np.any((unsigned < 0) | (unsigned > 2 * limit)):
+            raise ValueError(
+                    "Integer values cannot be represented in {} trits".format(
+                        width))
+        result = np.empty((len(unsigned), width), dtype=np.int8)
+        for i in range(width - 1, -1, -1):
+            result[:, i] = (unsigned % 3).astype(np.int8) - 1
+            unsigned = unsigned // 3
+        return cls.wrap(result.reshape(values.shape + (width,)))
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def width(self):
+        """The number of trits in each sequence (the size of the last axis)."""
+        return self.data.shape[-1]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        value = self.data[key]
+        if isinstance(value, np.ndarray):
+            return self.wrap(value)
+        return trit.Trit.make(int(value))
+
+    def __repr__(self):
+        if self.data.ndim == 1:
+            return "{}({!r})".format(self.__class__.__name__, str(self))
+        return "{}({!r})".format(self.__class__.__name__, self.to_strings())
+
+    def __str__(self):
+        return '\n'.join(self.to_strings())
+
+    __hash__ = None
+
+    def __eq__(self, other):
+        """Return whether two TritArrays have identical shape and contents."""
+        if not isinstance(other, TritArray):
+            return NotImplemented
+        return bool(np.array_equal(self.data, other.data))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def to_strings(self):
+        """Return the contents as a list of '-0+' glyph strings.
+
+        Each sequence along the last axis gives one string, so a 1-dimensional
+        array gives a list of one string.
+        """
+        width = self.data.shape[-1] if self.data.ndim else 1
+        rows = self.data.size // width if width else int(
+                np.prod(self.data.shape[:-1]))
+        if width == 0:
+            return [''] * rows
+        data = self.data.reshape(rows, width)
+        glyphs = np.frombuffer(b'-0+', dtype=np.uint8)
+        text = glyphs[data + 1].tobytes().decode('ascii')
+        return [text[i:i + width] for i in range(0, len(text), width)]
+
+    def to_trits(self):
+        """Return a 1-dimensional TritArray as a Trits sequence."""
+        if self.data.ndim != 1:
+            raise ValueError(
+                    "Only a 1-dimensional TritArray can be converted to "
+                    "Trits, but this one has shape {}".format(self.shape))
+        return trit.Trits(self.to_strings()[0])
+
+    def to_int(self):
+        """Return a 1-dimensional TritArray as an Int."""
+        return integer.Int(self.to_trits())
+
+    def to_ints(self):
+        """Return the integer value of each sequence along the last axis.
+
+        Words of up to 39 trits give an int64 array, wider words give an
+        array of Python integers.
+        """
+        if self.width > MAX_INT64_WIDTH:
+            result = np.zeros(self.shape[:-1], dtype=object)
+            for i in range(self.width):
+                result = result * 3 + self.data[..., i].astype(object)
+            return result
+        powers = 3 ** np.arange(self.width - 1, -1, -1, dtype=np.int64)
+        return self.data.astype(np.int64) @ powers
+
+    def operand(self, other):
+        if isinstance(other, TritArray):
+            return other.data
+        if isinstance(other, trit.Trits):
+            return TritArray.from_trits(other).data
+        if isinstance(other, trit.Trit):
+            return np.int8(int(other))
+        return TritArray(other).data
+
+    def __neg__(self):
+        return self.wrap(-self.data)
+
+    def __invert__(self):
+        return -self
+
+    def __pos__(self):
+        return self
+
+    def __and__(self, other):
+        """Return the tritwise AND of two arrays."""
+        return self.wrap(np.minimum(self.data, self.operand(other)))
+
+    def __or__(self, other):
+        """Return the tritwise OR of two arrays."""
+        return self.wrap(np.maximum(self.data, self.operand(other)))
+
+    def __xor__(self, other):
+        """Return the tritwise XOR of two arrays."""
+        return self.wrap(-(self.data * self.operand(other)))
+
+    def __mul__(self, other):
+        """Return the tritwise product of two arrays."""
+        return self.wrap(self.data * self.operand(other))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+    __rmul__ = __mul__
+
+    def add(self, other, carry=None):
+        """Add two arrays of sequences, with an optional carry-in.
+
+        This works just like Trit.add(), but for whole sequences: the trits
+        are added from right to left, passing the carry along each row.
+        'carry' may be a Trit or an array with one trit per sequence.
+
+        Return a 2-tuple of (sum, carry-out), where the sum has the same
+        shape as the operands, and the carry-out has one trit per sequence.
+        """
+        a, b = np.broadcast_arrays(self.data, self.operand(other))
+        if carry is None:
+            carry = np.zeros(a.shape[:-1], dtype=np.int8)
+        else:
+            carry = np.broadcast_to(
+                    self.operand(carry), a.shape[:-1]).astype(np.int8)
+        result = np.empty(a.shape, dtype=np.int8)
+        for i in range(a.shape[-1] - 1, -1, -1):
+            total = a[..., i] + b[..., i] + carry
+            # Map the total (-3 to 3) onto a balanced digit and carry.
+            digit = (total + 1) % 3 - 1
+            carry = (total - digit) // 3
+            result[..., i] = digit
+        return (self.wrap(result), self.wrap(carry.astype(np.int8)))
+
+    def cmp(self, other):
+        """Compare two arrays of sequences by their numeric value.
+
+        Return an int8 array of -1, 0 or 1 for each sequence, according to
+        whether the sequence in this array is less than, equal to, or greater
+        than the corresponding sequence in 'other'.
+        """
+        a, b = np.broadcast_arrays(self.data, self.operand(other))
+        diff = np.sign(a.astype(np.int8) - b)
+        nonzero = diff != 0
+        first = np.argmax(nonzero, axis=-1)
+        result = np.take_along_axis(diff, first[..., None], axis=-1)[..., 0]
+        return result.astype(np.int8)
+
+    def all(self, axis=-1):
+        """Return the Kleene AND of all trits along 'axis'."""
+        return self.wrap(self.data.min(axis=axis))
+
+    def any(self, axis=-1):
+        """Return the Kleene OR of all trits along 'axis'."""
+        return self.wrap(self.data.max(axis=axis))
+
+    def is_zero(self, axis=-1):
+        """Return a boolean array of whether each sequence is all zeroes."""
+        return ~self.data.astype(bool).any(axis=axis)
+
+    def count(self, value, axis=-1):
+        """Return the number of trits equal to 'value' along 'axis'."""
+        value = int(trit.Trit.make(value))
+        return (self.data == value).sum(axis=axis)
@@ -32,39 +32,207 @@ header byte is equal to the number of padding trits that were added, plus 243:
 |    246 | `0xf6` |       3 |
 |    247 | `0xf7` |       4 |
 
+A header byte may also appear part way through the data, in which case it
+applies to the data byte that immediately follows it.  The streaming Encoder
+uses this to pad the final segment when it doesn't know the length of its
+input in advance.
+
+Conversion goes through a pair of 243-entry lookup tables between byte values
+and 5-trit glyph strings, so no Trit or UInt objects are created along the way.
 """
-from ternary import integer, trit
+import re
+from array import array
 
+from ternary import trit, tryte
 
-def encode(source) -> bytes:
-    mod = len(source) % 5
-    padding = 5 - mod if mod else 0
-    header = 243 + padding
-    result = bytearray((header,))
-    data = '-' * padding + source
-    for i in range(0, len(data), 5):
-        value = integer.UInt(data[i:i+5])
-        result.append(int(value))
-    return bytes(result)
 
+SEGMENT_SIZE = 5
+WORD_SIZE = 12
+HEADER = 243
+MAX_HEADER = HEADER + SEGMENT_SIZE - 1
+# The glyphs of every 5-trit segment, indexed by its byte value, and the
+# reverse mapping.
+SEGMENTS = tuple(
+        ''.join(
+            trit.GLYPHS[x // 3 ** i % 3]
+            for i in range(SEGMENT_SIZE - 1, -1, -1))
+        for x in range(HEADER))
+SEGMENT_BYTES = {glyphs: x for x, glyphs in enumerate(SEGMENTS)}
+INVALID_BYTES = bytes(range(MAX_HEADER + 1))
+HEADER_PATTERN = re.compile(
+        b'[' + re.escape(bytes(range(HEADER, MAX_HEADER + 1))) + b']')
 
-def decode(source) -> trit.Trits:
-    result = []
-    binary = bytearray(source)
 
-    length = 5
-    for i in range(len(binary)):
-        value = binary[i]
-        if value > 247:
-            raise ValueError(
-                    "Invalid byte at position {}: {:#02x}".format(i, value))
+def encode(source) -> bytes:
+    """Encode a string of trit glyphs, or a Trits sequence, as bytes."""
+    encoder = Encoder(len(source))
+    return encoder.encode(source) + encoder.finish()
 
-        if value > 242:
-            # Header byte, remove padding from next byte
-            length = 5 - (value - 243)
-            continue
 
-        result.extend(integer.UInt(value, length))
-        # Reset the length
-        length = 5
-    return trit.Trits(result)
+def decode(source) -> trit.Trits:
+    """Decode bytes into a Trits sequence."""
+    return trit.Trits.from_glyphs(decode_glyphs(source))
+
+
+def decode_glyphs(source) -> str:
+    """Decode bytes into a string of trit glyphs."""
+    return Decoder().decode(source)
+
+
+def decode_words(source, width=WORD_SIZE) -> list[str]:
+    """Decode bytes straight into a list of 'width'-trit glyph strings.
+
+    The decoded data must divide evenly into words, otherwise a ValueError is
+    raised.
+    """
+    glyphs = decode_glyphs(source)
+    length = len(glyphs)
+    if length % width != 0:
+        raise ValueError(
+                "Invalid length for binary-encoded words: expected a "
+                "multiple of {} but got {}".format(width, length))
+    return [glyphs[i:i + width] for i in range(0, length, width)]
+
+
+def decode_ints(source, width=WORD_SIZE) -> array:
+    """Decode bytes straight into an array of signed 'width'-trit integers.
+
+    Words of up to 20 trits give an array of type 'i', and words of up to 40
+    trits an array of type 'q'.
+    """
+    half = 3 ** width // 2
+    if half < 2 ** 31:
+        typecode = 'i'
+    elif half < 2 ** 63:
+        typecode = 'q'
+    else:
+        raise ValueError(
+                "Cannot decode {}-trit words into an array, the maximum "
+                "width is 40 trits".format(width))
+    digits = ''.join(decode_words(source, width)).translate(
+            tryte.GLYPH_DIGITS)
+    return array(typecode, [
+            int(digits[i:i + width], 3) - half
+            for i in range(0, len(digits), width)])
+
+
+def iterencode(chunks, length=None):
+    """Encode an iterable of trit strings, yielding bytes as we go.
+
+    'length' is the total number of trits, if known in advance.  See
+    Encoder.
+    """
+    encoder = Encoder(length)
+    for chunk in chunks:
+        result = encoder.encode(chunk)
+        if result:
+            yield result
+    yield encoder.finish()
+
+
+def iterdecode(chunks):
+    """Decode an iterable of bytes, yielding strings of trit glyphs."""
+    decoder = Decoder()
+    for chunk in chunks:
+        result = decoder.decode(chunk)
+        if result:
+            yield result
+
+
+def encode_segments(glyphs) -> bytes:
+    """Return the data bytes of a string of complete 5-trit segments."""
+    return bytes(map(
+            SEGMENT_BYTES.__getitem__,
+            (
+                glyphs[i:i + SEGMENT_SIZE]
+                for i in range(0, len(glyphs), SEGMENT_SIZE))))
+
+
+class Encoder(object):
+    """Incremental encoder of trit strings into bytes.
+
+    Feed the trits in with encode(), in chunks of any size, and then call
+    finish() to get the last of the output.  Only an incomplete segment of up
+    to four trits is held between calls.
+
+    If 'length', the total number of trits, is given up front, the output is
+    identical to encode() on the whole input: the padding goes in front of
+    the first segment.  Otherwise, the padding goes in front of the final
+    segment, with a header byte just before it.  Either way, decode() gives
+    back exactly the trits that went in.
+    """
+    def __init__(self, length=None):
+        padding = 0
+        if length is not None:
+            padding = -length % SEGMENT_SIZE
+        self.header = bytes((HEADER + padding,))
+        self.pending = trit.NEG * padding
+
+    def encode(self, chunk) -> bytes:
+        """Encode a chunk of trits, and return any complete output bytes."""
+        if isinstance(chunk, trit.Trits):
+            chunk = chunk.glyphs
+        data = self.pending + chunk
+        end = len(data) - len(data) % SEGMENT_SIZE
+        try:
+            result = encode_segments(data[:end])
+        except KeyError:
+            # Not plain glyphs, so parse the chunk the slow way and retry.
+            data = self.pending + trit.Trits(chunk).glyphs
+            result = encode_segments(data[:end])
+        self.pending = data[end:]
+        if self.header:
+            result = self.header + result
+            self.header = b''
+        return result
+
+    def finish(self) -> bytes:
+        """Return the remaining output bytes, including any padding."""
+        result = self.encode('')
+        if self.pending:
+            padding = SEGMENT_SIZE - len(self.pending)
+            segment = trit.NEG * padding + self.pending
+            result += bytes((HEADER + padding, SEGMENT_BYTES[segment]))
+            self.pending = ''
+        return result
+
+
+class Decoder(object):
+    """Incremental decoder of bytes into trit strings.
+
+    Feed the bytes in with decode(), in chunks of any size.  A header byte at
+    the end of one chunk applies to the first byte of the next.
+    """
+    def __init__(self):
+        self.length = SEGMENT_SIZE
+        self.offset = 0
+
+    def decode(self, data) -> str:
+        """Decode a chunk of bytes, and return the trits as a string."""
+        data = bytes(data)
+        invalid = data.translate(None, INVALID_BYTES)
+        if invalid:
+            index = data.index(invalid[0])
+            raise ValueError(
+                    "Invalid byte at position {}: {:#02x}".format(
+                        self.offset + index, invalid[0]))
+        pieces = []
+        start = 0
+        for match in HEADER_PATTERN.finditer(data):
+            self.decode_run(data[start:match.start()], pieces)
+            self.length = SEGMENT_SIZE - (data[match.start()] - HEADER)
+            start = match.end()
+        self.decode_run(data[start:], pieces)
+        self.offset += len(data)
+        return ''.join(pieces)
+
+    def decode_run(self, data, pieces):
+        """Decode a run of data bytes with no headers in it."""
+        if not data:
+            return
+        if self.length != SEGMENT_SIZE:
+            # Remove the padding from the first byte after a header.
+            pieces.append(SEGMENTS[data[0]][SEGMENT_SIZE - self.length:])
+            data = data[1:]
+            self.length = SEGMENT_SIZE
+        pieces.append(''.join(map(SEGMENTS.__getitem__, data)))
@@ -53,7 +53,11 @@ UTF-6t has most of the features of UTF-8: it uses only one tryte with a leading
 negative to represent the whole ASCII character set, and therefore all valid
 ASCII sequences using 6 unsigned trits per character are valid UTF-6t sequences
 with equivalent meaning.  UTF-6t is self-synchronising, and a tritwise sort
-will yield values in their code point order.
+will yield values in their code point order, as long as the characters being
+compared have the same number of trytes.  Across different numbers of trytes
+it does not: the two-tryte U+E6A8 is '++++++-+++++', which sorts after the
+three-tryte U+E6A9 '+----00-----------'.  Use sort_key() to get a key that
+sorts in code point order regardless.
 
 The main difference between UTF-6t and UTF-8 is that the first byte of a UTF-8
 sequence indicates the number of bytes remaining in the value, allowing a
@@ -64,11 +68,204 @@ example, if an entire continuation tryte were missing from a multi-tryte value,
 it would appear to be a correct (but very different) value.  On the other hand,
 UTF-8 cannot represent a code point with more than 31 bits, whereas UTF-6t can
 be extended indefinitely by simply adding more continuation trytes.
+
+Codec
+-----
+
+Importing this module registers a Python codec named 'utf-6t', which encodes
+text as UTF-6t trits written out as ASCII glyphs, one byte per trit.  So, for
+example, once this module is imported:
+
+    >>> 'hi'.encode('utf-6t')
+    b'-0-+0+-0-++-'
+    >>> with open(path, 'w', encoding='utf-6t') as f:
+    ...     f.write(text)
+
+Both directions are table driven: every code point below 243 has its tryte
+looked up directly, and larger code points are cached as they are seen.  The
+module can also be run as a script (or via the 'utf6t' command) to transcode
+files to and from UTF-6t in constant memory.
 """
-from __future__ import division
+import argparse
+import codecs
 import numbers
+import re
+import sys
+from array import array
+from itertools import accumulate
+from traceback import print_exc
+
+from ternary import trit, tryte
+
+
+INITIAL = trit.POS
+CONTINUE = trit.ZERO
+FINAL = trit.NEG
+DATA_SIZE = 5
+TRYTE_SIZE = 6
+DATA_RANGE = 3 ** DATA_SIZE
+# The glyphs of every group of five data trits, indexed by its unsigned value.
+DATA = tuple(tryte.GLYPHS[x][1:] for x in range(DATA_RANGE))
+# A valid UTF-6t code point: either a single final tryte, or an initial tryte,
+# any number of continuation trytes, and a final tryte.
+CODE_POINT = re.compile(
+        r'-[-0+]{5}|\+[-0+]{5}(?:0[-0+]{5})*-[-0+]{5}')
+VALID = re.compile('(?:{})*'.format(CODE_POINT.pattern))
+# Bytes (or characters) handled at a time when streaming.
+CHUNK_SIZE = 1 << 16
+
+
+class EncodeTable(dict):
+    """Map code points to their UTF-6t glyphs, for use with str.translate().
+
+    Code points which need more than one tryte are worked out the first time
+    they are looked up, and then cached.
+    """
+    def __missing__(self, code):
+        groups = []
+        value = code
+        while True:
+            value, group = divmod(value, DATA_RANGE)
+            groups.append(DATA[group])
+            if not value:
+                break
+        groups.reverse()
+        leads = [INITIAL] + [CONTINUE] * (len(groups) - 2) + [FINAL]
+        result = ''.join(lead + data for lead, data in zip(leads, groups))
+        self[code] = result
+        return result
+
+
+ENCODE = EncodeTable(
+        (x, FINAL + data) for x, data in enumerate(DATA))
+DECODE = {FINAL + data: chr(x) for x, data in enumerate(DATA)}
+DATA_BYTES = {data: x for x, data in enumerate(DATA)}
+# The lead trits of a character of more than one tryte.
+MULTI_LEADS = re.compile(r'\+0*-')
+# In a sort key, a character of n trytes (n > 1) is marked by the byte
+# KEY_MARKER + n - 2, which leaves room for characters of up to 14 trytes.
+KEY_MARKER = DATA_RANGE
+MAX_KEY_TRYTES = 255 - KEY_MARKER + 2
+
+
+def encode_glyphs(text):
+    """Return 'text' encoded in UTF-6t, as a string of trit glyphs."""
+    return text.translate(ENCODE)
+
+
+def decode_glyphs(glyphs):
+    """Return the text from a string of UTF-6t encoded trit glyphs.
+
+    If 'glyphs' is not a valid UTF-6t sequence, raise a ValueError.
+    """
+    length = len(glyphs)
+    if length % TRYTE_SIZE != 0:
+        raise ValueError(
+                "Cannot decode sequence of length {} as UTF-6t: "
+                "must be a multiple of {}.".format(length, TRYTE_SIZE))
+    if not glyphs[::TRYTE_SIZE].strip(FINAL):
+        # Every tryte is a final tryte, so every character is a single tryte,
+        # which covers all of ASCII.
+        try:
+            return ''.join(map(DECODE.__getitem__, [
+                    glyphs[i:i + TRYTE_SIZE]
+                    for i in range(0, length, TRYTE_SIZE)]))
+        except KeyError:
+            pass
+    pieces = []
+    position = 0
+    for match in CODE_POINT.finditer(glyphs):
+        if match.start() != position:
+            break
+        code = match.group()
+        char = DECODE.get(code)
+        if char is None:
+            data = ''.join(
+                    code[i + 1:i + TRYTE_SIZE]
+                    for i in range(0, len(code), TRYTE_SIZE))
+            char = chr(int(data.translate(tryte.GLYPH_DIGITS), 3))
+        pieces.append(char)
+        position = match.end()
+    if position != length:
+        raise_invalid(glyphs, position)
+    return ''.join(pieces)
+
+
+def sort_key(source):
+    """Return a bytes key that sorts UTF-6t sequences in code point order.
+
+    'source' may be a UTF6t (or other Trits), or a string of UTF-6t glyphs,
+    which must be valid.  Comparing two keys gives the same result as
+    comparing the decoded strings, including a string sorting before any
+    longer string it is a prefix of, but without decoding either.
+
+    Each tryte contributes the byte value of its five data trits.  A
+    character of more than one tryte is preceded by a marker byte that is
+    greater than any data byte, and grows with the number of trytes, so that
+    longer characters sort after shorter ones.  The key for ASCII text is the
+    same as its ASCII encoding.
+    """
+    if isinstance(source, trit.Trits):
+        source = source.glyphs
+    try:
+        values = bytes(map(DATA_BYTES.__getitem__, [
+                source[i + 1:i + TRYTE_SIZE]
+                for i in range(0, len(source), TRYTE_SIZE)]))
+    except KeyError:
+        raise ValueError(
+                "Cannot make a sort key from invalid UTF-6t.") from None
+    pieces = []
+    position = 0
+    for match in MULTI_LEADS.finditer(source[::TRYTE_SIZE]):
+        start, end = match.span()
+        count = end - start
+        if count > MAX_KEY_TRYTES:
+            raise ValueError(
+                    "Cannot make a sort key for a character of {} trytes, "
+                    "the maximum is {}.".format(count, MAX_KEY_TRYTES))
+        pieces.append(values[position:start])
+        pieces.append(bytes((KEY_MARKER + count - 2,)))
+        pieces.append(values[start:end])
+        position = end
+    pieces.append(values[position:])
+    return b''.join(pieces)
+
+
+def raise_invalid(glyphs, position):
+    """Raise a ValueError describing the invalid UTF-6t at 'position'."""
+    lead = glyphs[position]
+    if lead == CONTINUE:
+        raise ValueError(
+                "Invalid UTF-6t sequence: unexpected continuation "
+                "tryte at offset {}.".format(position))
+    if lead == INITIAL:
+        end = position + TRYTE_SIZE
+        while end < len(glyphs) and glyphs[end] == CONTINUE:
+            end += TRYTE_SIZE
+        if end >= len(glyphs):
+            raise ValueError(
+                    "Invalid UTF-6t sequence: unterminated multi-tryte "
+                    "character at end of sequence.")
+        if glyphs[end] == INITIAL:
+            raise ValueError(
+                    "Invalid UTF-6t sequence: unexpected initial "
+                    "tryte at offset {}.".format(end))
+    for i in range(position, len(glyphs)):
+        if glyphs[i] not in trit.GLYPHS:
+            raise ValueError(
+                    "Invalid UTF-6t sequence: {!r} is not a trit at offset "
+                    "{}.".format(glyphs[i], i))
+    raise ValueError(
+            "Invalid UTF-6t sequence at offset {}.".format(position))
+
 
-from ternary import integer, trit
+def complete_length(glyphs):
+    """Return the length of the complete characters at the start of 'glyphs'.
+
+    That is, the position just after the last final tryte.
+    """
+    length = len(glyphs) - len(glyphs) % TRYTE_SIZE
+    return (glyphs[:length:TRYTE_SIZE].rfind(FINAL) + 1) * TRYTE_SIZE
 
 
 class UTF6t(trit.Trits):
@@ -87,27 +284,142 @@ class UTF6t(trit.Trits):
     UTF6t('!')
 
     If the argument is not a string, we run the parent initialiser as normal
-    and then decode the resulting trit sequence to ensure that it is valid
-    UTF-6t.
+    and then check that the resulting trit sequence is valid UTF-6t.  The text
+    itself is only decoded when it is first needed, and the 'chars' view
+    gives access to individual characters without decoding the rest.
     """
-    INITIAL = trit.POS
-    CONTINUE = trit.ZERO
-    FINAL = trit.NEG
+    INITIAL = INITIAL
+    CONTINUE = CONTINUE
+    FINAL = FINAL
     LEAD_SIZE = 1
-    DATA_SIZE = 5
-    TRYTE_SIZE = 6
+    DATA_SIZE = DATA_SIZE
+    TRYTE_SIZE = TRYTE_SIZE
 
     def __init__(self, trits, length=None):
-        try:
-            strtype = basestring
-        except NameError:
-            strtype = str
-        if isinstance(trits, strtype):
-            super(UTF6t, self).__init__(self.encode(trits), length)
-            self.string = trits
+        self._string = None
+        self._index = None
+        self._key = None
+        if isinstance(trits, str):
+            encoded = trit.Trits.from_glyphs(encode_glyphs(trits))
+            super(UTF6t, self).__init__(encoded, length)
+            self._string = trits
         else:
             super(UTF6t, self).__init__(trits, length)
-            self.string = self.decode(self.trits)
+            self.validate()
+
+    @classmethod
+    def from_glyphs(cls, glyphs, length=None):
+        """Return a UTF6t from a string of trit glyphs, without validating it.
+
+        This is for large sequences that are already known to be valid, or
+        that will only ever be read in small windows.  Any invalid UTF-6t will
+        be reported when the affected characters are decoded, or when
+        validate() is called.
+        """
+        result = cls.__new__(cls)
+        result._string = None
+        result._index = None
+        result._key = None
+        trit.Trits.__init__(result, trit.Trits.from_glyphs(glyphs), length)
+        return result
+
+    @classmethod
+    def from_planes(cls, pos, neg, length):
+        """Return a UTF6t from packed bit planes, without validating it.
+
+        As with from_glyphs(), the sequence is assumed to be valid.  This is
+        also how a pickled UTF6t is restored.
+        """
+        return cls.from_glyphs(
+                trit.Trits.from_planes(pos, neg, length).glyphs)
+
+    @property
+    def string(self):
+        """The decoded text of this sequence."""
+        if self._string is None:
+            self._string = decode_glyphs(self.glyphs)
+        return self._string
+
+    @property
+    def char_offsets(self):
+        """The trit offset at which each character starts.
+
+        There is one more offset than there are characters, the last being
+        just past the end of the final character.  The offsets are found from
+        the lead trits alone, which is possible because UTF-6t is
+        self-synchronising: every character ends with a final tryte.
+        """
+        if self._index is None:
+            leads = self.glyphs[::TRYTE_SIZE]
+            if not leads.strip(FINAL):
+                # Every character is a single tryte.
+                self._index = range(0, len(leads) * TRYTE_SIZE + 1, TRYTE_SIZE)
+            else:
+                # Splitting on the final leads gives the leads before the final
+                # tryte of each character.  Anything after the last final
+                # tryte isn't a complete character.
+                parts = leads.split(FINAL)
+                parts.pop()
+                offsets = array('q', [0])
+                offsets.extend(accumulate(
+                        (len(part) + 1) * TRYTE_SIZE for part in parts))
+                self._index = offsets
+        return self._index
+
+    def sort_key(self):
+        """Return a bytes key that sorts in code point order."""
+        if self._key is None:
+            self._key = sort_key(self.glyphs)
+        return self._key
+
+    def cmp(self, other):
+        """Compare two UTF6t sequences as strings, in code point order.
+
+        Unlike comparing Trits, a sequence that is a prefix of another sorts
+        before it.  Comparison with other kinds of trit sequence works as it
+        does for Trits.
+        """
+        if not isinstance(other, UTF6t):
+            return super(UTF6t, self).cmp(other)
+        a = self.sort_key()
+        b = other.sort_key()
+        return (a > b) - (a < b)
+
+    @property
+    def chars(self):
+        """A sequence view of the characters, which decodes on demand."""
+        return CharView(self)
+
+    def char_span(self, start=0, stop=None):
+        """Return the trit offsets (start, stop) of a range of characters.
+
+        'start' and 'stop' are character positions, with the same meaning as
+        in a slice.
+        """
+        offsets = self.char_offsets
+        start, stop, _ = slice(start, stop).indices(len(offsets) - 1)
+        stop = max(start, stop)
+        return (offsets[start], offsets[stop])
+
+    def window(self, start=0, stop=None):
+        """Return a range of characters as a new UTF6t, without decoding."""
+        begin, end = self.char_span(start, stop)
+        return UTF6t.from_glyphs(self.glyphs[begin:end])
+
+    def validate(self, start=0, stop=None):
+        """Check that a range of characters is valid UTF-6t.
+
+        With no arguments, check the whole sequence.  Raise a ValueError if
+        it is invalid.
+        """
+        glyphs = self.glyphs
+        if start == 0 and stop is None:
+            begin, end = 0, len(glyphs)
+        else:
+            begin, end = self.char_span(start, stop)
+        if not VALID.fullmatch(glyphs, begin, end):
+            # Decoding gives the most helpful description of the problem.
+            decode_glyphs(glyphs[begin:end])
 
     @classmethod
     def encode(cls, chars):
@@ -116,25 +428,12 @@ class UTF6t(trit.Trits):
         'chars' must be iterable, and its elements may be standard string
         characters, unicode characters, or integer code points.
         """
-        trits = []
-        for char in chars:
-            if isinstance(char, numbers.Integral):
-                code = char
-            else:
-                code = ord(char)
-            uint = list(integer.UInt(code))
-            padding = (cls.DATA_SIZE - len(uint)) % cls.DATA_SIZE
-            uint = ([trit.NEG] * padding) + uint
-            length = len(uint)
-            for i in range(0, length, cls.DATA_SIZE):
-                if i == length - cls.DATA_SIZE:
-                    lead = cls.FINAL
-                elif i == 0:
-                    lead = cls.INITIAL
-                else:
-                    lead = cls.CONTINUE
-                trits.extend([lead] + uint[i:i + cls.DATA_SIZE])
-        return cls(trits)
+        if not isinstance(chars, str):
+            chars = ''.join(
+                    chr(char) if isinstance(char, numbers.Integral)
+                    else chr(ord(char))
+                    for char in chars)
+        return cls(chars)
 
     @classmethod
     def decode(cls, trits):
@@ -146,41 +445,169 @@ class UTF6t(trit.Trits):
 
         If 'trits' is not a valid UTF-6t encoded sequence, raise a ValueError.
         """
-        result = u''
-        if len(trits) == 0:
-            return result
-        elif len(trits) % cls.TRYTE_SIZE != 0:
-            raise ValueError(
-                    "Cannot decode sequence of length {} as UTF-6t: "
-                    "must be a multiple of {}.".format(
-                        len(trits), cls.TRYTE_SIZE))
-        code = []
-        for i in range(0, len(trits), cls.TRYTE_SIZE):
-            t = trits[i]
-            if not isinstance(t, trit.Trit):
-                t = trit.Trit.make(t)
-            lead = str(t)
-            data = list(trits[i + cls.LEAD_SIZE:i + cls.TRYTE_SIZE])
-            if lead == cls.FINAL:
-                point = int(integer.UInt(code + data))
-                try:
-                    char = unichr(point)
-                except NameError:
-                    char = chr(point)
-                result += char
-                code = []
-            else:
-                if lead == cls.CONTINUE and len(code) == 0:
-                    raise ValueError(
-                            "Invalid UTF-6t sequence: unexpected continuation "
-                            "tryte at offset {}.".format(i))
-                if lead == cls.INITIAL and len(code) != 0:
-                    raise ValueError(
-                            "Invalid UTF-6t sequence: unexpected initial "
-                            "tryte at offset {}.".format(i))
-                code += data
-        if len(code) != 0:
-            raise ValueError(
-                    "Invalid UTF-6t sequence: unterminated multi-tryte "
-                    "character at end of sequence.")
-        return result
+        if not isinstance(trits, trit.Trits):
+            trits = trit.Trits(trits)
+        return decode_glyphs(trits.glyphs)
+
+
+class CharView(object):
+    """The characters of a UTF6t, indexed by code point.
+
+    Indexing gives a one character string, and slicing gives a string.  Only
+    the characters asked for are decoded.
+    """
+    def __init__(self, utf):
+        self.utf = utf
+
+    def __len__(self):
+        return len(self.utf.char_offsets) - 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self.decode(start, stop)
+            return ''.join(self[i] for i in range(start, stop, step))
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("UTF6t character index out of range.")
+        return self.decode(key, key + 1)
+
+    def __iter__(self):
+        for start in range(0, len(self), CHUNK_SIZE):
+            yield from self.decode(start, start + CHUNK_SIZE)
+
+    def decode(self, start, stop):
+        utf = self.utf
+        if utf._string is not None:
+            return utf._string[start:stop]
+        begin, end = utf.char_span(start, stop)
+        return decode_glyphs(utf.glyphs[begin:end])
+
+
+def check_errors(errors):
+    if errors != 'strict':
+        raise ValueError(
+                "The UTF-6t codec does not support the {!r} error "
+                "handler.".format(errors))
+
+
+def codec_encode(text, errors='strict'):
+    check_errors(errors)
+    return (encode_glyphs(text).encode('ascii'), len(text))
+
+
+def codec_decode(data, errors='strict', final=True):
+    """Decode bytes of UTF-6t glyphs, returning (text, bytes consumed).
+
+    Unless 'final' is set, stop after the last complete character, and leave
+    the rest for later.
+    """
+    check_errors(errors)
+    glyphs = bytes(data).decode('ascii')
+    length = len(glyphs) if final else complete_length(glyphs)
+    return (decode_glyphs(glyphs[:length]), length)
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(self, input, final=False):
+        return codec_encode(input, self.errors)[0]
+
+
+class IncrementalDecoder(codecs.BufferedIncrementalDecoder):
+    def _buffer_decode(self, input, errors, final):
+        return codec_decode(input, errors, final)
+
+
+class StreamWriter(codecs.StreamWriter):
+    def encode(self, input, errors='strict'):
+        return codec_encode(input, errors)
+
+
+class StreamReader(codecs.StreamReader):
+    def decode(self, input, errors='strict'):
+        return codec_decode(input, errors, False)
+
+
+CODEC = codecs.CodecInfo(
+        name='utf-6t',
+        encode=codec_encode,
+        decode=codec_decode,
+        incrementalencoder=IncrementalEncoder,
+        incrementaldecoder=IncrementalDecoder,
+        streamwriter=StreamWriter,
+        streamreader=StreamReader)
+
+
+def search_codec(name):
+    if name.replace('-', '_') in ('utf_6t', 'utf6t'):
+        return CODEC
+    return None
+
+
+codecs.register(search_codec)
+
+
+def transcode(source, target, from_encoding, to_encoding):
+    """Copy binary stream 'source' to 'target', changing its encoding.
+
+    Data is read and written a chunk at a time, so memory use does not
+    depend on the size of the input.
+    """
+    decoder = codecs.getincrementaldecoder(from_encoding)()
+    encoder = codecs.getincrementalencoder(to_encoding)()
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        target.write(encoder.encode(decoder.decode(chunk)))
+    target.write(encoder.encode(decoder.decode(b'', True), True))
+
+
+def open_binary(path, mode):
+    if path == '-':
+        return (sys.stdin if 'r' in mode else sys.stdout).buffer
+    return open(path, mode)
+
+
+def main(direction, input_path, output_path, encoding):
+    if direction == 'encode':
+        encodings = (encoding, 'utf-6t')
+    else:
+        encodings = ('utf-6t', encoding)
+    source = open_binary(input_path, 'rb')
+    target = open_binary(output_path, 'wb')
+    try:
+        transcode(source, target, *encodings)
+    finally:
+        if input_path != '-':
+            source.close()
+        if output_path != '-':
+            target.close()
+    return True
+
+
+def cli():
+    parser = argparse.ArgumentParser(
+            description="Transcode text files to or from UTF-6t.")
+    parser.add_argument('direction', choices=('encode', 'decode'))
+    parser.add_argument('input_path', nargs='?', default='-')
+    parser.add_argument('output_path', nargs='?', default='-')
+    parser.add_argument(
+            '-e', '--encoding', default='utf-8',
+            help="The encoding of the plain text side (default: utf-8)")
+
+    args = parser.parse_args()
+    success = False
+    try:
+        success = main(**vars(args))
+    except Exception:
+        print_exc()
+        sys.exit(1)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    cli()
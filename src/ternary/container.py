@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Seekable trit containers
+========================
+
+The plain binary format from ternary.binary has to be decoded from the start
+to find any given trit.  This module provides a container format for large
+trit datasets, which splits the trits into fixed-size chunks and keeps an
+index of where each chunk starts, so that any range of trits can be read by
+decoding only the chunks that it touches.
+
+A container file is laid out as:
+
+| section | size          | contents                                       |
+| ----    | ----          | ----                                           |
+| header  | 12 bytes      | magic 'BTRC', version, chunk size in trits     |
+| chunks  | variable      | each chunk in the ternary.binary format        |
+| index   | 8 bytes each  | file offset of every chunk, plus the index     |
+| footer  | 28 bytes      | index offset, chunk count, length in trits,    |
+|         |               | magic 'BTRC'                                   |
+
+All integers are unsigned and little-endian.  The chunk size is a multiple of
+five trits, so only the final chunk can need any padding.
+
+Write a container with Writer, or the write() function, and read it back with
+Reader, which maps the file into memory rather than loading it.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from ternary import binary, trit
+
+
+MAGIC = b'BTRC'
+VERSION = 1
+# Trits per chunk, by default.  This gives 8 KiB of data per chunk.
+CHUNK_SIZE = 40960
+HEADER = struct.Struct('<4sB3xI')
+FOOTER = struct.Struct('<QQQ4s')
+
+
+def write(path, trits, chunk_size=CHUNK_SIZE):
+    """Write a string of trit glyphs, or a Trits sequence, to a container."""
+    with open(path, 'wb') as stream:
+        with Writer(stream, chunk_size) as writer:
+            writer.write(trits)
+
+
+class Writer(object):
+    """Write trits to a container file, a chunk at a time.
+
+    'stream' must be a binary file object open for writing.  Trits are passed
+    in with write(), in pieces of any size, and close() writes out the final
+    chunk, the index and the footer.  The stream itself is left open.
+    """
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        if chunk_size <= 0 or chunk_size % binary.SEGMENT_SIZE != 0:
+            raise ValueError(
+                    "Invalid chunk size {!r}; chunk size must be a positive "
+                    "multiple of {}.".format(
+                        chunk_size, binary.SEGMENT_SIZE))
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.start = stream.tell()
+        self.offsets = array('Q')
+        self.length = 0
+        self.pending = ''
+        self.closed = False
+        stream.write(HEADER.pack(MAGIC, VERSION, chunk_size))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, trits):
+        """Add a string of trit glyphs, or a Trits sequence."""
+        if isinstance(trits, trit.Trits):
+            trits = trits.glyphs
+        self.pending += trits
+        size = self.chunk_size
+        end = len(self.pending) - len(self.pending) % size
+        for i in range(0, end, size):
+            self.write_chunk(self.pending[i:i + size])
+        self.pending = self.pending[end:]
+
+    def write_chunk(self, glyphs):
+        self.offsets.append(self.stream.tell() - self.start)
+        self.stream.write(binary.encode(glyphs))
+        self.length += len(glyphs)
+
+    def close(self):
+        """Write the last chunk, the index and the footer."""
+        if self.closed:
+            return
+        if self.pending:
+            self.write_chunk(self.pending)
+            self.pending = ''
+        index_offset = self.stream.tell() - self.start
+        offsets = array('Q', self.offsets)
+        offsets.append(index_offset)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        self.stream.write(offsets.tobytes())
+        self.stream.write(FOOTER.pack(
+                index_offset, len(self.offsets), self.length, MAGIC))
+        self.closed = True
+
+
+class Reader(object):
+    """Random access to the trits in a container file.
+
+    'source' may be a path, or a binary file object that has a real file
+    descriptor.  The file is memory-mapped, and chunks are only decoded when
+    a read touches them.
+
+    A Reader can be indexed and sliced like a Trits sequence: an index gives
+    a Trit, and a slice gives a Trits.  Use read() to get a string of glyphs
+    instead.
+    """
+    def __init__(self, source):
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self.file = open(source, 'rb')
+            self.owned = True
+        else:
+            self.file = source
+            self.owned = False
+        self.map = None
+        try:
+            self.map = mmap.mmap(
+                    self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.read_index()
+        except ValueError:
+            self.close()
+            raise
+
+    def read_index(self):
+        """Check the header and footer, and load the index of chunks."""
+        size = len(self.map)
+        if size < HEADER.size + FOOTER.size:
+            raise ValueError("File is too short to be a trit container.")
+
+        magic, version, self.chunk_size = HEADER.unpack_from(self.map, 0)
+        index_offset, count, self.length, end_magic = FOOTER.unpack_from(
+                self.map, size - FOOTER.size)
+        if magic != MAGIC or end_magic != MAGIC:
+            raise ValueError("File is not a trit container.")
+        if version != VERSION:
+            raise ValueError(
+                    "Unsupported trit container version {}.".format(version))
+        self.offsets = array('Q')
+        index_end = index_offset + self.offsets.itemsize * (count + 1)
+        if index_end != size - FOOTER.size:
+            raise ValueError("Trit container index is corrupt.")
+        self.offsets.frombytes(self.map[index_offset:index_end])
+        if sys.byteorder != 'little':
+            self.offsets.byteswap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        if self.owned:
+            self.file.close()
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def chunk_count(self):
+        return len(self.offsets) - 1
+
+    def chunk(self, index):
+        """Return the glyphs of one chunk, by its position in the index."""
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return binary.decode_glyphs(self.map[start:end])
+
+    def read(self, start=0, stop=None):
+        """Return the trits from 'start' up to 'stop' as a string of glyphs.
+
+        As with slicing, the range is clipped to the length of the container,
+        and negative positions count back from the end.
+        """
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return ''
+        first = start // self.chunk_size
+        last = (stop - 1) // self.chunk_size
+        glyphs = ''.join(self.chunk(i) for i in range(first, last + 1))
+        offset = first * self.chunk_size
+        return glyphs[start - offset:stop - offset]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            indices = range(*key.indices(self.length))
+            if not indices:
+                return trit.Trits.from_glyphs('')
+            # Read the whole span covered by the slice, then step through it.
+            low = min(indices)
+            glyphs = self.read(low, max(indices) + 1)
+            end = indices.stop - low
+            return trit.Trits.from_glyphs(glyphs[
+                    indices.start - low:end if end >= 0 else None:
+                    indices.step])
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("Trit container index out of range.")
+        return trit.Trit(self.read(key, key + 1))
+
+    def iterchunks(self):
+        """Yield the glyphs of each chunk in turn."""
+        for i in range(self.chunk_count):
+            yield self.chunk(i)
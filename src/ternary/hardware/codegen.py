@@ -0,0 +1,280 @@
+"""Straight-line Python code for hardware netlists.
+
+The netlist Evaluator still calls a method for every gate, on every clock
+cycle.  This module instead turns a Netlist into Python source code, with one
+function for each run of gates between opaque nodes.  Every gate in a
+function becomes a single lookup in the gate's truth table, held in a local
+variable:
+
+    def cone1(values):
+        w12 = values[12]
+        w30 = values[30]
+        w1041 = NAND[w12][w30]
+        values[1042] = w1042 = NOT[w1041]
+        ...
+
+Gates whose inputs are all constant are worked out once, when the code is
+generated, and wires are only written back to the list of values when
+something outside the function reads them.
+
+Compiling the source takes a noticeable moment for a whole Computer, so the
+compiled code is cached on disk, keyed by a hash of the netlist, and reused
+as long as the component definitions don't change.  The cache lives in the
+directory named by the BTERN_CACHE_DIR environment variable, or else in
+'btern' under the user's cache directory.
+"""
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+
+from ternary.hardware.netlist import Evaluator, GateNode, Netlist
+from ternary.hardware.util import Trits
+
+
+# Change this whenever the generated code changes, so that the cache doesn't
+# hand back code in an old form.
+FORMAT = 1
+
+
+def get_cache_dir() -> str:
+    """Return the default directory for cached code."""
+    path = os.environ.get('BTERN_CACHE_DIR')
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'btern')
+
+
+def nest(table: dict) -> dict:
+    """Turn a truth table keyed by tuples of inputs into nested dicts.
+
+    The result is indexed by one input at a time, like NAND[a][b], which
+    needs no tuple to be built for each lookup.
+    """
+    result = {}
+    for key, value in table.items():
+        level = result
+        for glyph in key[:-1]:
+            level = level.setdefault(glyph, {})
+        level[key[-1]] = value
+    return result
+
+
+def describe(netlist: Netlist) -> str:
+    """Return a description of everything in a netlist that the code uses.
+
+    Two netlists with the same description generate the same code, so a hash
+    of the description is the key for the cache.
+    """
+    lines = [
+            f'format {FORMAT} {sys.implementation.cache_tag}',
+            f'inputs {netlist.inputs}',
+            f'outputs {netlist.outputs}',
+            f'constants {sorted(netlist.constants.items())}',
+            ]
+    for node in netlist.nodes:
+        if isinstance(node, GateNode):
+            lines.append(
+                    f'gate {node.operator.glyphs} {node.inputs} '
+                    f'{node.output}')
+        else:
+            lines.append(
+                    f'block {node.inputs} {node.outputs} '
+                    f'{node.dependencies}')
+    return '\n'.join(lines)
+
+
+class Generator:
+    """Generate the source code for a netlist.
+
+    After generate() has run, 'runs' lists the steps of an evaluation in
+    order: the name of a generated function, or the index in the netlist's
+    nodes of an opaque node.  'tables' maps the name of each truth table in
+    the code to its nested dicts, 'fixed' holds the wires that have a
+    constant value, and 'stored' is every wire that the code keeps up to
+    date in the list of values.
+    """
+    def __init__(self, netlist: Netlist):
+        self.netlist = netlist
+        self.runs = []
+        self.tables = {}
+        self.fixed = {wire: value for value, wire in netlist.constants.items()}
+        self.stored = set()
+
+    def get_table(self, operator) -> str:
+        name = operator.name or f'T{operator.id}'
+        name = f'{name}_{operator.ARITY}'
+        self.tables[name] = nest(operator.outputs)
+        return name
+
+    def group(self) -> list:
+        """Split the nodes into runs of gates, and single opaque nodes.
+
+        Gates with only constant inputs are worked out here, and left out.
+        """
+        groups = []
+        gates = []
+        for i, node in enumerate(self.netlist.nodes):
+            if not isinstance(node, GateNode):
+                if gates:
+                    groups.append(gates)
+                    gates = []
+                groups.append(i)
+                continue
+            if all(wire in self.fixed for wire in node.inputs):
+                key = tuple(self.fixed[wire] for wire in node.inputs)
+                self.fixed[node.output] = node.operator.outputs[key]
+                continue
+            gates.append(node)
+        if gates:
+            groups.append(gates)
+        return groups
+
+    def generate(self) -> str:
+        netlist = self.netlist
+        groups = self.group()
+
+        # The wires that each run of gates drives, and the wires that must be
+        # written back to the list of values because something outside the
+        # run reads them.
+        owner = {}
+        for index, group in enumerate(groups):
+            if isinstance(group, list):
+                for node in group:
+                    owner[node.output] = index
+        exports = set(netlist.outputs)
+        for index, group in enumerate(groups):
+            if isinstance(group, list):
+                for node in group:
+                    exports.update(
+                            wire for wire in node.inputs
+                            if owner.get(wire, index) != index)
+            else:
+                exports.update(netlist.nodes[group].inputs)
+
+        self.stored = set(netlist.inputs) | set(self.fixed)
+        for node in netlist.blocks:
+            self.stored.update(node.outputs)
+        self.stored.update(exports & owner.keys())
+
+        lines = [f'# Generated by {__name__}, format {FORMAT}.']
+        for index, group in enumerate(groups):
+            if not isinstance(group, list):
+                self.runs.append(group)
+                continue
+            name = f'cone{len(self.runs)}'
+            self.runs.append(name)
+            lines.extend(('', '', f'def {name}(values):'))
+            lines.extend(self.generate_run(group, exports))
+        lines.append('')
+        return '\n'.join(lines)
+
+    def generate_run(self, gates: list, exports: set) -> list:
+        driven = {node.output for node in gates}
+        # Load every wire that comes from outside the run, up front.
+        outside = {}
+        for node in gates:
+            for wire in node.inputs:
+                if wire not in driven and wire not in self.fixed:
+                    outside[wire] = True
+        lines = [f'    w{wire} = values[{wire}]' for wire in outside]
+
+        for node in gates:
+            table = self.get_table(node.operator)
+            args = ''.join(
+                    f'[{self.fixed[wire]!r}]' if wire in self.fixed
+                    else f'[w{wire}]'
+                    for wire in node.inputs)
+            target = f'w{node.output}'
+            if node.output in exports:
+                target = f'values[{node.output}] = {target}'
+            lines.append(f'    {target} = {table}{args}')
+        return lines
+
+
+class CompiledEvaluator(Evaluator):
+    """An Evaluator that runs generated code for its netlist.
+
+    The compiled code is loaded from 'cache_dir' if it is there, and saved
+    there if it isn't.  Pass None for 'cache_dir' to turn the cache off.
+
+    Only the wires that the code keeps in the list of values are updated on
+    each evaluation.  Asking get_value() for any other wire runs the netlist
+    one node at a time, to fill in the rest.
+    """
+    def __init__(
+            self, netlist: Netlist, cache_dir: str | None = ''):
+        super().__init__(netlist)
+        if cache_dir == '':
+            cache_dir = get_cache_dir()
+        generator = Generator(netlist)
+        self.source = generator.generate()
+        code = self.load_code(netlist, generator, cache_dir)
+        namespace = dict(generator.tables)
+        exec(code, namespace)
+
+        self.steps = []
+        for run in generator.runs:
+            if isinstance(run, str):
+                self.steps.append(namespace[run])
+            else:
+                self.steps.append(netlist.nodes[run].evaluate)
+        for wire, value in generator.fixed.items():
+            self.values[wire] = value
+        self.stored = generator.stored
+        self.complete = False
+
+    def load_code(self, netlist: Netlist, generator: Generator, cache_dir):
+        description = describe(netlist)
+        key = hashlib.sha256(description.encode('ascii')).hexdigest()
+        filename = f'<netlist {key[:12]}>'
+        if cache_dir is None:
+            return compile(self.source, filename, 'exec')
+
+        path = os.path.join(cache_dir, f'{key}.code')
+        try:
+            with open(path, 'rb') as stream:
+                return marshal.load(stream)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        code = compile(self.source, filename, 'exec')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that another process never
+            # sees a partly written cache entry.
+            fd, temp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as stream:
+                marshal.dump(code, stream)
+            os.replace(temp, path)
+        except OSError:
+            pass
+        return code
+
+    def set_inputs(self, inputs: Trits) -> None:
+        super().set_inputs(inputs)
+        self.complete = False
+
+    def evaluate(self) -> None:
+        values = self.values
+        for step in self.steps:
+            step(values)
+        self.settled = True
+
+    def get_value(self, name: str):
+        wire = self.netlist.get_wire(name)
+        if wire in self.stored:
+            self.settle()
+        elif not self.complete:
+            super().evaluate()
+            self.complete = True
+        return self.values[wire]
+
+    def tick(self) -> bool:
+        changed = super().tick()
+        self.complete = False
+        return changed
@@ -2,6 +2,7 @@ from __future__ import annotations
 import re
 from collections.abc import Callable, Iterable
 
+from ternary import trit
 from ternary.trit import ZERO, POS, NEG
 from ternary.hardware.util import Trit, Trits
 
@@ -10,6 +11,14 @@ BUS_RE = re.compile(r'^(\w+)\[(\d+)]$')
 BUS_SLICE_RE = re.compile(r'^([\w.]+)\[(\d+)\.\.(\d+)]$')
 
 
+CONSTANTS = (ZERO, POS, NEG)
+
+
+def constant(value: Trit) -> Trit:
+    """Source function for a connection to a literal trit value."""
+    return value
+
+
 class Primitive:
     """Primitive is the abstract base class for all components.
 
@@ -19,6 +28,13 @@ class Primitive:
 
     For more complex behaviour, or linking multiple components together, use
     the Component class.
+
+    Inputs and outputs are named, but values are kept by position, or 'slot':
+    'input_values' and 'output_values' hold the values worked out so far in
+    the current clock cycle, with None for any that aren't known yet.  The
+    parent component fills in 'sources' with one (function, argument) pair
+    per input slot, and calling the function with the argument gives the
+    value of that input, so no names need to be looked up while simulating.
     """
     buses: dict | None = None
     inputs: tuple[str] = tuple()
@@ -29,29 +45,46 @@ class Primitive:
     def __init__(self, inputs: Iterable[str], outputs: Iterable[str]):
         self.inputs = tuple(inputs)
         self.outputs = tuple(outputs)
-        self.cache = {}
+        self.input_slots = {name: i for i, name in enumerate(self.inputs)}
+        self.output_slots = {name: i for i, name in enumerate(self.outputs)}
+        self.sources = None
+        Primitive.clear_cache(self)
 
     def set_name(self, name: str) -> None:
         self.name = name
 
     def set_parent(self, parent: Component) -> None:
         self.parent = parent
+        self.sources = None
 
     def set_inputs(self, inputs: Trits) -> None:
         """Set this component's inputs and remove all other cache entries."""
-        self.cache = dict(zip(self.inputs, inputs))
-
-    def get_input(self, name: str) -> Trit:
-        if name in self.cache:
-            return self.cache[name]
+        Primitive.clear_cache(self)
+        values = self.input_values
+        for i, value in zip(range(len(values)), inputs):
+            values[i] = value
+
+    def get_input_slot(self, index: int) -> Trit:
+        value = self.input_values[index]
+        if value is not None:
+            return value
 
         if self.parent is None:
             raise ValueError(
-                    f"{self.name} needs input '{name}', but no parent is set.")
-        value = self.parent.get_value(f'{self.name}.{name}')
-        self.cache[name] = value
+                    f"{self.name} needs input '{self.inputs[index]}', but no "
+                    "parent is set.")
+        if self.sources is None:
+            self.parent.resolve_connections()
+        function, arg = self.sources[index]
+        value = function(arg)
+        self.input_values[index] = value
         return value
 
+    def get_input(self, name: str) -> Trit:
+        if name not in self.input_slots:
+            raise ValueError(f"'{name}' is not an input of {self.name}")
+        return self.get_input_slot(self.input_slots[name])
+
     def get_outputs(self, inputs: Trits | None = None) -> Trits:
         """Return the outputs for this component, given its inputs.
 
@@ -60,18 +93,48 @@ class Primitive:
         """
         raise NotImplementedError()
 
+    def get_output_slot(self, index: int) -> Trit:
+        """Return a single output for this component, by its position.
+
+        The default behaviour for a Primitive component is to request all
+        inputs up front, calculate all outputs, and keep them until the cache
+        is cleared.
+        """
+        value = self.output_values[index]
+        if value is None:
+            inputs = tuple(
+                    map(self.get_input_slot, range(len(self.inputs))))
+            self.output_values = list(self.get_outputs(inputs))
+            value = self.output_values[index]
+        return value
+
     def get_output(self, name: str) -> Trit:
         """Return a single output for this component.
 
-        The default behaviour for a Primitive component is to request all
-        inputs up front, calculate all outputs and return the named one, but
-        inheriting classes are free to override these methods to get different
+        Inheriting classes are free to override this method to get different
         behaviour.
         """
-        inputs = tuple(self.get_input(x) for x in self.inputs)
-        self.set_inputs(inputs)
-        index = self.outputs.index(name)
-        return self.get_outputs(inputs)[index]
+        return self.get_output_slot(self.output_slots[name])
+
+    def get_output_source(self, name: str) -> tuple[Callable, object]:
+        """Return the (function, argument) pair that gives an output.
+
+        This reads the output by its slot, unless the class has overridden
+        get_output(), in which case it goes through get_output() by name.
+        """
+        if type(self).get_output is Primitive.get_output:
+            return (self.get_output_slot, self.output_slots[name])
+        return (self.get_output, name)
+
+    def get_combinational_inputs(self) -> tuple[str]:
+        """Return the inputs that the outputs depend on within a clock cycle.
+
+        By default, the outputs of a component depend on all of its inputs.
+        Components whose outputs come from their internal state, like a flip
+        flop, only read their inputs when they update, and should override
+        this to leave those inputs out.
+        """
+        return self.inputs
 
     def update(self) -> bool:
         """Update the component in response to a clock pulse.
@@ -84,13 +147,27 @@ class Primitive:
         return False
 
     def clear_cache(self) -> None:
+        # Subclasses may keep anything else they work out within a clock
+        # cycle in 'cache'.
         self.cache = {}
+        self.input_values = [None] * len(self.inputs)
+        self.output_values = [None] * len(self.outputs)
 
 
 ComponentCompatible = Primitive | Callable
 
 
 class Component(Primitive):
+    """Component is a hierarchy of subcomponents joined by connections.
+
+    Connections are given by name, as a dict from each destination to its
+    source, like {'Mux.a': 'in[0]', 'out': 'Mux.out'}.  The first time a
+    value is needed, the component resolves every connection into the
+    (function, argument) pair that produces it: the output slot of a
+    subcomponent, an input slot of this component, or a constant.  After
+    that, values pass directly between slots, and the names are only used by
+    get_value() and the other methods that take a name.
+    """
     def __init__(
             self,
             inputs: Iterable[str],
@@ -122,9 +199,10 @@ class Component(Primitive):
 
         super().__init__(input_items, output_items)
 
-        self.cache = {}
         self.components = {}
         self.connections = {}
+        self.resolved = None
+        self.output_sources = None
         if components:
             # Each value of 'components' should be either an instance that
             # inherits Primitive, or a callable that returns such an instance.
@@ -179,6 +257,7 @@ class Component(Primitive):
         return (name,)
 
     def add_connection(self, dest: str, source: str) -> None:
+        self.unresolve()
         dest_items = self.expand_bus(dest)
         dest_size = len(dest_items)
         if dest_size == 1:
@@ -205,46 +284,105 @@ class Component(Primitive):
 
         self.connections.update(dict(zip(dest_items, source_items)))
 
+    def unresolve(self) -> None:
+        """Forget the resolved connections, after the connections change."""
+        self.resolved = None
+        self.output_sources = None
+        for comp in self.components.values():
+            comp.sources = None
+
+    def missing(self, name: str) -> Trit:
+        """Source function for a connection that leads nowhere."""
+        raise ValueError(f"'{name}' does not exist in this component")
+
+    def resolve(self, name: str) -> tuple[Callable, object]:
+        """Return the (function, argument) pair that gives a named value.
+
+        Follow the connections from 'name' until they reach a constant, an
+        input of this component, or an output of a subcomponent.  If they
+        don't, the pair raises ValueError when it is called, so that nothing
+        goes wrong unless the value is actually needed.
+        """
+        if self.resolved is None:
+            self.resolved = {}
+        if name in self.resolved:
+            return self.resolved[name]
+
+        seen = set()
+        source = name
+        while True:
+            if source in CONSTANTS:
+                result = (constant, source)
+                break
+            if source in self.input_slots:
+                result = (self.get_input_slot, self.input_slots[source])
+                break
+            if source not in self.connections or source in seen:
+                result = (self.missing, source)
+                break
+            seen.add(source)
+            source = self.connections[source]
+            if '.' in source:
+                result = self.resolve_subcomponent(source)
+                break
+        self.resolved[name] = result
+        return result
+
+    def resolve_subcomponent(self, source: str) -> tuple[Callable, object]:
+        comp, _, pin = source.partition('.')
+        if comp not in self.components:
+            return (self.missing, source)
+        comp = self.components[comp]
+        if pin not in comp.output_slots:
+            return (self.missing, source)
+        return comp.get_output_source(pin)
+
+    def resolve_connections(self) -> None:
+        """Resolve the sources of every subcomponent input and output."""
+        self.output_sources = [self.resolve(name) for name in self.outputs]
+        for name, comp in self.components.items():
+            comp.sources = [
+                    self.resolve(f'{name}.{pin}') for pin in comp.inputs]
+
     def get_value(self, name: str) -> Trit:
         # Literal trit values are treated as a constant source
-        if name in (ZERO, POS, NEG):
+        if name in CONSTANTS:
             return name
 
-        if name in self.cache:
-            return self.cache[name]
+        if name in self.input_slots:
+            return self.get_input_slot(self.input_slots[name])
 
-        if name in self.inputs:
-            value = self.get_input(name)
-            self.cache[name] = value
-            return value
+        if name in self.output_slots:
+            return self.get_output_slot(self.output_slots[name])
 
-        if name in self.connections:
-            source = self.connections[name]
-            if source in self.cache:
-                return self.cache[source]
-
-            try:
-                if '.' in source:
-                    value = self.get_subcomponent_output(*source.split('.'))
-                    self.cache[name] = value
-                    return value
-                return self.get_value(source)
-            except ValueError as e:
-                raise ValueError(
-                        f"Failed to get value for {name} <- {source}: {e}")
+        function, arg = self.resolve(name)
+        return function(arg)
 
-        raise ValueError(f"'{name}' does not exist in this component")
+    def get_output_slot(self, index: int) -> Trit:
+        value = self.output_values[index]
+        if value is None:
+            if self.output_sources is None:
+                self.resolve_connections()
+            function, arg = self.output_sources[index]
+            value = function(arg)
+            self.output_values[index] = value
+        return value
+
+    def get_output_source(self, name: str) -> tuple[Callable, object]:
+        cls = type(self)
+        if (
+                cls.get_output is Component.get_output
+                and cls.get_value is Component.get_value):
+            return (self.get_output_slot, self.output_slots[name])
+        return (self.get_output, name)
 
     def invalidate_cache(self, name: str) -> None:
         """Remove all cache entries for a subcomponent."""
-        prefix = f'{name}.'
-        self.cache = {
-                k: v for k, v in self.cache.items()
-                if k != name and not k.startswith(prefix)}
+        self.components[name].clear_cache()
 
     def clear_cache(self) -> None:
         """Clear the cache of this component and all its descendants."""
-        self.cache = {}
+        super().clear_cache()
         for comp in self.components.values():
             comp.clear_cache()
 
@@ -272,13 +410,11 @@ class Component(Primitive):
 
     def tick(self) -> bool:
         changed = self.update()
-        # Remove everything from the cache except for the inputs to this
+        # Clear everything from the cache except for the inputs to this
         # component, and completely clear the caches of all subcomponents.
-        self.cache = {
-                k: v for k, v in self.cache.items()
-                if k in self.inputs}
-        for comp in self.components.values():
-            comp.clear_cache()
+        inputs = self.input_values
+        self.clear_cache()
+        self.input_values = inputs
         return changed
 
     def get_subcomponent_output(self, component: str, name: str) -> Trit:
@@ -295,7 +431,20 @@ class Component(Primitive):
         return self.get_value(name)
 
 
-class NAnd(Primitive):
+class Gate(Primitive):
+    """Gate is the base class for logic gates with a single output.
+
+    The output of a Gate is given by its 'operator', a ternary.trit Operator
+    holding the gate's truth table, so every gate shares the same table
+    lookup rather than defining its logic in code.
+    """
+    operator: trit.Operator
+
+    def get_outputs(self, inputs: Trits) -> Trits:
+        return (self.operator.lookup(*inputs),)
+
+
+class NAnd(Gate):
     """The NAND gate produces the inverse conjunction of its inputs.
 
     The NAND operation is equivalent to performing an AND operation, and then
@@ -307,25 +456,13 @@ class NAnd(Primitive):
     | 0 | + | 0 | 0 |
     | + | + | 0 | - |
     """
+    operator = trit.NAND
+
     def __init__(self):
         super().__init__(('a', 'b'), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        """Return the logical NAND of 'a' and 'b'.
 
-        The result is positive if either input is negative, negative if both
-        inputs are positive, and otherwise zero.
-        """
-        a, b = inputs
-        if a == NEG or b == NEG:
-            return (POS,)
-        elif a == POS and b == POS:
-            return (NEG,)
-        else:
-            return (ZERO,)
-
-
-class Not(Primitive):
+class Not(Gate):
     """The NOT gate produces the inverse of its input.
 
     For positive or negative input, it produces the opposite value. For zero
@@ -337,17 +474,13 @@ class Not(Primitive):
     |  0  |  0  |
     |  +  |  -  |
     """
+    operator = trit.NOT
+
     def __init__(self):
         super().__init__(('in',), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        (inp,) = inputs
-        if inp == ZERO:
-            return (ZERO,)
-        return (NEG,) if inp == POS else (POS,)
-
 
-class PNot(Primitive):
+class PNot(Gate):
     """The PNOT gate produces the positively-biased inverse of its input.
 
     For positive or negative input, it works just like a normal NOT gate, but
@@ -359,15 +492,13 @@ class PNot(Primitive):
     |  0  |  +  |
     |  +  |  -  |
     """
+    operator = trit.PNOT
+
     def __init__(self):
         super().__init__(('in',), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        (inp,) = inputs
-        return (NEG,) if inp == POS else (POS,)
-
 
-class NNot(Primitive):
+class NNot(Gate):
     """The NNOT gate produces the negatively-biased inverse of its input.
 
     For positive or negative input, it works just like a normal NOT gate, but
@@ -379,15 +510,13 @@ class NNot(Primitive):
     |  0  |  -  |
     |  +  |  -  |
     """
+    operator = trit.NNOT
+
     def __init__(self):
         super().__init__(('in',), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        (inp,) = inputs
-        return (POS,) if inp == NEG else (NEG,)
-
 
-class NOr(Primitive):
+class NOr(Gate):
     """The NOR gate produces the inverse disjunction of its inputs.
 
     Where either (or both) inputs are positive, it produces a negative. Where
@@ -400,19 +529,13 @@ class NOr(Primitive):
     | 0 | 0 | 0 | - |
     | + | - | - | - |
     """
+    operator = trit.NOR
+
     def __init__(self):
         super().__init__(('a', 'b',), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        a, b = inputs
-        if a == POS or b == POS:
-            return (NEG,)
-        if a == NEG and b == NEG:
-            return (POS,)
-        return (ZERO,)
-
 
-class NAny(Primitive):
+class NAny(Gate):
     """The NANY gate produces the inverse ANY of its inputs.
 
     For cases where either input is zero, it produces the NOT of its other
@@ -426,21 +549,13 @@ class NAny(Primitive):
     | 0 | + | 0 | - |
     | + | 0 | - | - |
     """
+    operator = trit.NANY
+
     def __init__(self):
         super().__init__(('a', 'b',), ('out',))
 
-    def get_outputs(self, inputs: Trits) -> Trits:
-        a, b = inputs
-        if a == NEG:
-            return (ZERO,) if b == POS else (POS,)
-        if a == POS:
-            return (ZERO,) if b == NEG else (NEG,)
-        if b == ZERO:
-            return (ZERO,)
-        return (POS,) if b == NEG else (NEG,)
-
 
-class NCons(Primitive):
+class NCons(Gate):
     """The NCONS gate produces the inverse consensus of its inputs.
 
     For cases where both inputs have the same value, it produces the inverse of
@@ -452,11 +567,7 @@ class NCons(Primitive):
     | 0 | 0 | 0 | 0 |
     | + | 0 | 0 | - |
     """
+    operator = trit.NCONS
+
     def __init__(self):
         super().__init__(('a', 'b',), ('out',))
-
-    def get_outputs(self, inputs: Trits) -> Trits:
-        a, b = inputs
-        if a == b and a != ZERO:
-            return (NEG,) if a == POS else (POS,)
-        return (ZERO,)
@@ -63,7 +63,7 @@ class Computer(Component):
         self.set_inputs(ZERO)
         self.tick()
 
-    def load_program(self, data: Trits) -> None:
+    def load_program(self, data: Trits | list[str]) -> None:
         """Write data to the program ROM."""
         self.components['ROM'].load(data)
 
@@ -20,9 +20,10 @@ from traceback import print_exc
 from PIL import Image, ImageDraw, ImagePalette
 
 from ternary import binary
+from ternary.integer import Int12
 from ternary.hardware.util import (
         int_to_trits, trits_to_int, input_stream, output_stream,
-        MIN_ADDR, MIN_INT, INT_RANGE, COLOURS_3T, Trit)
+        parse_code, MIN_ADDR, COLOURS_3T, Trit)
 
 
 SCREEN_WIDTH = 320
@@ -31,19 +32,11 @@ SCREEN_END_ADDR = MIN_ADDR + (SCREEN_WIDTH * SCREEN_HEIGHT / 4)
 
 
 def tritwise_and(a: int, b: int) -> int:
-    ta = int_to_trits(a, 12)
-    tb = int_to_trits(b, 12)
-
-    result = []
-    for x, y in zip(ta, tb):
-        t = '+' if x == '+' and y == '+' else '-' if '-' in (x, y) else '0'
-        result.append(t)
-    return trits_to_int(result)
+    return int(Int12(a) & Int12(b))
 
 
 def add(a: int, b: int) -> int:
-    mod = (a + b - MIN_INT) % INT_RANGE
-    return MIN_INT + mod
+    return Int12.wrap(a + b)
 
 
 def compute(x: int, y: int, px: Trit, py: Trit, f: Trit) -> int:
@@ -94,16 +87,8 @@ class Emulator:
     def load_binary(self, stream, prefix: bytes = b'') -> None:
         """Load a program encoded in binary format."""
         data = b''.join((prefix, stream.read()))
-        program = str(binary.decode(data))
-        length = len(program)
-        if length % 12 != 0:
-            raise ValueError(
-                    "Invalid length for binary-encoded program: "
-                    f"expected a multiple of 12 but got {length}")
-        self.program = []
+        self.program = binary.decode_words(data)
         self.comments = {}
-        for i in range(0, length, 12):
-            self.program.append(program[i:i+12])
 
     def load_text(self, stream: io.TextIOBase) -> None:
         """Load a program encoded in text format."""
@@ -132,13 +117,8 @@ class Emulator:
             line = line.strip()
             if not line:
                 continue
-            code = line[:12]
+            code = parse_code(line)
             comment = line[12:].strip() if len(line) > 12 else ""
-
-            if any(c not in '-0+' for c in code):
-                raise ValueError(
-                        f"Invalid characters in '{line}': expected only "
-                        "-, 0 and + in the first 12 characters of each line")
             codes.append(code)
             comments[i] = comment
             i += 1
@@ -222,12 +202,10 @@ class Emulator:
 
             if shift == '-':
                 # Shift right
-                trits = '0' + int_to_trits(result, 12)[:11]
-                result = trits_to_int(trits)
+                result = int(Int12(result) >> 1)
             elif shift == '+':
                 # Shift left
-                trits = int_to_trits(result, 12)[1:] + '0'
-                result = trits_to_int(trits)
+                result = int(Int12(result) << 1)
 
             nxt = add(self.pc, 1)
             if jump == '--':
@@ -2,7 +2,9 @@
 from argparse import ArgumentParser
 from itertools import product
 
-from ternary.trit import NEG, ZERO, POS
+from ternary.trit import (
+        NEG, ZERO, POS, BUFFER, NOT, PNOT, NNOT, IS_ZERO, NAND, NOR, NANY,
+        NCONS, NXOR, PASS_A, PASS_B)
 
 
 N = NEG
@@ -41,105 +43,37 @@ UNARY_TARGETS = {
 
 
 def describe_gate(gate, args):
-    name = gate.__name__
-    if name == 'buffer':
+    name = gate.name
+    if gate == BUFFER:
         return args[0]
     else:
         arglist = ', '.join(args)
         return f'{name}({arglist})'
 
 
-def buffer(v):
-    return v
-
-
-def _not(v):
-    if v == ZERO:
-        return v
-    return NEG if v == POS else POS
-
-
-def pnot(v):
-    return NEG if v == POS else POS
-
-
-def nnot(v):
-    return POS if v == NEG else NEG
-
-
-def nand(a, b):
-    if a == NEG or b == NEG:
-        return POS
-    if a == POS and b == POS:
-        return NEG
-    return ZERO
-
-
-def nor(a, b):
-    if a == POS or b == POS:
-        return NEG
-    if a == NEG and b == NEG:
-        return POS
-    return ZERO
-
-
-def nany(a, b):
-    if a == NEG:
-        return ZERO if b == POS else POS
-    if a == POS:
-        return ZERO if b == NEG else NEG
-    if b == ZERO:
-        return ZERO
-    return POS if b == NEG else NEG
-
-
-def ncons(a, b):
-    if a == b and a != ZERO:
-        return NEG if a == POS else POS
-    return ZERO
-
-
-def nxor(a, b):
-    if a == ZERO or b == ZERO:
-        return ZERO
-    return POS if a == b else NEG
-
-
-def pass_a(a, b):
-    return a
-
-
-def pass_b(a, b):
-    return b
-
-
-def isz(a):
-    return POS if a == ZERO else NEG
-
-
 INPUTS = tuple((a, b) for a in (NEG, ZERO, POS) for b in (NEG, ZERO, POS))
-UNARY = (buffer, _not, pnot, nnot, isz)
-BINARY = (nand, nor, nany, ncons, nxor, pass_a, pass_b)
+UNARY = (BUFFER, NOT, PNOT, NNOT, IS_ZERO)
+BINARY = (NAND, NOR, NANY, NCONS, NXOR, PASS_A, PASS_B)
 
 COST = {
-        'buffer': 0,
-        '_not': 1,
-        'pnot': 1,
-        'nnot': 1,
-        'nand': 1,
-        'nor': 1,
-        'nany': 1,
-        'ncons': 1,
-        'nxor': 4,
-        'isz': 3,
-        'pass_a': 0,
-        'pass_b': 0,
+        'BUFFER': 0,
+        'NOT': 1,
+        'PNOT': 1,
+        'NNOT': 1,
+        'NAND': 1,
+        'NOR': 1,
+        'NANY': 1,
+        'NCONS': 1,
+        'NXOR': 4,
+        'IS_ZERO': 3,
+        'PASS_A': 0,
+        'PASS_B': 0,
         }
 
 
 def test_gates_uubu(pre_a, pre_b, com, post, inputs, expected):
     def f(a, b):
-        return post(com(pre_a(a), pre_b(b)))
+        return post.lookup(com.lookup(pre_a.lookup(a), pre_b.lookup(b)))
 
     for i, a in enumerate(inputs):
         res = f(*a)
@@ -150,7 +84,7 @@ def test_gates_uubu(pre_a, pre_b, com, post, inputs, expected):
 
 def test_gates_bbbu(pre1, pre2, com, post, inputs, expected):
     def f(a, b):
-        return post(com(pre1(a, b), pre2(a, b)))
+        return post.lookup(com.lookup(pre1.lookup(a, b), pre2.lookup(a, b)))
 
     for i, a in enumerate(inputs):
         res = f(*a)
@@ -162,10 +96,10 @@ def test_gates_bbbu(pre1, pre2, com, post, inputs, expected):
 def test_gates_10(pre1a, pre1b, pre2a, pre2b, com1, com2, post1, post2, com3,
                   post3, inputs, expected):
     def f(a, b):
-        return post3(
-                com3(
-                    post1(com1(pre1a(a), pre1b(b))),
-                    post2(com2(pre2a(a), pre2b(b)))))
+        first = com1.lookup(pre1a.lookup(a), pre1b.lookup(b))
+        second = com2.lookup(pre2a.lookup(a), pre2b.lookup(b))
+        return post3.lookup(
+                com3.lookup(post1.lookup(first), post2.lookup(second)))
 
     for i, a in enumerate(inputs):
         res = f(*a)
@@ -181,15 +115,15 @@ def find_binary_gates(name, expected):
     for pre_a, pre_b, com, post in product(UNARY, UNARY, BINARY, UNARY):
         if test_gates_uubu(pre_a, pre_b, com, post, INPUTS, expected):
             print("  Match found for "
-                  f"{post.__name__}({com.__name__}({pre_a.__name__}(a), "
-                  f"{pre_b.__name__}(b)))")
+                  f"{post.name}({com.name}({pre_a.name}(a), "
+                  f"{pre_b.name}(b)))")
             found = True
 
     for a, b, c, d in product(BINARY, BINARY, BINARY, UNARY):
         if test_gates_bbbu(a, b, c, d, INPUTS, expected):
             print("  Match found for "
-                  f"{d.__name__}({c.__name__}({a.__name__}(a, b), "
-                  f"{b.__name__}(a, b)))")
+                  f"{d.name}({c.name}({a.name}(a, b), "
+                  f"{b.name}(a, b)))")
             found = True
 
     best = float('Infinity')
@@ -197,10 +131,10 @@ def find_binary_gates(name, expected):
                          UNARY, BINARY, UNARY):
         if test_gates_10(*funcs, INPUTS, expected):
             found = True
-            score = sum([COST[x.__name__] for x in funcs])
+            score = sum([COST[x.name] for x in funcs])
             if score <= best:
                 print(f"  Match {score} found with "
-                      f"{[x.__name__ for x in funcs]}")
+                      f"{[x.name for x in funcs]}")
                 best = score
     if not found:
         print(f"No matches found for {name}")
@@ -212,21 +146,21 @@ def find_unary_gates(name, expected):
     inputs = ((NEG, NEG), (ZERO, ZERO), (POS, POS))
     best = float('Infinity')
     for funcs in product(UNARY, UNARY, BINARY, UNARY):
-        score = sum([COST[x.__name__] for x in funcs])
+        score = sum([COST[x.name] for x in funcs])
         if test_gates_uubu(*funcs, inputs, expected):
             if score <= best:
                 print(f"  Match {score} found with "
-                      f"{[x.__name__ for x in funcs]}")
+                      f"{[x.name for x in funcs]}")
                 best = score
 
     for funcs in product(UNARY, UNARY, UNARY, UNARY, BINARY, BINARY, UNARY,
                          UNARY, BINARY, UNARY):
         if test_gates_10(*funcs, inputs, expected):
             found = True
-            score = sum([COST[x.__name__] for x in funcs])
+            score = sum([COST[x.name] for x in funcs])
             if score <= best:
                 print(f"  Match {score} found with "
-                      f"{[x.__name__ for x in funcs]}")
+                      f"{[x.name for x in funcs]}")
                 best = score
     if not found:
         print(f"No matches found for {name}")
@@ -39,6 +39,9 @@ class DataFlipFlop(Component):
             return self.state
         return super().get_value(name)
 
+    def get_combinational_inputs(self) -> tuple[str]:
+        return ()
+
     def get_contents(self) -> Trit:
         return self.state
 
@@ -692,7 +695,16 @@ class RAM177KMock(Component):
         self.default_value = tuple(ZERO * 12)
 
     def get_address(self) -> Trits:
-        return ''.join(self.get_value(f'addr[{i}]') for i in range(11))
+        # Every output needs the address, so keep it with the cached inputs.
+        if 'addr' not in self.cache:
+            self.cache['addr'] = ''.join(
+                    self.get_value(f'addr[{i}]') for i in range(11))
+        return self.cache['addr']
+
+    def get_combinational_inputs(self) -> tuple[str]:
+        # The output is read from whichever register is addressed right now,
+        # but 'in' and 'load' only take effect on the clock tick.
+        return tuple(f'addr[{i}]' for i in range(11))
 
     def update_local(self) -> bool:
         load = self.get_value('load')
@@ -759,6 +771,11 @@ class ROM177KMock(Component):
         addr = tuple(self.get_value(f'addr[{i}]') for i in range(10, -1, -1))
         return trits_to_int(addr) - self.min_address
 
+    def get_combinational_inputs(self) -> tuple[str]:
+        # The output comes from the register that was addressed at the last
+        # clock tick.
+        return ()
+
     def get_outputs(self, inputs: Trits | None = None) -> Trits:
         if inputs is not None:
             self.set_inputs(inputs)
@@ -778,28 +795,35 @@ class ROM177KMock(Component):
             return self.registers[self.index][index]
         return super().get_value(name)
 
-    def load(self, values: Trits):
+    def load(self, values: Trits | list[str]):
         """Write data to the ROM.
 
         Starting from the lowest possible register address in the ROM
         (-----------), the values will be written sequentially into the ROM.
 
-        The `values` argument must be an integer multiple of 12 in length.
+        The `values` argument must either be an integer multiple of 12 in
+        length, or a list of 12-trit words.
 
         Each 12-trit word is assumed to be in arithmetic trit order (from most
         to least significant), and will be reversed when loading into a
         register, so that index 0 refers to the least significant trit.
         """
-        self.registers = []
-        length = len(values)
-        if length % 12 != 0:
-            raise ValueError(
-                    "Invalid program data: length must be a multiple "
-                    f"of 12, but got {length}")
-
-        for i in range(0, length, 12):
-            word = values[i:i+12]
-            self.registers.append(word[::-1])
+        if isinstance(values, list):
+            words = values
+        else:
+            length = len(values)
+            if length % 12 != 0:
+                raise ValueError(
+                        "Invalid program data: length must be a multiple "
+                        f"of 12, but got {length}")
+            words = [values[i:i+12] for i in range(0, length, 12)]
+
+        for i, word in enumerate(words):
+            if len(word) != 12:
+                raise ValueError(
+                        f"Invalid program data: word {i} has length "
+                        f"{len(word)}, expected 12")
+        self.registers = [word[::-1] for word in words]
 
 
 class ProgramCounter11(Component):
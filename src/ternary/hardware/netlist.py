@@ -0,0 +1,546 @@
+"""Flattened netlists of hardware components.
+
+A Component works out its values by pulling them through the hierarchy by
+name: each request is a string like 'ALU.x[3]', which is looked up in the
+connections of one component after another, all the way down to a gate.
+That is easy to follow, but slow to simulate.
+
+This module compiles a Component, and everything inside it, into a Netlist: a
+flat list of nodes in topological order, connected by numbered wires.  Each
+logic gate becomes a node of its own.  Behavioural components, such as the
+DataFlipFlop and the RAM and ROM mocks, are kept whole as opaque nodes, which
+still hold their own state.
+
+An Evaluator runs a Netlist over a flat list of wire values, and gives the
+same results as the Component it was compiled from.  It works on the very
+same flip flops and memories as the Component, so methods like
+Computer.get_a() still report the state of the machine:
+
+    comp = Computer()
+    comp.load_program(program)
+    sim = Evaluator(Netlist(comp))
+    sim.set_inputs(POS)
+    sim.tick()
+    sim.set_inputs(ZERO)
+    sim.tick()
+    comp.get_a()
+
+An EventEvaluator does the same, but keeps the values from one clock cycle to
+the next, and only evaluates the nodes that a change can reach.
+
+A SlicedEvaluator runs a combinational netlist for thousands of input vectors
+at once, by giving each wire a pair of bit planes with one bit per vector:
+
+    sim = SlicedEvaluator(Netlist(FullAdd()))
+    sim.truth_table()
+"""
+from __future__ import annotations
+import heapq
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+from ternary import trit
+from ternary.hardware.component import Component, Gate, Primitive
+from ternary.hardware.util import Trit, Trits
+from ternary.trit import ZERO, POS, NEG, GLYPHS
+
+
+CONSTANTS = (NEG, ZERO, POS)
+# Methods that give a Component behaviour beyond its connections.
+BEHAVIOUR = (
+        'get_value', 'get_output', 'get_outputs', 'update', 'update_local')
+
+
+def is_structural(comp: Primitive) -> bool:
+    """Return whether a component is defined entirely by its connections.
+
+    A structural component does not override any of the Component methods
+    that work out its values or its state, so it can be flattened into its
+    subcomponents and connections.
+    """
+    if not isinstance(comp, Component):
+        return False
+    cls = type(comp)
+    return all(
+            getattr(cls, name) is getattr(Component, name)
+            for name in BEHAVIOUR)
+
+
+def join(prefix: str, name: str) -> str:
+    return f'{prefix}.{name}' if prefix else name
+
+
+class GateNode:
+    """A logic gate in a netlist.
+
+    'inputs' are the wires that feed the gate, in the order of its input
+    pins, and 'output' is the wire that it drives.
+    """
+    def __init__(
+            self, name: str, gate: Gate, inputs: tuple[int], output: int):
+        self.name = name
+        self.operator = gate.operator
+        self.inputs = inputs
+        self.output = output
+        self.outputs = (output,)
+        self.dependencies = inputs
+        # The truth table keyed by the input glyphs joined together, which is
+        # quicker to build than a tuple.
+        self.table = {
+                ''.join(key): value
+                for key, value in self.operator.outputs.items()}
+
+    def evaluate(self, values: list) -> None:
+        values[self.output] = self.table[
+                ''.join([values[wire] for wire in self.inputs])]
+
+
+class OpaqueNode:
+    """A component that is kept whole in a netlist.
+
+    The node works out its outputs by handing its inputs to the component,
+    and asking the component for each output by name.  On a clock tick, it
+    passes the component its inputs again and calls its update() method.
+
+    Only the inputs listed by the component's get_combinational_inputs() are
+    'dependencies' of the node, which must be settled before its outputs can
+    be read.
+    """
+    def __init__(
+            self,
+            name: str,
+            component: Primitive,
+            inputs: tuple[int],
+            outputs: tuple[int]):
+        self.name = name
+        self.component = component
+        self.inputs = inputs
+        self.outputs = outputs
+        combinational = set(component.get_combinational_inputs())
+        self.dependencies = tuple(
+                wire for pin, wire in zip(component.inputs, inputs)
+                if pin in combinational)
+
+    def set_inputs(self, values: list) -> None:
+        self.component.set_inputs(tuple(values[wire] for wire in self.inputs))
+
+    def evaluate(self, values: list) -> None:
+        if self.dependencies:
+            self.set_inputs(values)
+        comp = self.component
+        for pin, wire in zip(comp.outputs, self.outputs):
+            values[wire] = comp.get_output(pin)
+
+    def update(self, values: list) -> bool:
+        self.set_inputs(values)
+        return self.component.update()
+
+
+class Netlist:
+    """A Component hierarchy flattened into nodes over numbered wires.
+
+    The attributes of a Netlist are:
+
+    - component: the Component it was compiled from.
+    - size: the number of wires.
+    - wires: the wire for each full pin name, like 'CPU.ALU.x[3]'.
+    - inputs, outputs: the wires of the component's own inputs and outputs.
+    - constants: the wire for each constant trit value used.
+    - nodes: every GateNode and OpaqueNode, in an order where each node comes
+      after the nodes it depends on.
+    - blocks: the OpaqueNodes, in the order that Component.update() visits
+      them.
+
+    Raise ValueError if a pin that is needed isn't connected to anything, or
+    if the gates form a loop that doesn't pass through a stateful component.
+    """
+    def __init__(self, component: Primitive):
+        self.component = component
+        self.size = 0
+        self.wires = {}
+        self.constants = {}
+        self.aliases = {}
+        self.inputs = tuple(self.add_wire(name) for name in component.inputs)
+
+        leaves = []
+        self.add_component(component, '', leaves)
+        nodes = [self.make_node(*leaf) for leaf in leaves]
+        self.blocks = [node for node in nodes if isinstance(node, OpaqueNode)]
+        self.outputs = tuple(self.resolve(name) for name in component.outputs)
+        self.nodes = self.sort(nodes)
+
+    def add_wire(self, name: str) -> int:
+        wire = self.size
+        self.size += 1
+        self.wires[name] = wire
+        return wire
+
+    def add_component(self, comp: Primitive, path: str, leaves: list) -> None:
+        """Add a component and its descendants to the netlist.
+
+        The connections of structural components are recorded as aliases of
+        full pin names, and everything else is appended to 'leaves' as a
+        (path, component) pair, with a new wire for each of its outputs.
+        """
+        if not is_structural(comp):
+            for pin in comp.outputs:
+                self.add_wire(join(path, pin))
+            leaves.append((path, comp))
+            return
+
+        for dest, source in comp.connections.items():
+            if source not in CONSTANTS:
+                source = join(path, source)
+            self.aliases[join(path, dest)] = source
+        for name, sub in comp.components.items():
+            self.add_component(sub, join(path, name), leaves)
+
+    def make_node(self, path: str, comp: Primitive) -> GateNode | OpaqueNode:
+        inputs = tuple(self.resolve(join(path, pin)) for pin in comp.inputs)
+        outputs = tuple(self.wires[join(path, pin)] for pin in comp.outputs)
+        if isinstance(comp, Gate):
+            return GateNode(path, comp, inputs, outputs[0])
+        return OpaqueNode(path, comp, inputs, outputs)
+
+    def add_constant(self, value: Trit) -> int:
+        if value not in self.constants:
+            self.constants[value] = self.size
+            self.size += 1
+        return self.constants[value]
+
+    def resolve(self, name: str) -> int:
+        """Return the wire for a full pin name.
+
+        Follow the connections from 'name' back to the gate output, input or
+        constant that drives it, and remember the wire for every name along
+        the way.
+        """
+        chain = []
+        source = name
+        while source not in self.wires:
+            if source in CONSTANTS:
+                wire = self.add_constant(source)
+                break
+            if source not in self.aliases:
+                raise ValueError(
+                        f"Failed to resolve '{name}': "
+                        f"'{source}' is not connected to anything")
+            if source in chain:
+                raise ValueError(
+                        f"Failed to resolve '{name}': "
+                        "its connections form a loop")
+            chain.append(source)
+            source = self.aliases[source]
+        else:
+            wire = self.wires[source]
+        for item in chain:
+            self.wires[item] = wire
+        return wire
+
+    def sort(self, nodes: list) -> list:
+        """Return the nodes in topological order.
+
+        Opaque nodes are put off until no gate is ready, and then all of the
+        ready ones are taken together, so that the gates fall into as few
+        unbroken runs as possible.  Otherwise, nodes that don't depend on one
+        another keep the order they were added in, so the gates of each
+        component stay close together.
+        """
+        drivers = {}
+        for i, node in enumerate(nodes):
+            for wire in node.outputs:
+                drivers[wire] = i
+
+        waiting = [0] * len(nodes)
+        users = [[] for _ in nodes]
+        for i, node in enumerate(nodes):
+            for wire in node.dependencies:
+                if wire in drivers:
+                    waiting[i] += 1
+                    users[drivers[wire]].append(i)
+
+        gates = deque()
+        blocks = deque()
+        for i, count in enumerate(waiting):
+            if not count:
+                self.queue(nodes[i], i, gates, blocks)
+        result = []
+        while gates or blocks:
+            if gates:
+                batch = (gates.popleft(),)
+            else:
+                batch = tuple(blocks)
+                blocks.clear()
+            for i in batch:
+                result.append(nodes[i])
+                for j in users[i]:
+                    waiting[j] -= 1
+                    if not waiting[j]:
+                        self.queue(nodes[j], j, gates, blocks)
+
+        if len(result) < len(nodes):
+            names = [node.name for i, node in enumerate(nodes) if waiting[i]]
+            raise ValueError(
+                    "Combinational loop among the components: "
+                    f"{', '.join(names)}")
+        return result
+
+    @staticmethod
+    def queue(node, index: int, gates: deque, blocks: deque) -> None:
+        if isinstance(node, GateNode):
+            gates.append(index)
+        else:
+            blocks.append(index)
+
+    def get_wire(self, name: str) -> int:
+        """Return the wire for a pin name, relative to the root component."""
+        if name in self.wires:
+            return self.wires[name]
+        return self.resolve(name)
+
+
+class Evaluator:
+    """Run a Netlist over a flat list of wire values.
+
+    An Evaluator has the same interface as a Component, so it can stand in
+    for the Component it was compiled from: set_inputs(), get_outputs(),
+    get_value(), update() and tick().
+
+    The nodes are evaluated in order, once per clock cycle, the first time a
+    value is needed after the inputs change or the clock ticks.  Every value
+    is settled before any opaque node updates its state on a tick.
+    """
+    def __init__(self, netlist: Netlist):
+        self.netlist = netlist
+        self.values = [None] * netlist.size
+        for value, wire in netlist.constants.items():
+            self.values[wire] = value
+        self.settled = False
+
+    def set_inputs(self, inputs: Trits) -> None:
+        for wire, value in zip(self.netlist.inputs, inputs):
+            self.values[wire] = value
+        self.settled = False
+
+    def evaluate(self) -> None:
+        """Work out the value of every wire."""
+        values = self.values
+        for node in self.netlist.nodes:
+            node.evaluate(values)
+        self.settled = True
+
+    def settle(self) -> None:
+        if not self.settled:
+            self.evaluate()
+
+    def get_value(self, name: str) -> Trit:
+        self.settle()
+        return self.values[self.netlist.get_wire(name)]
+
+    def get_outputs(self, inputs: Trits | None = None) -> Trits:
+        if inputs is not None:
+            self.set_inputs(inputs)
+        self.settle()
+        return tuple(self.values[wire] for wire in self.netlist.outputs)
+
+    def update(self) -> bool:
+        self.settle()
+        changed = False
+        for node in self.netlist.blocks:
+            if node.update(self.values):
+                changed = True
+        return changed
+
+    def tick(self) -> bool:
+        changed = self.update()
+        self.settled = False
+        return changed
+
+
+class EventEvaluator(Evaluator):
+    """Run a Netlist by following changes, rather than evaluating it all.
+
+    The first evaluation works out every wire.  From then on, the values are
+    kept from one clock cycle to the next, and only the nodes downstream of
+    a change are evaluated again: the fan-out of any input that set_inputs()
+    changes, and of every opaque node whose update() reports a change on a
+    clock tick.  A node that works out the same value as before stops the
+    change from spreading any further.
+
+    If the state of a component changes behind the evaluator's back, say by
+    loading a program into the ROM, call invalidate() so that the next
+    evaluation starts from scratch.
+
+    'evaluations' counts the nodes evaluated so far.
+    """
+    def __init__(self, netlist: Netlist):
+        super().__init__(netlist)
+        nodes = netlist.nodes
+        self.index = {id(node): i for i, node in enumerate(nodes)}
+        # The nodes that read each wire, within a clock cycle.
+        self.fanout = [[] for _ in range(netlist.size)]
+        for i, node in enumerate(nodes):
+            for wire in set(node.dependencies):
+                self.fanout[wire].append(i)
+        self.queue = []
+        self.queued = [False] * len(nodes)
+        self.evaluations = 0
+
+    def invalidate(self) -> None:
+        """Evaluate every node again, the next time a value is needed."""
+        self.settled = False
+
+    def schedule(self, index: int) -> None:
+        if not self.queued[index]:
+            self.queued[index] = True
+            heapq.heappush(self.queue, index)
+
+    def schedule_fanout(self, wire: int) -> None:
+        for index in self.fanout[wire]:
+            self.schedule(index)
+
+    def set_inputs(self, inputs: Trits) -> None:
+        values = self.values
+        for wire, value in zip(self.netlist.inputs, inputs):
+            if values[wire] != value:
+                values[wire] = value
+                if self.settled:
+                    self.schedule_fanout(wire)
+
+    def evaluate(self) -> None:
+        super().evaluate()
+        self.evaluations += len(self.netlist.nodes)
+        self.queue = []
+        self.queued = [False] * len(self.netlist.nodes)
+
+    def propagate(self) -> None:
+        """Evaluate the scheduled nodes, and whatever their changes reach.
+
+        The queue is ordered by position in the netlist, which is
+        topological, so each node is evaluated at most once, after all of
+        the nodes it depends on.
+        """
+        nodes = self.netlist.nodes
+        values = self.values
+        queue = self.queue
+        queued = self.queued
+        count = 0
+        while queue:
+            index = heapq.heappop(queue)
+            queued[index] = False
+            node = nodes[index]
+            before = [values[wire] for wire in node.outputs]
+            node.evaluate(values)
+            count += 1
+            for wire, value in zip(node.outputs, before):
+                if values[wire] != value:
+                    self.schedule_fanout(wire)
+        self.evaluations += count
+
+    def settle(self) -> None:
+        if not self.settled:
+            self.evaluate()
+        elif self.queue:
+            self.propagate()
+
+    def update(self) -> bool:
+        self.settle()
+        changed = False
+        for node in self.netlist.blocks:
+            if node.update(self.values):
+                changed = True
+                self.schedule(self.index[id(node)])
+        return changed
+
+    def tick(self) -> bool:
+        return self.update()
+
+
+class SlicedEvaluator:
+    """Evaluate a combinational Netlist for many input vectors at once.
+
+    Each wire carries a pair of integer bit planes, (pos, neg), in the same
+    layout as Trits.planes: bit k of 'pos' is set when the wire is positive
+    for vector k, and bit k of 'neg' when it is negative.  Every gate then
+    works on all of the vectors together, with the few integer operations of
+    its operator's planes() function, so a single pass through the netlist
+    evaluates thousands of vectors.
+
+    Opaque nodes hold one state, not one per vector, so a netlist with any
+    of them can't be bit-sliced, and raises ValueError.
+    """
+    def __init__(self, netlist: Netlist):
+        if netlist.blocks:
+            names = ', '.join(node.name or "''" for node in netlist.blocks)
+            raise ValueError(
+                    "Bit-sliced evaluation needs a combinational netlist, "
+                    f"but it has opaque nodes: {names}")
+        self.netlist = netlist
+        self.pos = [0] * netlist.size
+        self.neg = [0] * netlist.size
+        self.count = 0
+
+    def evaluate_planes(
+            self, planes: Iterable[tuple[int, int]], count: int) -> list:
+        """Evaluate the netlist for 'count' vectors, given as bit planes.
+
+        'planes' holds a (pos, neg) pair for each input of the netlist.
+        Return a (pos, neg) pair for each output.
+        """
+        mask = (1 << count) - 1
+        pos = self.pos
+        neg = self.neg
+        for wire, (p, n) in zip(self.netlist.inputs, planes):
+            pos[wire] = p & mask
+            neg[wire] = n & mask
+        for value, wire in self.netlist.constants.items():
+            pos[wire] = mask if value == POS else 0
+            neg[wire] = mask if value == NEG else 0
+
+        for node in self.netlist.nodes:
+            args = []
+            for wire in node.inputs:
+                args.append(pos[wire])
+                args.append(neg[wire])
+            pos[node.output], neg[node.output] = node.operator.planes(
+                    *args, mask)
+        self.count = count
+        return [(pos[wire], neg[wire]) for wire in self.netlist.outputs]
+
+    def evaluate(self, vectors: Sequence[Trits]) -> list[tuple]:
+        """Return the outputs for each of a sequence of input vectors."""
+        count = len(vectors)
+        planes = []
+        for i in range(len(self.netlist.inputs)):
+            column = ''.join(vector[i] for vector in vectors)
+            # Vector k goes in bit k, which is the k-th trit from the right.
+            planes.append(trit.Trits.from_glyphs(column[::-1]).planes)
+        return self.unpack(self.evaluate_planes(planes, count), count)
+
+    def truth_table(self) -> list[tuple]:
+        """Return the outputs for every combination of inputs.
+
+        The combinations are in the same order as itertools.product(), with
+        the first input varying the slowest.
+        """
+        size = len(self.netlist.inputs)
+        count = 3 ** size
+        planes = []
+        for i in range(size):
+            run = 3 ** (size - 1 - i)
+            column = ''.join(glyph * run for glyph in GLYPHS) * 3 ** i
+            planes.append(trit.Trits.from_glyphs(column[::-1]).planes)
+        return self.unpack(self.evaluate_planes(planes, count), count)
+
+    @staticmethod
+    def unpack(planes: list, count: int) -> list[tuple]:
+        """Turn (pos, neg) planes, one pair per output, into vectors."""
+        columns = [
+                trit.Trits.planes_to_glyphs(p, n, count)[::-1]
+                for p, n in planes]
+        return list(zip(*columns))
+
+    def get_planes(self, name: str) -> tuple[int, int]:
+        """Return the planes of any wire from the last evaluation."""
+        wire = self.netlist.get_wire(name)
+        return (self.pos[wire], self.neg[wire])
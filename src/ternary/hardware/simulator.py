@@ -5,8 +5,12 @@ import sys
 from traceback import print_exc
 
 from ternary import binary
+from ternary.hardware.codegen import CompiledEvaluator
 from ternary.hardware.computer import Computer
-from ternary.hardware.util import int_to_trits, trits_to_int, input_stream
+from ternary.hardware.netlist import Netlist
+from ternary.hardware.util import (
+        int_to_trits, trits_to_int, input_stream, parse_code)
+from ternary.trit import ZERO, POS
 
 
 MIN_ADDR = -(3 ** 11 // 2)
@@ -20,14 +24,9 @@ class Simulator:
 
     def load_binary(self, stream) -> None:
         """Load a program encoded in binary format."""
-        program = str(binary.decode(stream.read()))
-        length = len(program)
-        if length % 12 != 0:
-            raise ValueError(
-                    "Invalid length for binary-encoded program: "
-                    f"expected a multiple of 12 but got {length}")
-        self.computer.load_program(program)
-        self.program_length = length // 12
+        words = binary.decode_words(stream.read())
+        self.computer.load_program(words)
+        self.program_length = len(words)
 
     def load_text(self, stream: io.TextIOBase) -> None:
         """Load a program encoded in text format."""
@@ -37,12 +36,7 @@ class Simulator:
             if not line:
                 continue
             self.sources.append(line)
-            code = line[:12]
-            if any(c not in '-0+' for c in code):
-                raise ValueError(
-                        f"Invalid characters in '{line}': expected only "
-                        "-, 0 and + in the first 12 characters of each line")
-            codes.append(code)
+            codes.append(parse_code(line))
         program = ''.join(codes)
         self.computer.load_program(program)
         self.program_length = len(codes)
@@ -64,12 +58,19 @@ class Simulator:
         The simulator will continue to cycle the computer until it tries to
         access a program address beyond the end of the program, at which point
         we will terminate.
+
+        The computer is run from code generated for its netlist, rather than
+        through Computer.step(), which gives the same results many times
+        faster.
         """
         exit_address = MIN_ADDR + self.program_length
-        self.computer.reset()
+        runner = CompiledEvaluator(Netlist(self.computer))
+        runner.set_inputs(POS)
+        runner.tick()
+        runner.set_inputs(ZERO)
         pc = trits_to_int(self.computer.get_program_address())
         while pc < exit_address:
-            self.computer.step()
+            runner.tick()
             pc = trits_to_int(self.computer.get_program_address())
 
     def get_ram_contents(self, index: int) -> int:
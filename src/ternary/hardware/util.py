@@ -3,7 +3,8 @@ from collections.abc import Iterable
 from contextlib import contextmanager
 from typing import Literal
 
-from ternary.trit import ZERO, POS, NEG
+from ternary.integer import glyphs_to_int, int_to_glyphs
+from ternary.trit import ZERO, POS, NEG, parse_glyphs
 
 
 Trit = Literal[NEG, ZERO, POS]
@@ -72,20 +73,31 @@ def output_stream(path, binary: bool = False):
             fp.close()
 
 
+def parse_code(line: str) -> str:
+    """Return the machine code word at the start of a line of program text.
+
+    The first WORD_SIZE characters of the line must all be trits.  Any of the
+    single-character inputs accepted by Trit.make() may be used, and they are
+    normalised to the glyphs -, 0 and +.
+    """
+    try:
+        return parse_glyphs(line[:WORD_SIZE])
+    except ValueError:
+        raise ValueError(
+                f"Invalid characters in '{line}': expected only trits "
+                f"in the first {WORD_SIZE} characters of each line"
+                ) from None
+
+
 def trits_to_int(trits: Trits) -> int:
     """Convert a sequence of trits into a Python integer.
 
     The trits are interpreted in arithmetic order, from most signficant to
     least significant.
     """
-    result = 0
-    scale = 1
-    for t in reversed(trits):
-        if t != ZERO:
-            value = 1 if t == POS else -1
-            result += value * scale
-        scale *= 3
-    return result
+    if not isinstance(trits, str):
+        trits = ''.join(trits)
+    return glyphs_to_int(trits)
 
 
 def int_to_trits(n: int, size: int) -> Trits:
@@ -99,18 +111,7 @@ def int_to_trits(n: int, size: int) -> Trits:
     """
     if size <= 0:
         raise ValueError(f"Invalid trit size {size}")
-    trit_map = '-0+'
-    m = (3 ** size) // 2
-    if n < -m or n > m:
-        raise ValueError(f"Integer {n} cannot be represented in {size} trits")
-
-    # Shift to an unsigned equivalent
-    x = n + m
-    result = []
-    for _ in range(size):
-        x, rem = divmod(x, 3)
-        result.append(trit_map[rem])
-    return ''.join(reversed(result))
+    return int_to_glyphs(n, size)
 
 
 def trits_to_colour(t: Trits) -> str:
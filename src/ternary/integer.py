@@ -36,10 +36,123 @@ value:
       = (2 * 3) + (1 * 1)
       = 7
 """
-import math
 import numbers
 
-from ternary import trit
+from ternary import trit, tryte
+
+
+# Numbers of up to this many trits are converted directly, above it we divide
+# and conquer.
+DIRECT_SIZE = 1024
+# Cached powers of three, where POWERS[j] == 3 ** (2 ** j).
+POWERS = [3]
+
+
+def square_power(j):
+    """Return 3 ** (2 ** j), from the cached table of powers."""
+    while len(POWERS) <= j:
+        POWERS.append(POWERS[-1] * POWERS[-1])
+    return POWERS[j]
+
+
+def split_size(length):
+    """Return the index j of the largest power of two less than 'length'."""
+    return (length - 1).bit_length() - 1
+
+
+def to_digits(value, length):
+    """Return the unsigned ternary digits of 'value', as a string of '012'.
+
+    The result has exactly 'length' digits, so 'value' must be non-negative
+    and less than 3 ** length.
+
+    Small values are converted a whole tryte at a time by table lookup.  For
+    large values we split the value around a cached power of three, and
+    convert both halves recursively.
+    """
+    if length > DIRECT_SIZE:
+        j = split_size(length)
+        high, low = divmod(value, square_power(j))
+        return to_digits(high, length - (1 << j)) + to_digits(low, 1 << j)
+
+    chunks = []
+    while value:
+        value, remain = divmod(value, tryte.COUNT)
+        chunks.append(tryte.DIGITS[remain])
+    chunks.reverse()
+    return ''.join(chunks)[-length:].zfill(length) if length else ''
+
+
+def from_digits(digits):
+    """Return the integer value of a string of unsigned ternary digits."""
+    length = len(digits)
+    if length > DIRECT_SIZE:
+        j = split_size(length)
+        split = length - (1 << j)
+        return (
+                from_digits(digits[:split]) * square_power(j) +
+                from_digits(digits[split:]))
+    return int(digits, 3) if digits else 0
+
+
+def half_range(length):
+    """Return the largest integer that can be represented in 'length' trits.
+
+    With balanced trits, this is (3 ** length - 1) / 2, and the smallest
+    integer is its negative.
+    """
+    return 3 ** length // 2
+
+
+def unsigned_order(integer):
+    """Return the number of unsigned ternary digits in 'integer'.
+
+    That is, the smallest length such that 3 ** length > integer.
+    """
+    # Start from an estimate based on the bit length, then correct it.
+    # log(2) / log(3) is a little over 0.63.
+    length = integer.bit_length() * 63 // 100
+    while 3 ** length <= integer:
+        length += 1
+    while length > 0 and 3 ** (length - 1) > integer:
+        length -= 1
+    return length
+
+
+def order(integer):
+    """Return the number of trits required to represent 'integer'.
+
+    Zero requires no trits at all.
+    """
+    # Balanced trits can represent 'integer' when 3 ** length > 2 * |integer|.
+    return unsigned_order(2 * abs(integer))
+
+
+def int_to_glyphs(integer, length=None):
+    """Return the balanced ternary glyphs of a Python integer.
+
+    If 'length' is given, the result has exactly that many trits, and
+    'integer' must fit in them.  Otherwise, the result has as many trits as
+    required, and at least one.
+
+    This is just the unsigned representation of 'integer' shifted by the
+    largest value of that length, since shifting by (3 ** length - 1) / 2
+    adds one to every trit.
+    """
+    if length is None:
+        length = max(order(integer), 1)
+    half = half_range(length)
+    if not -half <= integer <= half:
+        raise ValueError(
+                "Integer {} cannot be represented in {} trits".format(
+                    integer, length))
+    return to_digits(integer + half, length).translate(tryte.DIGIT_GLYPHS)
+
+
+def glyphs_to_int(glyphs):
+    """Return the Python integer value of a string of balanced trit glyphs."""
+    digits = glyphs.translate(tryte.GLYPH_DIGITS)
+    return from_digits(digits) - half_range(len(digits))
 
 
 class IntMixin(object):
@@ -57,57 +170,35 @@ class IntMixin(object):
 
 
 class Int(IntMixin, trit.Trits):
+    KARATSUBA_THRESHOLD = 40
+    TOOM3_THRESHOLD = 300
+
     def __init__(self, trits, length=None):
         if isinstance(trits, numbers.Integral):
-            if trits == 0:
-                trits = [trit.TRIT_ZERO]
-            else:
-                integer = trits
-                trits = []
-                power = self.order(integer) - 1
-                while power >= 0:
-                    if integer == 0 or self.order(integer) <= power:
-                        item = trit.TRIT_ZERO
-                    elif integer < 0:
-                        item = trit.TRIT_NEG
-                    else:
-                        item = trit.TRIT_POS
-                    trits.append(item)
-                    integer -= int(item) * (3 ** power)
-                    power -= 1
+            trits = trit.Trits.from_glyphs(int_to_glyphs(trits))
         super(Int, self).__init__(trits, length)
         self.integer = None
 
     @staticmethod
     def order(integer):
         """Return the number of trits required to represent 'integer'."""
-        return int(math.ceil(math.log(2 * abs(integer), 3)))
+        return order(integer)
 
     def is_negative(self):
-        for t in self:
-            if t == trit.TRIT_NEG:
-                return True
-            if t == trit.TRIT_POS:
-                return False
-        return False
+        # The sign is given by the most significant non-zero trit, which is
+        # whichever of the two bit planes reaches higher.
+        pos, neg = self.planes
+        return neg.bit_length() > pos.bit_length()
 
     def __int__(self):
         if self.integer is None:
-            self.integer = 0
-            for i in range(len(self)):
-                if self[i] == trit.TRIT_ZERO:
-                    continue
-                power = len(self) - 1 - i
-                self.integer += int(self[i]) * (3 ** power)
+            self.integer = glyphs_to_int(self.glyphs)
         return self.integer
 
     def __abs__(self):
         """Return the absolute value of this Int."""
-        for t in self.trits:
-            if t == trit.TRIT_NEG:
-                return -self
-            elif t == trit.TRIT_POS:
-                return self
+        if self.is_negative():
+            return -self
         return self
 
     def __add__(self, other):
@@ -115,28 +206,161 @@ class Int(IntMixin, trit.Trits):
 
         Obviously I could just add the integer equivalents of the two Ints
         together, and then encode the result as an Int, but that's no fun at
-        all.
+        all.  Instead we add the trits a whole tryte at a time, using the
+        tables in the tryte module.
         """
-        a, b = trit.Trits.match_length(self, other)
-        results = []
-        carry = trit.TRIT_ZERO
-        for x, y in reversed(list(zip(a, b))):
-            result, carry = x.add(y, carry)
-            results.append(result)
-        if carry != trit.TRIT_ZERO:
-            results.append(carry)
-        return Int(reversed(results))
+        if not isinstance(other, trit.Trits):
+            other = Int(other)
+        return Int.from_sum(*tryte.add(self.glyphs, other.glyphs))
 
     def __sub__(self, other):
         """Return the difference of two Ints as an Int."""
-        return self.__add__(-other)
+        if not isinstance(other, trit.Trits):
+            other = Int(other)
+        return Int.from_sum(*tryte.subtract(self.glyphs, other.glyphs))
+
+    @classmethod
+    def from_sum(cls, glyphs, carry):
+        """Return an Int from the result of tryte.add() or tryte.subtract().
+
+        A carry-out, if any, becomes an extra trit on the left.
+        """
+        if carry:
+            glyphs = trit.GLYPHS[carry + 1] + glyphs
+        return cls.from_glyphs(glyphs)
+
+    def cmp(self, other):
+        """Compare two integers by value, a tryte at a time."""
+        if not isinstance(other, trit.Trits):
+            other = Int(other)
+        return tryte.compare(self.glyphs, other.glyphs)
 
     def __mul__(self, other):
-        """Return the product of two Ints as an Int."""
-        result = Int([trit.TRIT_ZERO])
+        """Return the product of two Ints as an Int.
+
+        Small operands are multiplied by the schoolbook method.  When both
+        operands reach KARATSUBA_THRESHOLD trits we switch to Karatsuba
+        multiplication, and at TOOM3_THRESHOLD trits to Toom-3.  Both
+        thresholds are class attributes, and may be adjusted to tune
+        performance.
+        """
         # Short circuit if either operand happens to be zero.
-        if self == result or other == result:
-            return result
+        if self.is_zero() or other.is_zero():
+            return INT_ZERO
+        a = self.trim()
+        b = Int(other).trim()
+        # The splitting methods only pay off when both operands are long, and
+        # the schoolbook method costs one addition per trit of its first
+        # operand, so let the shorter operand decide.
+        if len(a) > len(b):
+            a, b = b, a
+        size = len(a)
+        if size >= self.TOOM3_THRESHOLD:
+            return a.toom3_multiply(b)
+        if size >= self.KARATSUBA_THRESHOLD:
+            return a.karatsuba_multiply(b)
+        return a.schoolbook_multiply(b)
+
+    def split(self, size):
+        """Split this Int into its high and low parts around 'size' trits.
+
+        Return a tuple (high, low) such that self == high * 3**size + low.  In
+        balanced ternary, every trit carries its own sign, so this is exact
+        with no borrowing: the low part is just the rightmost 'size' trits.
+        """
+        pos, neg = self.planes
+        high = Int.from_planes(
+                pos >> size, neg >> size, max(len(self) - size, 0))
+        low = Int.from_planes(pos, neg, min(len(self), size))
+        return (high, low)
+
+    def halve(self):
+        """Return this Int divided by two.
+
+        The division must be exact, otherwise we raise a ValueError.
+
+        We work from the least significant trit up.  Each trit of the result
+        is the one which, when doubled and added to the carry, matches the
+        trit of this Int modulo 3.  The carry is always -1, 0 or 1, so this
+        takes linear time.
+        """
+        digits = []
+        carry = 0
+        for t in reversed(self.trits):
+            value = int(t)
+            digit = (carry - value + 1) % 3 - 1
+            carry = (2 * digit + carry - value) // 3
+            digits.append(digit)
+        # The result has no more trits than this Int, so if the division is
+        # exact, there is nothing left in the carry.
+        if carry:
+            raise ValueError("{!r} is not divisible by two.".format(self))
+        digits.reverse()
+        return Int(digits)
+
+    def karatsuba_multiply(self, other):
+        """Return the product of two Ints by Karatsuba multiplication.
+
+        Each operand is split into a high and low half, and the product is
+        assembled from three half-size products instead of four:
+
+            (a1 x + a0)(b1 x + b0) = z2 x**2 + z1 x + z0
+
+        where z2 = a1 b1, z0 = a0 b0 and z1 = (a1 + a0)(b1 + b0) - z2 - z0.
+        """
+        size = (max(len(self), len(other)) + 1) // 2
+        a1, a0 = self.split(size)
+        b1, b0 = other.split(size)
+        z2 = a1 * b1
+        z0 = a0 * b0
+        z1 = (a1 + a0) * (b1 + b0) - z2 - z0
+        return Int(z2 << (2 * size)) + Int(z1 << size) + z0
+
+    def toom3_multiply(self, other):
+        """Return the product of two Ints by Toom-3 multiplication.
+
+        Each operand is split into three parts, and treated as a polynomial
+        in x = 3**k.  We evaluate both polynomials at the points 0, 1, -1, -2
+        and infinity, multiply the values pointwise (five products of
+        one-third size), and then interpolate the coefficients of the product
+        polynomial, using the evaluation and interpolation sequence of Marco
+        Bodrato.
+
+        Base 3 suits Toom-3 nicely: splitting is exact, and the divisions by
+        3 in the interpolation are just right shifts.
+        """
+        size = (max(len(self), len(other)) + 2) // 3
+
+        def evaluate(value):
+            high, low = value.split(size)
+            a2, a1 = high.split(size)
+            p = low + a2
+            m1 = p - a1
+            return (
+                    low,
+                    p + a1,
+                    m1,
+                    (m1 + a2) + (m1 + a2) - low,
+                    a2)
+
+        products = [x * y for x, y in zip(evaluate(self), evaluate(other))]
+        r0, r1, rm1, rm2, rinf = products
+
+        r3 = third(rm2 - r1)
+        r1 = (r1 - rm1).halve()
+        r2 = rm1 - r0
+        r3 = (r2 - r3).halve() + rinf + rinf
+        r2 = r2 + r1 - rinf
+        r1 = r1 - r3
+
+        result = r0
+        for i, coefficient in enumerate((r1, r2, r3, rinf), 1):
+            result += Int(coefficient << (i * size))
+        return result
+
+    def schoolbook_multiply(self, other):
+        """Return the product of two Ints by long multiplication."""
+        result = Int([trit.TRIT_ZERO])
         for i in range(len(self)):
             if self[i] == trit.TRIT_ZERO:
                 continue
@@ -190,11 +414,56 @@ class Int(IntMixin, trit.Trits):
         if self.is_negative():
             quotient, remain = (-self).__divmod__(other)
             return (-quotient, -remain)
-        remain = Int(self)
-        quotient = INT_ZERO
-        while remain >= other:
-            remain -= other
-            quotient += INT_ONE
+        return self.long_divide(other)
+
+    def long_divide(self, other):
+        """Return the quotient and remainder of two positive Ints.
+
+        This is long division, working from the most significant trit of the
+        quotient to the least.  At each position, we subtract the divisor
+        (shifted to that position) from the remainder if that brings the
+        remainder closer to zero, or add it if the remainder is negative and
+        adding brings it closer to zero.  The quotient trit is +, - or 0
+        accordingly.
+
+        In balanced ternary, this always leaves a remainder no larger than half
+        the divisor in magnitude, which may be negative.  For the truncated
+        quotient, a negative remainder is then corrected by one more step
+        towards zero.
+
+        Each position costs one addition, so the whole division is quadratic
+        in the length of the operands.
+        """
+        dividend = self.trim()
+        divisor = other.trim()
+        # One extra trit position is enough to guarantee that the first
+        # remainder is within reach of the shifted divisor.
+        shift = max(len(dividend) - len(divisor) + 1, 0)
+        step = Int(divisor << shift)
+        remain = Int(dividend)
+        digits = []
+        for _ in range(shift + 1):
+            digit = trit.TRIT_ZERO
+            if not remain.is_zero():
+                if remain.is_negative():
+                    candidate = remain + step
+                    sign = trit.TRIT_NEG
+                else:
+                    candidate = remain - step
+                    sign = trit.TRIT_POS
+                if abs(candidate) < abs(remain):
+                    remain = candidate
+                    digit = sign
+            digits.append(digit)
+            step = Int(step >> 1)
+
+        quotient = Int(digits)
+        if remain.is_negative():
+            quotient -= INT_ONE
+            remain += divisor
+        quotient = quotient.trim()
+        if quotient.is_zero():
+            quotient = INT_ZERO
         return (quotient, remain)
 
     def __floordiv__(self, other):
@@ -212,6 +481,62 @@ class Int(IntMixin, trit.Trits):
         """
         return self.__divmod__(other)[1]
 
+    def __pow__(self, exponent, modulus=None):
+        """Return this Int raised to the power of 'exponent'.
+
+        The power is found by square-and-multiply, working through the binary
+        digits of the exponent from the most significant, so it takes a number
+        of multiplications proportional to the length of the exponent rather
+        than its value.  The exponent must not be negative, since an Int
+        cannot represent a fraction.
+
+        If 'modulus' is given, every intermediate result is reduced modulo
+        'modulus' as it goes, using the same truncated division as
+        __divmod__.  The result therefore has the same sign as the full power,
+        and may be negative:
+
+        >>> pow(-2, 3, 5)
+        2
+        >>> pow(Int(-2), 3, Int(5))
+        Int('-0')
+        """
+        exponent = int(exponent)
+        if exponent < 0:
+            raise ValueError(
+                    "Cannot raise {!r} to negative power {}.".format(
+                        self, exponent))
+        if modulus is not None:
+            if not isinstance(modulus, Int):
+                modulus = Int(modulus)
+            if modulus.is_zero():
+                raise ValueError("pow() modulus must not be zero.")
+
+        def reduce(value):
+            if modulus is None:
+                return value
+            return value % modulus
+
+        base = reduce(self)
+        result = reduce(INT_ONE)
+        for bit in bin(exponent)[2:]:
+            result = reduce(result * result)
+            if bit == '1':
+                result = reduce(result * base)
+        if result.is_zero():
+            return INT_ZERO
+        return result.trim()
+
+    def __rpow__(self, other, modulus=None):
+        return Int(other).__pow__(self, modulus)
+
+
+def third(value):
+    """Return an Int divided by three, which must be exact."""
+    pos, neg = value.planes
+    if (pos | neg) & 1:
+        raise ValueError("{!r} is not divisible by three.".format(value))
+    return Int(value >> 1)
+
 
 class UInt(IntMixin, trit.Trits):
     def __init__(self, trits, length=None):
@@ -220,18 +545,11 @@ class UInt(IntMixin, trit.Trits):
                 raise ValueError(
                         "Cannot instantiate an unsigned integer with "
                         "negative value {}.".format(trits))
-            integer = trits
-            trits = []
-            while integer != 0 or len(trits) == 0:
-                (integer, remain) = divmod(integer, 3)
-                if remain == 0:
-                    value = trit.TRIT_NEG
-                elif remain == 1:
-                    value = trit.TRIT_ZERO
-                else:
-                    value = trit.TRIT_POS
-                trits.append(value)
-            trits.reverse()
+            # Unsigned digits 0, 1 and 2 are written with the glyphs -, 0
+            # and + respectively.
+            size = max(unsigned_order(trits), 1)
+            trits = trit.Trits.from_glyphs(
+                    to_digits(trits, size).translate(tryte.DIGIT_GLYPHS))
         if length is not None and length > len(trits):
             trits = ([trit.TRIT_NEG] * (length - len(trits))) + list(trits)
         super(UInt, self).__init__(trits, length)
@@ -239,18 +557,249 @@ class UInt(IntMixin, trit.Trits):
 
     def __int__(self):
         if self.integer is None:
-            self.integer = 0
-            for i in range(len(self)):
-                if self[i] == trit.TRIT_NEG:
-                    continue
-                power = len(self) - 1 - i
-                self.integer += (int(self[i]) + 1) * (3 ** power)
+            digits = self.glyphs.translate(tryte.GLYPH_DIGITS)
+            self.integer = from_digits(digits)
         return self.integer
 
     def __abs__(self):
         return self
 
 
+class IntN(IntMixin):
+    """A fixed-width balanced ternary word, with wrap-around arithmetic.
+
+    IntN is the base class for word types of a particular width.  Get the
+    type for a width with IntN.sized(), or use one of the pre-built types
+    such as Int12.  Each word stores its value as a Python integer, and only
+    produces trits when they are asked for.
+
+    A word may be initialised from an integer, an IntN, or a sequence of
+    trits.  Values that are too large for the word are wrapped around, which
+    in balanced ternary is the same as discarding the excess trits on the
+    left.
+
+    The arithmetic operators (+, -, *, <<, >>) also wrap around silently.  To
+    find out what was lost, use the add(), sub(), mul(), shift_left() and
+    shift_right() methods, which report the carry or overflow as well.
+    """
+    WIDTH = None
+    MAX = None
+    RANGE = None
+    TRYTES = None
+    types = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.WIDTH is not None:
+            cls.MAX = half_range(cls.WIDTH)
+            cls.RANGE = 3 ** cls.WIDTH
+            cls.TRYTES = -(-cls.WIDTH // tryte.SIZE)
+            IntN.types.setdefault(cls.WIDTH, cls)
+
+    @classmethod
+    def sized(cls, width):
+        """Return the word type for 'width' trits, creating it if needed."""
+        if not isinstance(width, numbers.Integral) or width <= 0:
+            raise ValueError(
+                    "Invalid word width {!r}; width must be a positive "
+                    "integer.".format(width))
+        if width not in IntN.types:
+            type('Int{}'.format(width), (IntN,), {'WIDTH': width})
+        return IntN.types[width]
+
+    @classmethod
+    def wrap(cls, value):
+        """Return the integer 'value' wrapped into the range of this word."""
+        return (value + cls.MAX) % cls.RANGE - cls.MAX
+
+    @classmethod
+    def from_planes(cls, pos, neg):
+        """Return a word from a pair of bit planes, as used by Trits."""
+        value = 0
+        mask = (1 << tryte.SIZE) - 1
+        for i in range(cls.TRYTES - 1, -1, -1):
+            shift = i * tryte.SIZE
+            planes = ((pos >> shift) & mask, (neg >> shift) & mask)
+            value = value * tryte.COUNT + tryte.PLANE_VALUES[planes]
+        return cls(value)
+
+    def __init__(self, value=0):
+        if self.WIDTH is None:
+            raise TypeError(
+                    "IntN has no width, use IntN.sized() to get a word type.")
+        if isinstance(value, IntN):
+            value = value.value
+        elif not isinstance(value, numbers.Integral):
+            value = glyphs_to_int(trit.Trits(value).glyphs)
+        self.value = self.wrap(int(value))
+
+    def __int__(self):
+        return self.value
+
+    def __bool__(self):
+        return self.value != 0
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __str__(self):
+        return int_to_glyphs(self.value, self.WIDTH)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, str(self))
+
+    def __len__(self):
+        return self.WIDTH
+
+    @property
+    def trits(self):
+        """This word as a Trits sequence."""
+        return trit.Trits.from_glyphs(str(self))
+
+    @property
+    def planes(self):
+        """This word as a pair of bit planes (pos, neg), as used by Trits."""
+        unsigned = self.value + self.MAX
+        pos = 0
+        neg = 0
+        for i in range(self.TRYTES):
+            unsigned, index = divmod(unsigned, tryte.COUNT)
+            p, n = tryte.PLANES[index]
+            pos |= p << (i * tryte.SIZE)
+            neg |= n << (i * tryte.SIZE)
+        mask = (1 << self.WIDTH) - 1
+        return (pos & mask, neg & mask)
+
+    def __eq__(self, other):
+        if isinstance(other, (IntN, numbers.Integral)):
+            return self.value == int(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        return self.value < int(other)
+
+    def __le__(self, other):
+        return self.value <= int(other)
+
+    def __gt__(self, other):
+        return self.value > int(other)
+
+    def __ge__(self, other):
+        return self.value >= int(other)
+
+    def add(self, other, carry=0):
+        """Add two words with an optional carry-in.
+
+        Return a 2-tuple of (sum, carry-out), where the carry-out is -1, 0 or
+        1.
+        """
+        total = self.value + int(other) + int(carry)
+        result = self.__class__(total)
+        return (result, (total - result.value) // self.RANGE)
+
+    def sub(self, other, borrow=0):
+        """Subtract a word, with an optional borrow-in.
+
+        Return a 2-tuple of (difference, borrow-out), with the borrow given as
+        a carry: -1, 0 or 1.
+        """
+        return self.add(-int(other), -int(borrow))
+
+    def mul(self, other):
+        """Multiply two words.
+
+        Return a 2-tuple of (low, high) words, where 'low' is the wrapped
+        product and 'high' is the overflow, such that the full product is
+        high * RANGE + low.
+        """
+        total = self.value * int(other)
+        low = self.__class__(total)
+        return (low, self.__class__((total - low.value) // self.RANGE))
+
+    def shift_left(self, places=1):
+        """Shift this word 'places' trits to the left.
+
+        Return a 2-tuple of (result, carry-out), where the carry-out is the
+        integer value of the trits that were shifted out on the left.
+        """
+        total = self.value * 3 ** places
+        result = self.__class__(total)
+        return (result, (total - result.value) // self.RANGE)
+
+    def shift_right(self, places=1):
+        """Shift this word 'places' trits to the right.
+
+        Return a 2-tuple of (result, carry-out), where the carry-out is the
+        integer value of the trits that were shifted out on the right.
+        """
+        scale = 3 ** places
+        low = (self.value + scale // 2) % scale - scale // 2
+        return (self.__class__((self.value - low) // scale), low)
+
+    def __add__(self, other):
+        return self.__class__(self.value + int(other))
+
+    def __sub__(self, other):
+        return self.__class__(self.value - int(other))
+
+    def __mul__(self, other):
+        return self.__class__(self.value * int(other))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other):
+        return self.__class__(int(other) - self.value)
+
+    def __neg__(self):
+        return self.__class__(-self.value)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self.__class__(abs(self.value))
+
+    def __lshift__(self, places):
+        return self.shift_left(places)[0]
+
+    def __rshift__(self, places):
+        return self.shift_right(places)[0]
+
+    def logic(self, other):
+        if not isinstance(other, IntN):
+            other = self.__class__(other)
+        return self.planes + other.planes
+
+    def __and__(self, other):
+        """Return the tritwise AND of two words."""
+        ap, an, bp, bn = self.logic(other)
+        return self.from_planes(ap & bp, an | bn)
+
+    def __or__(self, other):
+        """Return the tritwise OR of two words."""
+        ap, an, bp, bn = self.logic(other)
+        return self.from_planes(ap | bp, an & bn)
+
+    def __xor__(self, other):
+        """Return the tritwise XOR of two words."""
+        ap, an, bp, bn = self.logic(other)
+        return self.from_planes((ap & bn) | (an & bp), (ap & bp) | (an & bn))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self):
+        """Return the tritwise NOT of this word, which is its negation."""
+        return -self
+
+
+class Int12(IntN):
+    """A 12-trit word, the word size of the hardware computer."""
+    WIDTH = 12
+
+
 INT_ZERO = Int([trit.TRIT_ZERO])
 INT_ONE = Int([trit.TRIT_POS])
 INT_NEG_ONE = Int([trit.TRIT_NEG])
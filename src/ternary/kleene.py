@@ -0,0 +1,568 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Kleene logic formulas
+=====================
+
+This module evaluates formulas in Kleene's three-valued logic, the same logic
+that Trit implements, over whole columns of trits at once.  The zero trit is
+the 'unknown' value, much like NULL in SQL.
+
+A formula may be parsed from text, using the same operators as Python, from
+the lowest to the highest precedence:
+
+| operator | meaning |
+| ----     | ----    |
+| `a | b`  | OR      |
+| `a ^ b`  | XOR     |
+| `a & b`  | AND     |
+| `~a`     | NOT     |
+
+Names are variables, and the glyphs '-', '0' and '+' are constants.  The same
+formula can also be built from Variable objects with the Python operators:
+
+    >>> a, b, c = variables('a b c')
+    >>> formula = compile(a & ~b | c)
+    >>> formula(a='+0-+', b='--0+', c='0-00')
+    Trits('+000')
+
+compile() turns a formula into a Formula, a pipeline of steps, each of which
+applies one operation to whole columns.  Repeated subexpressions are only
+computed once, and constant operands are folded away where the logic allows.
+Each column is a Trits, a list of trits, a string of glyphs, or a NumPy array
+(or TritArray).  The steps work on the packed bit planes of Trits, so each
+step costs a few big integer operations rather than a call per trit.
+
+A Formula with only a few variables also has a composed lookup table, giving
+its value for every combination of inputs.  NumPy columns are evaluated by
+indexing into that table with all of the variables at once.
+"""
+import re
+from itertools import product
+
+from ternary import array, trit
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+NOT = '~'
+AND = '&'
+XOR = '^'
+OR = '|'
+PRECEDENCE = {OR: 1, XOR: 2, AND: 3, NOT: 4}
+# Formulas with up to this many variables get a composed lookup table, of
+# 3 ** n entries.
+MAX_TABLE_VARIABLES = 8
+TOKEN = re.compile(r'\s*(?:([A-Za-z_]\w*)|([-0+])|([~&^|()]))')
+
+
+def to_expression(value):
+    """Return 'value' as an Expression.
+
+    Expressions are returned as they are, strings are parsed as formulas, and
+    anything else is made into a constant trit.
+    """
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, str):
+        return parse(value)
+    return Constant(value)
+
+
+def variables(names):
+    """Return a tuple of Variables, from a string of space-separated names."""
+    return tuple(Variable(name) for name in names.split())
+
+
+class Expression(object):
+    """Abstract base class for the nodes of a Kleene logic formula."""
+    def __and__(self, other):
+        return Operation(AND, self, to_expression(other))
+
+    def __rand__(self, other):
+        return Operation(AND, to_expression(other), self)
+
+    def __or__(self, other):
+        return Operation(OR, self, to_expression(other))
+
+    def __ror__(self, other):
+        return Operation(OR, to_expression(other), self)
+
+    def __xor__(self, other):
+        return Operation(XOR, self, to_expression(other))
+
+    def __rxor__(self, other):
+        return Operation(XOR, to_expression(other), self)
+
+    def __invert__(self):
+        return Operation(NOT, self)
+
+    __neg__ = __invert__
+
+    def __repr__(self):
+        return "parse({!r})".format(str(self))
+
+    @property
+    def variables(self):
+        """The names of the variables, in order of their first appearance."""
+        raise NotImplementedError()
+
+    @property
+    def key(self):
+        """A hashable key that is equal for identical expressions."""
+        raise NotImplementedError()
+
+    def evaluate(self, values):
+        """Return the value of the formula for one Trit per variable.
+
+        'values' must map every variable name to a value that Trit.make()
+        accepts.
+        """
+        raise NotImplementedError()
+
+    def compile(self):
+        return Formula(self)
+
+
+class Variable(Expression):
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def variables(self):
+        return (self.name,)
+
+    @property
+    def key(self):
+        return ('var', self.name)
+
+    def evaluate(self, values):
+        return trit.Trit.make(values[self.name])
+
+
+class Constant(Expression):
+    def __init__(self, value):
+        self.value = trit.Trit.make(value)
+
+    def __str__(self):
+        return str(self.value)
+
+    @property
+    def variables(self):
+        return ()
+
+    @property
+    def key(self):
+        return ('const', self.value.value)
+
+    def evaluate(self, values):
+        return self.value
+
+
+class Operation(Expression):
+    """A NOT of one operand, or an AND, OR or XOR of two."""
+    def __init__(self, operator, *operands):
+        self.operator = operator
+        self.operands = operands
+
+    def __str__(self):
+        precedence = PRECEDENCE[self.operator]
+        parts = []
+        for operand in self.operands:
+            text = str(operand)
+            if (
+                    isinstance(operand, Operation) and
+                    PRECEDENCE[operand.operator] < precedence):
+                text = '(' + text + ')'
+            parts.append(text)
+        if self.operator == NOT:
+            return NOT + parts[0]
+        return ' {} '.format(self.operator).join(parts)
+
+    @property
+    def variables(self):
+        result = {}
+        for operand in self.operands:
+            result.update(dict.fromkeys(operand.variables))
+        return tuple(result)
+
+    @property
+    def key(self):
+        keys = [operand.key for operand in self.operands]
+        if self.operator != NOT:
+            # All of the binary operations are commutative.
+            keys.sort()
+        return (self.operator,) + tuple(keys)
+
+    def evaluate(self, values):
+        operands = [x.evaluate(values) for x in self.operands]
+        if self.operator == NOT:
+            return -operands[0]
+        a, b = operands
+        if self.operator == AND:
+            return a & b
+        if self.operator == OR:
+            return a | b
+        return a ^ b
+
+
+def parse(text):
+    """Parse a Kleene logic formula from a string, and return an Expression.
+
+    Raise a ValueError if 'text' is not a valid formula.
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN.match(text, position)
+        if match is None:
+            offset = len(text) - len(text[position:].lstrip())
+            raise ValueError(
+                    "Failed to parse Kleene formula {!r}: unexpected {!r} at "
+                    "offset {}.".format(text, text[offset], offset))
+        tokens.append((match.lastindex, match.group(match.lastindex)))
+        position = match.end()
+    parser = Parser(text, tokens)
+    return parser.parse()
+
+
+class Parser(object):
+    """A recursive descent parser over the tokens of a formula."""
+    def __init__(self, text, tokens):
+        self.text = text
+        self.tokens = tokens
+        self.position = 0
+
+    def error(self):
+        if self.position < len(self.tokens):
+            found = repr(self.tokens[self.position][1])
+        else:
+            found = 'end of formula'
+        raise ValueError(
+                "Failed to parse Kleene formula {!r}: unexpected {}.".format(
+                    self.text, found))
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][1]
+        return None
+
+    def parse(self):
+        result = self.parse_binary(PRECEDENCE[OR])
+        if self.position != len(self.tokens):
+            self.error()
+        return result
+
+    def parse_binary(self, precedence):
+        if precedence > PRECEDENCE[AND]:
+            return self.parse_unary()
+        result = self.parse_binary(precedence + 1)
+        operator = {1: OR, 2: XOR, 3: AND}[precedence]
+        while self.peek() == operator:
+            self.position += 1
+            result = Operation(
+                    operator, result, self.parse_binary(precedence + 1))
+        return result
+
+    def parse_unary(self):
+        if self.position >= len(self.tokens):
+            self.error()
+        kind, value = self.tokens[self.position]
+        self.position += 1
+        if kind == 1:
+            return Variable(value)
+        if kind == 2:
+            return Constant(value)
+        if value == NOT:
+            return Operation(NOT, self.parse_unary())
+        if value == '(':
+            result = self.parse_binary(PRECEDENCE[OR])
+            if self.peek() != ')':
+                self.error()
+            self.position += 1
+            return result
+        self.position -= 1
+        self.error()
+
+
+def compile(formula):
+    """Compile a formula, given as text or as an Expression, into a Formula."""
+    return Formula(to_expression(formula))
+
+
+def to_column(value):
+    """Return a column of trits as a Trits sequence."""
+    if isinstance(value, trit.Trits):
+        return value
+    return trit.Trits(value)
+
+
+def is_array(value):
+    return isinstance(value, array.TritArray) or (
+            np is not None and isinstance(value, np.ndarray))
+
+
+class Formula(object):
+    """A Kleene logic formula compiled into a pipeline of column operations.
+
+    Call a Formula with one column per variable, either by position in the
+    order of 'variables', or by name.  All of the columns must have the same
+    length.  The result is a Trits, unless any of the columns is a NumPy
+    array or a TritArray, in which case the result is of the same kind.
+    Called with a single Trit for every variable, the result is a Trit.
+
+    'steps' is the pipeline, a list of (operator, inputs, output) tuples.
+    Each value in the pipeline has a slot: the variables come first, in
+    order, then 'constants', which maps each constant's slot to its Trit, and
+    then the output of each step.  'result' is the slot of the final value.
+    """
+    def __init__(self, expression):
+        self.expression = expression
+        self.variables = expression.variables
+        self.constants = {}
+        self.steps = []
+        self.slots = {
+                Variable(name).key: i
+                for i, name in enumerate(self.variables)}
+        self.producers = {}
+        self.size = len(self.variables)
+        self.result = self.build(expression)
+        self.prune()
+        self.table = None
+        if len(self.variables) <= MAX_TABLE_VARIABLES:
+            self.table = self.build_table()
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, str(self.expression))
+
+    def add_slot(self, key):
+        slot = self.size
+        self.size += 1
+        self.slots[key] = slot
+        return slot
+
+    def constant(self, value):
+        value = trit.Trit.make(value)
+        key = Constant(value).key
+        if key not in self.slots:
+            self.constants[self.add_slot(key)] = value
+        return self.slots[key]
+
+    def build(self, node):
+        """Add the steps to compute 'node', and return its slot."""
+        key = node.key
+        if key in self.slots:
+            return self.slots[key]
+        if isinstance(node, Constant):
+            return self.constant(node.value)
+
+        inputs = tuple(self.build(x) for x in node.operands)
+        if node.operator == NOT:
+            slot = self.negate(inputs[0])
+        else:
+            slot = self.fold(node.operator, inputs)
+        if slot is None:
+            slot = self.add_step(node.operator, inputs, key)
+        self.slots[key] = slot
+        return slot
+
+    def add_step(self, operator, inputs, key):
+        slot = self.add_slot(key)
+        self.steps.append((operator, inputs, slot))
+        self.producers[slot] = (operator, inputs)
+        return slot
+
+    def negate(self, slot):
+        """Return the slot of the negation of the value in 'slot'."""
+        value = self.constants.get(slot)
+        if value is not None:
+            return self.constant(-value)
+        producer = self.producers.get(slot)
+        if producer is not None and producer[0] == NOT:
+            return producer[1][0]
+        key = (NOT, ('slot', slot))
+        if key in self.slots:
+            return self.slots[key]
+        return self.add_step(NOT, (slot,), key)
+
+    def fold(self, operator, inputs):
+        """Return the slot of a simpler equivalent for a step, if there is one.
+
+        The operation is dropped entirely when its operands are both constant,
+        when they are the same value, or when one of them is a constant that
+        decides the result on its own.  Return None if the step is needed.
+        """
+        values = [self.constants.get(x) for x in inputs]
+        if all(x is not None for x in values):
+            return self.constant(Operation(
+                    operator, Constant(values[0]), Constant(values[1])
+                    ).evaluate({}))
+        if values[0] is not None:
+            inputs = inputs[::-1]
+            values = values[::-1]
+        slot, value = inputs[0], values[1]
+        if value is None:
+            if inputs[0] == inputs[1] and operator in (AND, OR):
+                return slot
+            return None
+        if operator == AND:
+            if value == trit.TRIT_POS:
+                return slot
+            if value == trit.TRIT_NEG:
+                return inputs[1]
+        elif operator == OR:
+            if value == trit.TRIT_NEG:
+                return slot
+            if value == trit.TRIT_POS:
+                return inputs[1]
+        else:
+            if value == trit.TRIT_NEG:
+                return slot
+            if value == trit.TRIT_ZERO:
+                return inputs[1]
+            return self.negate(slot)
+        return None
+
+    def prune(self):
+        """Remove any steps or constants that turned out not to be needed."""
+        needed = {self.result}
+        steps = []
+        for step in reversed(self.steps):
+            if step[2] in needed:
+                needed.update(step[1])
+                steps.append(step)
+        steps.reverse()
+        self.steps = steps
+        self.constants = {
+                slot: value for slot, value in self.constants.items()
+                if slot in needed}
+
+    def build_table(self):
+        """Return the composed lookup table of the formula.
+
+        The table is a string of 3 ** n glyphs, for n variables.  The entry
+        for a combination of inputs is at the index given by reading the
+        inputs, in order, as the digits of an unsigned ternary number.
+        """
+        count = len(self.variables)
+        rows = product(trit.GLYPHS, repeat=count)
+        columns = [''.join(x) for x in zip(*rows)] if count else []
+        return str(self.run([trit.Trits.from_glyphs(x) for x in columns]))
+
+    def bind(self, args, kwargs):
+        """Return the list of columns from positional and named arguments."""
+        if len(args) > len(self.variables):
+            raise TypeError(
+                    "Formula takes {} columns but {} were given.".format(
+                        len(self.variables), len(args)))
+        columns = dict(zip(self.variables, args))
+        for name, value in kwargs.items():
+            if name not in self.variables:
+                raise TypeError("Unknown variable {!r}.".format(name))
+            if name in columns:
+                raise TypeError(
+                        "Multiple columns given for variable {!r}.".format(
+                            name))
+            columns[name] = value
+        missing = [x for x in self.variables if x not in columns]
+        if missing:
+            raise TypeError(
+                    "No column given for variable(s) {}.".format(
+                        ', '.join(missing)))
+        return [columns[x] for x in self.variables]
+
+    def __call__(self, *args, **kwargs):
+        columns = self.bind(args, kwargs)
+        if any(is_array(x) for x in columns):
+            return self.run_arrays(columns)
+        if columns and all(isinstance(x, trit.Trit) for x in columns):
+            return self.lookup(columns)
+        return self.run([to_column(x) for x in columns])
+
+    def lookup(self, values):
+        """Return the value of the formula for one Trit per variable."""
+        if self.table is None:
+            return self.expression.evaluate(dict(zip(self.variables, values)))
+        index = 0
+        for value in values:
+            index = index * 3 + int(value) + 1
+        return trit.TRITS[self.table[index]]
+
+    def run(self, columns):
+        """Run the pipeline over a list of Trits, and return a Trits.
+
+        A formula with no variables gives a single trit.
+        """
+        length = 1
+        if columns:
+            length = len(columns[0])
+        for i, column in enumerate(columns):
+            if len(column) != length:
+                raise ValueError(
+                        "Column {!r} has length {}, expected {}.".format(
+                            self.variables[i], len(column), length))
+        values = list(columns) + [None] * (self.size - len(columns))
+        for slot, value in self.constants.items():
+            values[slot] = trit.Trits.from_glyphs(value.value * length)
+        for operator, inputs, output in self.steps:
+            if operator == NOT:
+                values[output] = -values[inputs[0]]
+            elif operator == AND:
+                values[output] = values[inputs[0]] & values[inputs[1]]
+            elif operator == OR:
+                values[output] = values[inputs[0]] | values[inputs[1]]
+            else:
+                values[output] = values[inputs[0]] ^ values[inputs[1]]
+        return trit.Trits(values[self.result])
+
+    def run_arrays(self, columns):
+        """Evaluate the formula over NumPy arrays or TritArrays."""
+        wrap = any(isinstance(x, array.TritArray) for x in columns)
+        data = []
+        for column in columns:
+            if isinstance(column, array.TritArray):
+                data.append(column.data)
+            elif isinstance(column, np.ndarray):
+                data.append(np.sign(column).astype(np.int8))
+            else:
+                data.append(array.TritArray.from_trits(to_column(column)).data)
+        data = np.broadcast_arrays(*data)
+
+        if self.table is not None:
+            index = np.zeros(data[0].shape, dtype=np.intp)
+            for column in data:
+                index *= 3
+                index += column + 1
+            table = array.TritArray.from_string(self.table).data
+            result = table[index]
+        else:
+            result = self.run_array_steps(data)
+        if wrap:
+            return array.TritArray.wrap(result)
+        return result
+
+    def run_array_steps(self, data):
+        shape = data[0].shape
+        values = list(data) + [None] * (self.size - len(data))
+        for slot, value in self.constants.items():
+            values[slot] = np.full(shape, int(value), dtype=np.int8)
+        for operator, inputs, output in self.steps:
+            a = values[inputs[0]]
+            if operator == NOT:
+                values[output] = -a
+                continue
+            b = values[inputs[1]]
+            if operator == AND:
+                values[output] = np.minimum(a, b)
+            elif operator == OR:
+                values[output] = np.maximum(a, b)
+            else:
+                values[output] = -(a * b)
+        return values[self.result]
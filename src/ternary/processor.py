@@ -26,9 +26,7 @@ class Register(trit.Trits):
         super(Register, self).__init__(trits, length)
         self.trits = list(self.trits)
         self.length = length
-
-    def __str__(self):
-        return ''.join([str(x) for x in self.trits])
+        self.shared = False
 
     def __len__(self):
         return self.length
@@ -41,9 +39,35 @@ class Register(trit.Trits):
                         "Invalid slice assignment of {} items to {} indices; "
                         "would modify the length of the Register.".format(
                             len(value), length))
-            self.trits[key] = [trit.Trit.make(x) for x in value]
+            trits = self.unshare()
+            trits[key] = [trit.Trit.make(x) for x in value]
         else:
-            self.trits[key] = trit.Trit.make(value)
+            trits = self.unshare()
+            trits[key] = trit.Trit.make(value)
+        # Assigning the list back discards the other cached forms of the
+        # sequence, which no longer match its contents.
+        self.trits = trits
+
+    def unshare(self):
+        """Return the list of trits, copying it first if a view shares it."""
+        if self.shared:
+            self.shared = False
+            return list(self.trits)
+        return self.trits
+
+    def snapshot(self):
+        """Return a Trits that shares the current contents of this Register.
+
+        Nothing is copied here; instead the Register is marked as shared, and
+        copies its contents before it is next modified.
+        """
+        self.shared = True
+        result = trit.Trits.__new__(trit.Trits)
+        result._trits = self._trits
+        result._glyphs = self._glyphs
+        result._planes = self._planes
+        result._length = self.length
+        return result
 
     def put(self, trits):
         self[:] = trit.Trits(trits, self.length)
@@ -52,8 +76,8 @@ class Register(trit.Trits):
         self.put([])
 
     def get_trits(self):
-        """Return the contents of this Register as a Trits object."""
-        return trit.Trits(self)
+        """Return a read-only view of the current contents of this Register."""
+        return trit.TritsView(self)
 
 
 class Instruction(object):
@@ -230,7 +254,7 @@ class T3(Processor):
 
     def get_operand(self, data):
         """Return the remainder of an instruction after the opcode."""
-        return trit.Trits(data[self.OPCODE_SIZE:])
+        return data[self.OPCODE_SIZE:]
 
     def get_register(self, address):
         """Return the contents of the register at 'address'."""
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Trits in shared memory
+======================
+
+This module places large sequences of trits in a block of shared memory (see
+the standard library's multiprocessing.shared_memory), so that worker
+processes can read them without each being sent a copy.
+
+The block holds the length of the sequence in trits, as an unsigned 64-bit
+little-endian integer, followed by the sequence in the ternary.binary format.
+Each byte holds five trits, so a read of any range only has to decode the
+bytes that the range covers.
+
+A SharedTrits pickles as just the name of its block, so it can be passed to a
+multiprocessing pool as an argument, and each worker attaches to the same
+memory:
+
+    with SharedTrits.create(trits) as shared:
+        with multiprocessing.Pool() as pool:
+            pool.map(work, [(shared, i) for i in range(count)])
+        shared.unlink()
+
+The process that created the block is responsible for calling unlink() once
+the workers are done with it.
+"""
+import struct
+from multiprocessing import shared_memory
+
+from ternary import binary, trit
+
+
+LENGTH = struct.Struct('<Q')
+# The position of the binary header byte, and of the first data byte.
+HEADER_OFFSET = LENGTH.size
+DATA_OFFSET = HEADER_OFFSET + 1
+
+
+class SharedTrits(object):
+    """A read-only sequence of trits in a named block of shared memory.
+
+    Use create() to put a sequence into a new block.  SharedTrits('name')
+    attaches to a block that already exists, as does unpickling.
+
+    A SharedTrits can be indexed and sliced like a Trits sequence: an index
+    gives a Trit, and a slice gives a Trits.  Use read() to get a string of
+    glyphs instead.
+    """
+    def __init__(self, name):
+        self.memory = shared_memory.SharedMemory(name)
+        self.length, = LENGTH.unpack_from(self.memory.buf, 0)
+        self.padding = self.memory.buf[HEADER_OFFSET] - binary.HEADER
+
+    @classmethod
+    def create(cls, trits, name=None):
+        """Return a new block of shared memory holding 'trits'.
+
+        'trits' may be a string of trit glyphs, or a Trits sequence.
+        """
+        if isinstance(trits, trit.Trits):
+            trits = trits.glyphs
+        data = LENGTH.pack(len(trits)) + binary.encode(trits)
+        memory = shared_memory.SharedMemory(name, create=True, size=len(data))
+        memory.buf[:len(data)] = data
+        result = cls.__new__(cls)
+        result.memory = memory
+        result.length = len(trits)
+        result.padding = data[HEADER_OFFSET] - binary.HEADER
+        return result
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def __reduce__(self):
+        return (self.__class__, (self.name,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Detach from the shared memory, leaving it in place for others."""
+        self.memory.close()
+
+    def unlink(self):
+        """Free the shared memory, once every process is done with it."""
+        self.memory.unlink()
+
+    def __len__(self):
+        return self.length
+
+    def read(self, start=0, stop=None):
+        """Return the trits from 'start' up to 'stop' as a string of glyphs.
+
+        As with slicing, the range is clipped to the length of the sequence,
+        and negative positions count back from the end.
+        """
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return ''
+        size = binary.SEGMENT_SIZE
+        # Positions within the padded data.
+        start += self.padding
+        stop += self.padding
+        first = start // size
+        last = (stop - 1) // size
+        data = self.memory.buf[DATA_OFFSET + first:DATA_OFFSET + last + 1]
+        glyphs = ''.join(map(binary.SEGMENTS.__getitem__, data))
+        offset = first * size
+        return glyphs[start - offset:stop - offset]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step == 1:
+                return trit.Trits.from_glyphs(self.read(start, stop))
+            return trit.Trits.from_glyphs(self.read()[key])
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("Shared trits index out of range.")
+        return trit.Trit.make(self.read(key, key + 1))
+
+    def to_trits(self):
+        """Return the whole sequence as a Trits."""
+        return trit.Trits.from_glyphs(self.read())
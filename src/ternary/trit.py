@@ -14,8 +14,14 @@ When performing logical operations with balanced ternary values, we use the
 Kleene ternary propositional logic system, where - represents False, +
 represents True, and 0 represents an indeterminate value, which is either True
 or False (analogous to NULL in SQL).
+
+Any function of one or two trits can be written as a UnaryOperator or a
+BinaryOperator, from its truth table.  The logical operations of Trit and
+Trits, and the logic gates of the hardware simulator, are all Operators.
 """
+import itertools
 import numbers
+import re
 
 
 NEG = '-'
@@ -44,6 +50,40 @@ INPUTS = {
         '✓':  POS,
         }
 
+# Translation table from every single-character input in INPUTS to its glyph,
+# and a pattern that finds the first character that isn't a glyph afterwards.
+NORMALISE = str.maketrans({
+        key: value for key, value in INPUTS.items() if len(key) == 1})
+INVALID_GLYPH = re.compile('[^{}]'.format(re.escape(''.join(GLYPHS))))
+
+# Translation tables for converting between a string of trit glyphs and the
+# binary digits of its positive and negative bit planes.
+POS_BITS = str.maketrans({NEG: '0', ZERO: '0', POS: '1'})
+NEG_BITS = str.maketrans({NEG: '1', ZERO: '0', POS: '0'})
+PLANE_GLYPHS = bytes.maketrans(b'012', b'0+-')
+
+
+def parse_glyphs(text):
+    """Return a string of trit glyphs parsed from 'text'.
+
+    Each character of 'text' is one trit, given as a glyph, or as any of the
+    single-character inputs that Trit.make() accepts, such as '1', 'N' or
+    '\u2713'.  Unlike Trit.make(), whitespace is not accepted.
+
+    The whole string is normalised with one translation, and then checked
+    with one search, so the work is done by C-level string operations rather
+    than a call per character.  Raise a ValueError if any character is not
+    recognised.
+    """
+    result = text.translate(NORMALISE)
+    match = INVALID_GLYPH.search(result)
+    if match is not None:
+        index = match.start()
+        raise ValueError(
+                "Failed to parse {!r} as a trit at offset {}.".format(
+                    text[index], index))
+    return result
+
 
 class Trit(object):
     """A ternary digit (trit) is the basic unit of information in ternary.
@@ -90,6 +130,10 @@ class Trit(object):
             raise ValueError(
                     "Failed to parse {0!r} as a trit.".format(value))
 
+    def __reduce__(self):
+        # Unpickle to the module's own instances, so that identity holds.
+        return (Trit.make, (self.value,))
+
     def __unicode__(self):
         return self.value
 
@@ -182,12 +226,7 @@ class Trit(object):
         The result is negative if either input is negative, positive if both
         inputs are positive, otherwise zero.
         """
-        if NEG in (self.value, other.value):
-            return TRIT_NEG
-        elif self.value == POS and other.value == POS:
-            return TRIT_POS
-        else:
-            return TRIT_ZERO
+        return TRITS[AND.outputs[(self.value, other.value)]]
 
     def __or__(self, other):
         """Return the tritwise OR of two trits.
@@ -195,12 +234,7 @@ class Trit(object):
         The result is positive if either input is positive, negative if both
         inputs are negative, otherwise zero.
         """
-        if POS in (self.value, other.value):
-            return TRIT_POS
-        elif self.value == NEG and other.value == NEG:
-            return TRIT_NEG
-        else:
-            return TRIT_ZERO
+        return TRITS[OR.outputs[(self.value, other.value)]]
 
     def __xor__(self, other):
         """Return the tritwise XOR (exclusive-OR) of two trits.
@@ -208,12 +242,7 @@ class Trit(object):
         The result is zero if either input is zero, positive if one input is
         positive and the other negative, and negative otherwise.
         """
-        if ZERO in (self.value, other.value):
-            return TRIT_ZERO
-        elif self.value != other.value:
-            return TRIT_POS
-        else:
-            return TRIT_NEG
+        return TRITS[XOR.outputs[(self.value, other.value)]]
 
     def add(self, other, carry=None):
         """Add two Trit objects with an optional carry-in Trit.
@@ -279,11 +308,14 @@ class Trits(object):
     Unless otherwise noted, binary operations on Trits objects of unequal
     length will extend the shorter operand by adding zero trits on the left to
     match the length of the longer operand.
+
+    Internally, a sequence may be held in any of three equivalent forms: a
+    tuple of Trit objects, a string of trit glyphs, or a packed pair of integer
+    bit planes (see 'planes').  Each form is only built when it is first
+    needed, so that operations which work on the packed form never have to
+    visit the individual trits.
     """
     def __init__(self, trits, length=None):
-        self.trits = ()
-        if trits is not None:
-            self.trits = tuple((Trit.make(x) for x in trits))
         if length is not None:
             if not isinstance(length, numbers.Integral):
                 raise TypeError(
@@ -293,12 +325,170 @@ class Trits(object):
                 raise ValueError(
                         "Invalid length argument {}; "
                         "length must be non-negative.".format(length))
-            if len(self.trits) < length:
-                pad = (TRIT_ZERO,) * (length - len(self.trits))
-                self.trits = pad + self.trits
-            elif len(self.trits) > length:
-                self.trits = self.trits[-length:]
-        self.string = ''.join((str(x) for x in self.trits))
+
+        self._trits = None
+        self._glyphs = None
+        self._planes = None
+        if isinstance(trits, str):
+            # Most strings can be parsed in bulk.  Otherwise, fall back to
+            # parsing each character with Trit.make(), which also accepts
+            # whitespace as zero, and reports any errors.
+            glyphs = trits.translate(NORMALISE)
+            if INVALID_GLYPH.search(glyphs) is None:
+                trits = Trits.from_glyphs(glyphs)
+
+        if isinstance(trits, Trits) and length in (None, len(trits)):
+            # A straight copy can share whichever forms the source has
+            # already built.  A mutable list (from a Register) can't be
+            # shared, but the other forms can be rebuilt from it.
+            self._length = len(trits)
+            self._planes = trits._planes
+            self._glyphs = trits._glyphs
+            if isinstance(trits._trits, tuple):
+                self._trits = trits._trits
+            elif self._planes is None and self._glyphs is None:
+                self._glyphs = trits.glyphs
+            return
+
+        if isinstance(trits, Trits):
+            # Changing the length of another sequence never needs to visit the
+            # trits, we can just take its packed form and adjust it.
+            pos, neg = trits.planes
+            self._length = len(trits)
+            if length is not None and length < self._length:
+                mask = (1 << length) - 1
+                pos &= mask
+                neg &= mask
+            if length is not None:
+                self._length = length
+            self._planes = (pos, neg)
+            return
+
+        values = ()
+        if trits is not None:
+            values = tuple((Trit.make(x) for x in trits))
+        if length is not None:
+            if len(values) < length:
+                pad = (TRIT_ZERO,) * (length - len(values))
+                values = pad + values
+            elif len(values) > length:
+                values = values[-length:]
+        self._trits = values
+        self._length = len(values)
+
+    @classmethod
+    def from_planes(cls, pos, neg, length):
+        """Return a sequence of 'length' trits from packed bit planes.
+
+        Bit i of the integer 'pos' is set if the trit at position i, counting
+        from zero at the rightmost (least significant) trit, is positive.
+        Likewise, bit i of 'neg' is set if that trit is negative.  Any bits
+        beyond 'length' are ignored.
+        """
+        mask = (1 << length) - 1
+        pos &= mask
+        neg &= mask
+        if pos & neg:
+            raise ValueError(
+                    "Invalid bit planes: a trit cannot be both positive and "
+                    "negative.")
+        result = Trits.__new__(Trits)
+        result._trits = None
+        result._glyphs = None
+        result._planes = (pos, neg)
+        result._length = length
+        if cls is Trits:
+            return result
+        return cls(result, length)
+
+    @classmethod
+    def from_glyphs(cls, glyphs, length=None):
+        """Return a sequence from a string of trit glyphs.
+
+        Unlike the normal initialiser, this does not parse each trit, so
+        'glyphs' must consist entirely of the characters in GLYPHS.
+        """
+        result = Trits.__new__(Trits)
+        result._trits = None
+        result._glyphs = glyphs
+        result._planes = None
+        result._length = len(glyphs)
+        if cls is Trits and length in (None, len(glyphs)):
+            return result
+        return cls(result, length)
+
+    @classmethod
+    def from_string(cls, text, length=None):
+        """Return a sequence parsed from a string, with one trit per character.
+
+        Any of the characters accepted by parse_glyphs() may be used, so this
+        is much faster than the normal initialiser for large strings, while
+        still checking every character.
+        """
+        return cls.from_glyphs(parse_glyphs(text), length)
+
+    @property
+    def trits(self):
+        """The sequence as a tuple of Trit objects."""
+        if self._trits is None:
+            self._trits = tuple(map(TRITS.__getitem__, self.glyphs))
+        return self._trits
+
+    @trits.setter
+    def trits(self, value):
+        self._trits = value
+        self._glyphs = None
+        self._planes = None
+        self._length = len(value)
+
+    @property
+    def glyphs(self):
+        """The sequence as a string of trit glyphs."""
+        if self._glyphs is None:
+            if self._trits is not None:
+                self._glyphs = ''.join([x.value for x in self._trits])
+            else:
+                self._glyphs = self.planes_to_glyphs(
+                        *self._planes, self._length)
+        return self._glyphs
+
+    @property
+    def string(self):
+        return self.glyphs
+
+    @property
+    def planes(self):
+        """The sequence as a 2-tuple of integer bit planes (pos, neg).
+
+        See from_planes() for the layout of the planes.
+        """
+        if self._planes is None:
+            glyphs = self.glyphs
+            if glyphs:
+                self._planes = (
+                        int(glyphs.translate(POS_BITS), 2),
+                        int(glyphs.translate(NEG_BITS), 2))
+            else:
+                self._planes = (0, 0)
+        return self._planes
+
+    @staticmethod
+    def planes_to_glyphs(pos, neg, length):
+        """Return the string of trit glyphs encoded by a pair of bit planes.
+
+        Rather than walking the planes one trit at a time, we write each plane
+        out as ASCII binary digits, and add the digit strings together as big
+        integers, so that each byte becomes '0', '1' (positive) or '2'
+        (negative).  Since the planes are disjoint there are no carries.
+        """
+        if length == 0:
+            return ''
+        fmt = '0{}b'.format(length)
+        zeros = int.from_bytes(b'0' * length, 'big')
+        p = int.from_bytes(format(pos, fmt).encode('ascii'), 'big')
+        n = int.from_bytes(format(neg, fmt).encode('ascii'), 'big')
+        data = (p + 2 * n - 2 * zeros).to_bytes(length, 'big')
+        return data.translate(PLANE_GLYPHS).decode('ascii')
 
     def __str__(self):
         return self.string
@@ -306,17 +496,37 @@ class Trits(object):
     def __repr__(self):
         return "{}({!r})".format(self.__class__.__name__, str(self))
 
+    def __reduce__(self):
+        """Pickle the sequence as its packed bit planes.
+
+        The planes take two bits per trit, where the default pickle would hold
+        a Trit object per trit as well as the string of glyphs.  Unpickling
+        goes through from_planes() on the same class.
+        """
+        return (self.__class__.from_planes, self.planes + (len(self),))
+
     def __hash__(self):
-        return hash(self.trits)
+        return hash(self.glyphs)
 
     def __len__(self):
-        return len(self.trits)
+        return self._length
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return Trits(self.trits[key])
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return TritsView(self, start, stop)
+            return Trits.from_glyphs(self.glyphs[key])
         return self.trits[key]
 
+    def snapshot(self):
+        """Return an immutable sequence with the current contents of this one.
+
+        Trits are immutable, so this is just the sequence itself.  Mutable
+        subclasses return a copy, or a copy-on-write share of their contents.
+        """
+        return self
+
     def __contains__(self, item):
         if isinstance(item, Trit):
             return (item in self.trits)
@@ -327,7 +537,8 @@ class Trits(object):
         return iter(self.trits)
 
     def __neg__(self):
-        return self.__class__([-x for x in self.trits])
+        pos, neg = self.planes
+        return self.from_planes(neg, pos, len(self))
 
     def __invert__(self):
         return -self
@@ -341,10 +552,8 @@ class Trits(object):
         If the sequence consists entirely of zeroes, or is empty, return an
         empty sequence.
         """
-        for i in range(len(self)):
-            if self[i] != TRIT_ZERO:
-                return self.__class__(self[i:])
-        return self.__class__([])
+        pos, neg = self.planes
+        return self.from_planes(pos, neg, (pos | neg).bit_length())
 
     @classmethod
     def match_length(cls, a, b):
@@ -361,60 +570,70 @@ class Trits(object):
         else:
             return (a, cls(b, len(a)))
 
+    @staticmethod
+    def pair_planes(a, b):
+        """Return the bit planes and common length of two operands.
+
+        The result is a 5-tuple (a_pos, a_neg, b_pos, b_neg, length).  Zero
+        padding on the left has no set bits in either plane, so matching the
+        lengths of the operands is free.
+        """
+        if not isinstance(a, Trits):
+            a = Trits(a)
+        if not isinstance(b, Trits):
+            b = Trits(b)
+        return a.planes + b.planes + (max(len(a), len(b)),)
+
     def __and__(self, other):
         """Return the tritwise AND of two trit sequences."""
-        a, b = Trits.match_length(self, other)
-        return Trits([x & y for x, y in zip(a, b)])
+        return AND.apply(self, other)
 
     def __or__(self, other):
         """Return the tritwise OR of two trit sequences."""
-        a, b = Trits.match_length(self, other)
-        return Trits([x | y for x, y in zip(a, b)])
+        return OR.apply(self, other)
 
     def __xor__(self, other):
         """Return the tritwise XOR of two trit sequences."""
-        a, b = Trits.match_length(self, other)
-        return Trits([x ^ y for x, y in zip(a, b)])
+        return XOR.apply(self, other)
 
     def __add__(self, other):
         """Return the concatenation of a Trits with an iterable or Trit."""
-        if isinstance(other, Trit):
-            value = (other,)
-        else:
-            value = tuple(other)
-        return Trits(self.trits + value)
+        return Trits.from_glyphs(self.glyphs + to_glyphs(other))
 
     def __radd__(self, other):
-        return self.__add__(other)
+        return Trits.from_glyphs(to_glyphs(other) + self.glyphs)
 
     def __lshift__(self, other):
-        return self + ((TRIT_ZERO,) * other)
+        pos, neg = self.planes
+        return Trits.from_planes(pos << other, neg << other, len(self) + other)
 
     def __rshift__(self, other):
-        return self[:-other]
+        pos, neg = self.planes
+        return Trits.from_planes(
+                pos >> other, neg >> other, max(len(self) - other, 0))
 
     def __mul__(self, other):
         """Return 'self' repeated 'other' times."""
-        return Trits(self.trits * other)
+        return Trits.from_glyphs(self.glyphs * other)
 
     def cmp(self, other):
-        a, b = Trits.match_length(self, other)
-        for x, y in zip(a, b):
-            if x < y:
-                return -1
-            elif x > y:
-                return 1
-        return 0
+        ap, an, bp, bn, _ = Trits.pair_planes(self, other)
+        diff = (ap ^ bp) | (an ^ bn)
+        if not diff:
+            return 0
+        # The most significant differing trit decides the comparison.
+        bit = 1 << (diff.bit_length() - 1)
+        if ap & bit or bn & bit:
+            return 1
+        return -1
 
     def is_zero(self):
         """Return whether this sequence contains no non-zero trits.
 
         Note that this returns True for empty sequences.
         """
-        for t in self:
-            if t != TRIT_ZERO:
-                return False
-        return True
+        pos, neg = self.planes
+        return not (pos or neg)
 
     def __lt__(self, other):
         return (self.cmp(other) < 0)
@@ -433,3 +652,430 @@ class Trits(object):
 
     def __ge__(self, other):
         return (self.cmp(other) >= 0)
+
+
+class TritsView(Trits):
+    """A read-only view of a contiguous range of another sequence.
+
+    Slicing a Trits with a step of 1 gives a TritsView, which holds a
+    reference to the parent sequence and the 'start' and 'stop' positions of
+    the range, rather than a copy of the trits.  A view supports all of the
+    same operations as Trits, and builds each form of its contents from the
+    matching form of the parent only when that form is first needed.
+
+    A view of a mutable sequence, such as a Register, refers to a snapshot of
+    its contents (see snapshot()), so later changes to the parent do not show
+    through the view.  A view keeps its whole parent alive, so take a copy
+    with Trits(view) to keep a small piece of a large sequence.
+    """
+    def __init__(self, parent, start=0, stop=None):
+        start, stop, _ = slice(start, stop).indices(len(parent))
+        stop = max(start, stop)
+        if isinstance(parent, TritsView):
+            # A view of a view refers straight to the original parent.
+            start += parent.start
+            stop += parent.start
+            parent = parent.parent
+        self.parent = parent.snapshot()
+        self.start = start
+        self.stop = stop
+        self._trits = None
+        self._glyphs = None
+        self._planes = None
+        self._length = stop - start
+
+    # Results built by the inherited methods are plain sequences, not views.
+    @classmethod
+    def from_planes(cls, pos, neg, length):
+        return Trits.from_planes(pos, neg, length)
+
+    @classmethod
+    def from_glyphs(cls, glyphs, length=None):
+        return Trits.from_glyphs(glyphs, length)
+
+    @classmethod
+    def match_length(cls, a, b):
+        return Trits.match_length(a, b)
+
+    @property
+    def trits(self):
+        if self._trits is None:
+            parent = self.parent
+            if parent._trits is not None:
+                self._trits = tuple(parent._trits[self.start:self.stop])
+            else:
+                self._trits = tuple(map(TRITS.__getitem__, self.glyphs))
+        return self._trits
+
+    @property
+    def glyphs(self):
+        if self._glyphs is None:
+            parent = self.parent
+            if parent._glyphs is not None:
+                self._glyphs = parent._glyphs[self.start:self.stop]
+            elif parent._trits is not None:
+                self._glyphs = ''.join([
+                        x.value for x in parent._trits[self.start:self.stop]])
+            else:
+                self._glyphs = self.planes_to_glyphs(
+                        *self.planes, self._length)
+        return self._glyphs
+
+    @property
+    def string(self):
+        return self.glyphs
+
+    @property
+    def planes(self):
+        if self._planes is None:
+            parent = self.parent
+            if parent._planes is not None:
+                # The range is counted from the left, and the planes from the
+                # right, so shift off the trits after the range.
+                shift = len(parent) - self.stop
+                mask = (1 << self._length) - 1
+                pos, neg = parent._planes
+                self._planes = ((pos >> shift) & mask, (neg >> shift) & mask)
+            else:
+                self._planes = Trits.planes.fget(self)
+        return self._planes
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return super(TritsView, self).__getitem__(key)
+        return self.parent[range(self.start, self.stop)[key]]
+
+    def __contains__(self, item):
+        if self._glyphs is not None:
+            return super(TritsView, self).__contains__(item)
+        # Search within the parent's glyphs, without copying out the range.
+        glyphs = item.value if isinstance(item, Trit) else str(item)
+        return self.parent.glyphs.find(glyphs, self.start, self.stop) >= 0
+
+
+def to_glyphs(value):
+    """Return the glyphs of a Trit, a Trits, or anything Trits() accepts."""
+    if isinstance(value, Trits):
+        return value.glyphs
+    if isinstance(value, Trit):
+        return value.value
+    return Trits(value).glyphs
+
+
+class TritsBuilder(object):
+    """A mutable sequence of trits, for building up a long Trits.
+
+    Concatenating Trits copies both operands, so building up a sequence of n
+    trits a piece at a time takes O(n^2) time.  A TritsBuilder keeps its trits
+    as glyphs in a bytearray instead, which grows in amortised constant time,
+    and freeze() turns it into a Trits with a single copy.
+
+    Single trits may be given as anything Trit.make() accepts, and runs of
+    trits as anything Trits() accepts.
+
+    >>> builder = TritsBuilder('+-')
+    >>> builder.append(0)
+    >>> builder.extend(Trits('--'))
+    >>> builder.insert(0, '-')
+    >>> builder.freeze()
+    Trits('-+-0--')
+    """
+    def __init__(self, trits=None):
+        self.data = bytearray()
+        if trits is not None:
+            self.extend(trits)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __str__(self):
+        return self.data.decode('ascii')
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, str(self))
+
+    def __iter__(self):
+        return (TRITS[chr(x)] for x in self.data)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return Trits.from_glyphs(self.data[key].decode('ascii'))
+        return TRITS[chr(self.data[key])]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self.data[key] = to_glyphs(value).encode('ascii')
+        else:
+            self.data[key] = ord(Trit.make(value).value)
+
+    def __delitem__(self, key):
+        del self.data[key]
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def append(self, value):
+        """Add a single trit to the end."""
+        self.data.append(ord(Trit.make(value).value))
+
+    def extend(self, trits):
+        """Add a sequence of trits to the end."""
+        self.data += to_glyphs(trits).encode('ascii')
+
+    def insert(self, index, value):
+        """Insert a single trit before position 'index'."""
+        self.data.insert(index, ord(Trit.make(value).value))
+
+    def pop(self, index=-1):
+        """Remove and return the trit at position 'index'."""
+        return TRITS[chr(self.data.pop(index))]
+
+    def clear(self):
+        del self.data[:]
+
+    def freeze(self):
+        """Return the trits built so far as a Trits sequence."""
+        return Trits.from_glyphs(self.data.decode('ascii'))
+
+
+# The names of the bit planes of each input in generated code, by glyph.
+PLANE_SUFFIXES = {NEG: 'n', ZERO: 'z', POS: 'p'}
+
+
+def select_source(name, glyphs):
+    """Return the source of an expression selecting trits by their values.
+
+    The expression gives the bits of input 'name' where the trit has any of
+    the values in 'glyphs', in terms of the planes of that input and 'mask',
+    which has a bit set for every trit in the sequence.
+    """
+    if len(glyphs) == 3:
+        return 'mask'
+    if len(glyphs) == 1:
+        return name + PLANE_SUFFIXES[glyphs]
+    missing, = set(GLYPHS).difference(glyphs)
+    return '(mask ^ {}{})'.format(name, PLANE_SUFFIXES[missing])
+
+
+def needs_zero(glyphs):
+    """Return whether select_source() uses the zero plane for 'glyphs'."""
+    return glyphs == ZERO or len(glyphs) == 2 and ZERO not in glyphs
+
+
+class Operator(object):
+    """Abstract base class for a ternary function, given by its truth table.
+
+    'table' is either the truth table, as a sequence of outputs (glyphs, or
+    anything that Trit.make() accepts) with one entry for each combination of
+    inputs, or the id of the function.
+
+    The entries of the table run through the combinations of inputs in order,
+    with the first input varying the slowest, and each input running through
+    '-', '0' and '+'.  Reading the entries as the digits of an unsigned
+    ternary number, where '-' is 0 and '+' is 2, and the first entry is the
+    most significant, gives the id.  So there are 27 unary functions, and
+    3 ** 9 = 19683 binary functions.
+
+    Calling an Operator with one Trit per input gives a Trit.  Calling it with
+    sequences applies the function to each position of the sequences at once;
+    see apply().  Use lookup() for single glyphs.
+
+    For sequences, each Operator builds a small function from its truth
+    table, which works out the bit planes of the result from the bit planes
+    of the inputs in a few integer operations.  'source' holds the code of
+    that function.
+    """
+    ARITY = None
+    INPUTS = ()
+
+    def __init__(self, table, name=None):
+        size = 3 ** self.ARITY
+        if isinstance(table, numbers.Integral):
+            if not 0 <= table < 3 ** size:
+                raise ValueError(
+                        "Invalid operator id {}; must be at least 0 and less "
+                        "than {}.".format(table, 3 ** size))
+            glyphs = ''.join(
+                    GLYPHS[table // 3 ** i % 3]
+                    for i in range(size - 1, -1, -1))
+        else:
+            glyphs = ''.join(Trit.make(x).value for x in table)
+            if len(glyphs) != size:
+                raise ValueError(
+                        "Invalid truth table {!r}; must have exactly {} "
+                        "entries.".format(table, size))
+        self.glyphs = glyphs
+        self.name = name
+        self.id = sum(
+                GLYPHS.index(x) * 3 ** i
+                for i, x in enumerate(reversed(glyphs)))
+        inputs = itertools.product(GLYPHS, repeat=self.ARITY)
+        self.outputs = dict(zip(inputs, glyphs))
+
+        self.terms = {value: self.cover(value) for value in (POS, NEG)}
+        self.source = self.build_source()
+        namespace = {}
+        exec(self.source, namespace)
+        self.planes = namespace['planes']
+
+    @classmethod
+    def from_function(cls, function, name=None):
+        """Return the Operator for a function from input glyphs to a glyph."""
+        inputs = itertools.product(GLYPHS, repeat=cls.ARITY)
+        return cls([function(*x) for x in inputs], name)
+
+    def __str__(self):
+        if self.name is None:
+            return self.glyphs
+        return self.name
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.glyphs)
+
+    def __eq__(self, other):
+        if not isinstance(other, Operator):
+            return NotImplemented
+        return self.ARITY == other.ARITY and self.glyphs == other.glyphs
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash((self.ARITY, self.glyphs))
+
+    def lookup(self, *glyphs):
+        """Return the output glyph for one input glyph per input."""
+        return self.outputs[glyphs]
+
+    def __call__(self, *args):
+        if all(isinstance(x, Trit) for x in args):
+            return TRITS[self.outputs[tuple(x.value for x in args)]]
+        return self.apply(*args)
+
+    def apply(self, *args):
+        """Apply the function across whole sequences, and return a Trits."""
+        raise NotImplementedError()
+
+    def cover(self, value):
+        """Return the cheapest set of terms that give the output 'value'.
+
+        Each term is a tuple with a string of input values for each input,
+        and matches wherever every input has one of its values: a rectangle of
+        cells in the truth table.  We take the largest terms that only match
+        cells with the output 'value', and find the fewest of them that
+        between them match every such cell.
+        """
+        cells = {x for x, y in self.outputs.items() if y == value}
+        if not cells:
+            return ()
+        subsets = [
+                ''.join(x for i, x in enumerate(GLYPHS) if bits & (1 << i))
+                for bits in range(1, 8)]
+        terms = []
+        for term in itertools.product(subsets, repeat=self.ARITY):
+            area = set(itertools.product(*term))
+            if area <= cells:
+                terms.append((term, area))
+        # Only keep the terms that aren't inside a larger one.
+        terms = [
+                (term, area) for term, area in terms
+                if not any(area < other for _, other in terms)]
+        for count in range(1, len(terms) + 1):
+            covers = [
+                    cover for cover in itertools.combinations(terms, count)
+                    if set().union(*(x[1] for x in cover)) == cells]
+            if covers:
+                best = min(covers, key=lambda cover: sum(
+                        self.term_cost(term) for term, _ in cover))
+                return tuple(term for term, _ in best)
+
+    @staticmethod
+    def term_cost(term):
+        """Return the number of integer operations needed for a term."""
+        selected = [x for x in term if len(x) != 3]
+        return sum(len(x) == 2 for x in selected) + max(len(selected) - 1, 0)
+
+    def build_source(self):
+        """Return the source of the function that works on bit planes."""
+        lines = ['def planes({}, mask):'.format(', '.join(
+                name + PLANE_SUFFIXES[x]
+                for name in self.INPUTS for x in (POS, NEG)))]
+        for i, name in enumerate(self.INPUTS):
+            if any(
+                    needs_zero(term[i])
+                    for value in (POS, NEG) for term in self.terms[value]):
+                lines.append('    {0}z = mask ^ ({0}p | {0}n)'.format(name))
+        results = []
+        for value in (POS, NEG):
+            terms = []
+            for term in self.terms[value]:
+                parts = [
+                        select_source(name, x)
+                        for name, x in zip(self.INPUTS, term) if len(x) != 3]
+                terms.append(' & '.join(parts) or 'mask')
+            results.append(' | '.join(terms) or '0')
+        lines.append('    return ({}, {})'.format(*results))
+        return '\n'.join(lines) + '\n'
+
+
+class UnaryOperator(Operator):
+    """A ternary function of one input; see Operator."""
+    ARITY = 1
+    INPUTS = ('a',)
+
+    def apply(self, trits):
+        if not isinstance(trits, Trits):
+            trits = Trits(trits)
+        length = len(trits)
+        pos, neg = self.planes(*trits.planes, (1 << length) - 1)
+        return Trits.from_planes(pos, neg, length)
+
+
+class BinaryOperator(Operator):
+    """A ternary function of two inputs; see Operator.
+
+    The truth table is laid out with the rows for the first input, and the
+    columns for the second input, so the entries are in this order:
+
+    |   | - | 0 | + |
+    |===|===|===|===|
+    | - | 0 | 1 | 2 |
+    | 0 | 3 | 4 | 5 |
+    | + | 6 | 7 | 8 |
+
+    Sequences of unequal length are padded with zero trits on the left, just
+    like the tritwise operations of Trits.
+    """
+    ARITY = 2
+    INPUTS = ('a', 'b')
+
+    def apply(self, a, b):
+        ap, an, bp, bn, length = Trits.pair_planes(a, b)
+        pos, neg = self.planes(ap, an, bp, bn, (1 << length) - 1)
+        return Trits.from_planes(pos, neg, length)
+
+
+BUFFER = UnaryOperator('-0+', 'BUFFER')
+NOT = UnaryOperator('+0-', 'NOT')
+PNOT = UnaryOperator('++-', 'PNOT')
+NNOT = UnaryOperator('+--', 'NNOT')
+IS_ZERO = UnaryOperator('-+-', 'IS_ZERO')
+CYCLE_UP = UnaryOperator('0+-', 'CYCLE_UP')
+CYCLE_DOWN = UnaryOperator('+-0', 'CYCLE_DOWN')
+
+AND = BinaryOperator('----00-0+', 'AND')
+OR = BinaryOperator('-0+00++++', 'OR')
+XOR = BinaryOperator('-0+000+0-', 'XOR')
+NAND = BinaryOperator('++++00+0-', 'NAND')
+NOR = BinaryOperator('+0-00----', 'NOR')
+NXOR = BinaryOperator('+0-000-0+', 'NXOR')
+ANY = BinaryOperator('--0-0+0++', 'ANY')
+NANY = BinaryOperator('++0+0-0--', 'NANY')
+CONS = BinaryOperator('-0000000+', 'CONS')
+NCONS = BinaryOperator('+0000000-', 'NCONS')
+PASS_A = BinaryOperator('---000+++', 'PASS_A')
+PASS_B = BinaryOperator('-0+-0+-0+', 'PASS_B')
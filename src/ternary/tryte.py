@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# coding=utf-8
+"""
+Tryte-at-a-time arithmetic
+==========================
+
+This module holds lookup tables for every possible tryte (a chunk of 6 trits),
+and uses them to work on strings of trit glyphs six trits at a time, rather
+than calling Trit methods once per trit.
+
+There are 3 ** 6 = 729 trytes.  A tryte is identified by its unsigned value,
+from 0 (all '-') up to 728 (all '+'), and its signed value is 364 less than
+that.  Carries between trytes are plain integers, since the sum of two trytes
+and a carry always fits in one tryte plus a carry of -1, 0 or +1.
+
+None of this needs NumPy, so these functions are also the fallback for bulk
+work when NumPy isn't installed.
+"""
+from ternary import trit
+
+
+SIZE = 6
+COUNT = 3 ** SIZE
+HALF = COUNT // 2
+
+# Translation tables between balanced trit glyphs and unsigned ternary digits.
+GLYPH_DIGITS = str.maketrans({trit.NEG: '0', trit.ZERO: '1', trit.POS: '2'})
+DIGIT_GLYPHS = str.maketrans({'0': trit.NEG, '1': trit.ZERO, '2': trit.POS})
+NEGATE = str.maketrans({trit.NEG: trit.POS, trit.POS: trit.NEG})
+
+# Unsigned ternary digits and balanced trit glyphs of every tryte, indexed by
+# its unsigned value, and the signed value of every tryte keyed by its glyphs.
+DIGITS = tuple(
+        ''.join(str(x // 3 ** i % 3) for i in range(SIZE - 1, -1, -1))
+        for x in range(COUNT))
+GLYPHS = tuple(digits.translate(DIGIT_GLYPHS) for digits in DIGITS)
+VALUES = {glyphs: x - HALF for x, glyphs in enumerate(GLYPHS)}
+
+# Bit planes (pos, neg) of every tryte, indexed by its unsigned value, and the
+# reverse mapping from a pair of 6-bit planes to the tryte's signed value.
+PLANES = tuple(
+        (
+            sum(1 << i for i in range(SIZE) if x // 3 ** i % 3 == 2),
+            sum(1 << i for i in range(SIZE) if x // 3 ** i % 3 == 0))
+        for x in range(COUNT))
+PLANE_VALUES = {planes: x - HALF for x, planes in enumerate(PLANES)}
+
+
+def negate(glyphs):
+    """Return the negation of a string of trit glyphs."""
+    return glyphs.translate(NEGATE)
+
+
+def add(a, b, carry=0):
+    """Add two strings of trit glyphs, with an optional carry-in.
+
+    The shorter operand is treated as if it were padded with zeroes on the
+    left.  'carry' must be -1, 0 or 1.
+
+    Return a 2-tuple of (sum, carry-out), where the sum has as many trits as
+    the longer operand, and the carry-out is -1, 0 or 1, just like Trit.add().
+    """
+    length = max(len(a), len(b))
+    size = -(-length // SIZE) * SIZE
+    a = a.rjust(size, trit.ZERO)
+    b = b.rjust(size, trit.ZERO)
+    chunks = []
+    for i in range(size - SIZE, -1, -SIZE):
+        j = i + SIZE
+        carry, index = divmod(
+                VALUES[a[i:j]] + VALUES[b[i:j]] + carry + HALF, COUNT)
+        chunks.append(GLYPHS[index])
+    chunks.reverse()
+    result = ''.join(chunks)
+    excess = size - length
+    if excess:
+        # The sum always fits in one more trit than the operands, so when
+        # the top tryte was padded, the carry-out is the lowest trit of the
+        # padding.
+        carry = trit.INTEGERS[result[excess - 1]]
+        result = result[excess:]
+    return (result, carry)
+
+
+def subtract(a, b, carry=0):
+    """Subtract one string of trit glyphs from another.
+
+    Return a 2-tuple of (difference, carry-out), on the same terms as add().
+    """
+    return add(a, negate(b), carry)
+
+
+def compare(a, b):
+    """Compare two strings of trit glyphs by their numeric value.
+
+    Return -1, 0 or 1 according to whether 'a' is less than, equal to, or
+    greater than 'b'.  Once both are padded to the same length, the unsigned
+    digits sort in the same order as the numbers they represent.
+    """
+    length = max(len(a), len(b))
+    a = a.rjust(length, trit.ZERO).translate(GLYPH_DIGITS)
+    b = b.rjust(length, trit.ZERO).translate(GLYPH_DIGITS)
+    return (a > b) - (a < b)
@@ -0,0 +1,72 @@
+import pytest
+
+from ternary.integer import Int
+from ternary.trit import Trits, TRIT_POS
+
+np = pytest.importorskip('numpy')
+from ternary.array import TritArray  # noqa: E402
+
+
+TRIPLETS = [a + b + c for a in '-0+' for b in '-0+' for c in '-0+']
+
+
+def test_array_strings():
+    arr = TritArray.from_strings(TRIPLETS)
+    assert arr.shape == (27, 3)
+    assert arr.to_strings() == TRIPLETS
+    assert str(TritArray.from_string('-0+')) == '-0+'
+    assert TritArray.from_string('').to_strings() == ['']
+    with pytest.raises(ValueError):
+        TritArray.from_string('+x-')
+    with pytest.raises(ValueError):
+        TritArray.from_strings(['+-', '+'])
+
+
+def test_array_trits():
+    assert TritArray.from_trits(Trits('+-0')).to_trits() == Trits('+-0')
+    assert str(TritArray.from_trits('+-', 4)) == '00+-'
+    assert TritArray.from_trits(Int(-7)).to_int() == Int(-7)
+    assert TritArray.from_string('+0-')[0] == TRIT_POS
+
+
+@pytest.mark.parametrize("width", [3, 12, 45])
+def test_array_ints(width):
+    limit = 3 ** width // 2
+    values = [0, 1, -1, 7, -7, limit, -limit]
+    arr = TritArray.from_ints(values, width)
+    assert arr.to_strings() == [
+            str(Int(x, width)) for x in values]
+    assert list(arr.to_ints()) == values
+    with pytest.raises(ValueError):
+        TritArray.from_ints(limit + 1, width)
+
+
+def test_array_logic():
+    a = TritArray.from_strings([x for x in TRIPLETS for _ in TRIPLETS])
+    b = TritArray.from_strings([y for _ in TRIPLETS for y in TRIPLETS])
+    pairs = [(Trits(x), Trits(y)) for x in TRIPLETS for y in TRIPLETS]
+    assert (a & b).to_strings() == [str(x & y) for x, y in pairs]
+    assert (a | b).to_strings() == [str(x | y) for x, y in pairs]
+    assert (a ^ b).to_strings() == [str(x ^ y) for x, y in pairs]
+    assert (~a).to_strings() == [str(-x) for x, _ in pairs]
+    assert list(a.cmp(b)) == [x.cmp(y) for x, y in pairs]
+
+
+def test_array_add():
+    values = np.arange(-13, 14)
+    a = TritArray.from_ints(np.repeat(values, 27), 3)
+    b = TritArray.from_ints(np.tile(values, 27), 3)
+    total, carry = a.add(b)
+    expected = np.repeat(values, 27) + np.tile(values, 27)
+    assert list(total.to_ints() + 27 * carry.data) == list(expected)
+
+    total, carry = a.add(b, TRIT_POS)
+    assert list(total.to_ints() + 27 * carry.data) == list(expected + 1)
+
+
+def test_array_reduce():
+    arr = TritArray.from_strings(['+++', '+0+', '0-0', '000'])
+    assert arr.all().to_strings() == ['+0-0']
+    assert arr.any().to_strings() == ['++00']
+    assert list(arr.is_zero()) == [False, False, False, True]
+    assert list(arr.count('+')) == [3, 2, 0, 0]
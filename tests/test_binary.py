@@ -49,3 +49,56 @@ def test_binary_decode(inputs, expected):
 def test_binary_decode_err(inputs):
     with pytest.raises(ValueError):
         binary.decode(inputs)
+
+
+def test_binary_encode_trits():
+    assert binary.encode(Trits('-0++-0')) == b'\xf7\x00\x9a'
+    assert binary.encode('n0+++') == binary.encode('00+++')
+
+
+@pytest.mark.parametrize("size", [0, 1, 4, 5, 6, 13, 100])
+def test_binary_stream(size):
+    glyphs = ('+-0-0+' * 20)[:size]
+    chunks = [glyphs[i:i + 3] for i in range(0, size, 3)]
+    expected = binary.encode(glyphs)
+
+    # With the length up front, the output is identical to encode().
+    assert b''.join(binary.iterencode(chunks, size)) == expected
+
+    # Without it, the padding goes at the end, and decodes just the same.
+    data = b''.join(binary.iterencode(chunks))
+    assert binary.decode_glyphs(data) == glyphs
+    assert str(binary.decode(data)) == glyphs
+
+    pieces = [expected[i:i + 2] for i in range(0, len(expected), 2)]
+    assert ''.join(binary.iterdecode(pieces)) == glyphs
+
+
+def test_binary_decoder_offset():
+    decoder = binary.Decoder()
+    assert decoder.decode(b'\x33\xf7') == '-0++-'
+    assert decoder.decode(b'\x00') == '-'
+    with pytest.raises(ValueError, match='position 4'):
+        decoder.decode(b'\x00\xff')
+
+
+def test_binary_decode_words():
+    data = binary.encode('+-0-0+' * 4)
+    assert binary.decode_words(data) == ['+-0-0++-0-0+'] * 2
+    assert binary.decode_words(data, 8) == [
+            '+-0-0++-', '0-0++-0-', '0++-0-0+']
+    assert binary.decode_words(b'') == []
+    with pytest.raises(ValueError):
+        binary.decode_words(data, 5)
+
+
+def test_binary_decode_ints():
+    words = ['000000000+--', '------------', '++++++++++++']
+    result = binary.decode_ints(binary.encode(''.join(words)))
+    assert result.typecode == 'i'
+    assert list(result) == [5, -265720, 265720]
+    result = binary.decode_ints(binary.encode('+' * 40), 40)
+    assert result.typecode == 'q'
+    assert list(result) == [3 ** 40 // 2]
+    with pytest.raises(ValueError):
+        binary.decode_ints(binary.encode('+' * 41), 41)
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+from ternary import binary, container
+from ternary.trit import Trit, Trits
+
+
+GLYPHS = ('+-0-0+--0+' * 101)[:1003]
+
+
+@pytest.fixture
+def path(tmp_path):
+    result = tmp_path / 'data.btrc'
+    container.write(result, GLYPHS, 20)
+    return result
+
+
+def test_container_read(path):
+    with container.Reader(path) as reader:
+        assert len(reader) == 1003
+        assert reader.chunk_count == 51
+        assert reader.read() == GLYPHS
+        assert reader.read(15, 65) == GLYPHS[15:65]
+        assert reader.read(-10) == GLYPHS[-10:]
+        assert reader.read(500, 400) == ''
+        assert reader.chunk(50) == GLYPHS[1000:]
+        assert ''.join(reader.iterchunks()) == GLYPHS
+
+
+@pytest.mark.parametrize(
+        "key",
+        [
+            slice(None),
+            slice(19, 21),
+            slice(3, 900, 7),
+            slice(None, None, -1),
+            slice(-5, 2, -3),
+            slice(10, 10),
+            ])
+def test_container_slice(path, key):
+    with container.Reader(path) as reader:
+        assert reader[key] == Trits(GLYPHS[key])
+
+
+def test_container_index(path):
+    with container.Reader(path) as reader:
+        assert reader[0] == Trit(GLYPHS[0])
+        assert reader[-1] == Trit(GLYPHS[-1])
+        with pytest.raises(IndexError):
+            reader[1003]
+
+
+def test_container_chunks(tmp_path):
+    path = tmp_path / 'chunks.btrc'
+    with open(path, 'wb') as stream:
+        with container.Writer(stream, 10) as writer:
+            for i in range(0, len(GLYPHS), 7):
+                writer.write(Trits(GLYPHS[i:i + 7]))
+    with open(path, 'rb') as stream:
+        reader = container.Reader(stream)
+        assert reader.read() == GLYPHS
+        # Every chunk is a complete binary encoding in its own right.
+        start, end = reader.offsets[3:5]
+        assert binary.decode_glyphs(reader.map[start:end]) == GLYPHS[30:40]
+        reader.close()
+
+
+def test_container_empty(tmp_path):
+    path = tmp_path / 'empty.btrc'
+    container.write(path, '')
+    with container.Reader(path) as reader:
+        assert len(reader) == 0
+        assert reader.read() == ''
+
+
+def test_container_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        container.Writer(io.BytesIO(), 12)
+    path = tmp_path / 'bad.btrc'
+    path.write_bytes(binary.encode('+' * 500))
+    with pytest.raises(ValueError):
+        container.Reader(path)
+    path.write_bytes(b'')
+    with pytest.raises(ValueError):
+        container.Reader(path)
@@ -1,11 +1,14 @@
+import codecs
+import io
+import pickle
 import pytest
 import string
 
-from ternary import binary, integer, processor, trit
+from ternary import binary, character, integer, processor, trit, tryte
 from ternary.trit import (
         Trit, Trits, GLYPHS, NEG, ZERO, POS, TRITS, TRIT_NEG, TRIT_ZERO,
         TRIT_POS)
-from ternary.integer import Int, UInt
+from ternary.integer import Int, UInt, IntN, Int12
 from ternary.character import UTF6t
 from ternary.processor import Register
 
@@ -174,6 +177,22 @@ class TestTrits:
         assert str(Trits('', 4)) == '0000'
         assert str(Trits('+', 4)) == '000+'
         assert str(Trits('---0', 2)) == '-0'
+        # Aliases are parsed in bulk, and whitespace still means zero.
+        assert str(Trits('1N\u2212\u2713z\u2717=')) == '+0-+0-0'
+        assert str(Trits(' + ')) == '0+0'
+        with pytest.raises(ValueError):
+            Trits('+x-')
+
+    def test_from_string(self):
+        assert str(Trits.from_string('+0-')) == '+0-'
+        assert str(Trits.from_string('1n\u2212', 5)) == '00+0-'
+        assert str(Trits.from_string('')) == ''
+        assert type(Int.from_string('+-')) is Int
+        with pytest.raises(ValueError, match="'x' as a trit at offset 2"):
+            Trits.from_string('+-x0')
+        with pytest.raises(ValueError):
+            Trits.from_string('+ -')
+        assert trit.parse_glyphs('N1\u2713') == '0++'
 
     def test_str(self):
         assert [str(x) for x in TRIPLETS] == [
@@ -214,6 +233,47 @@ class TestTrits:
                 '0-', '00', '0+', '0-', '00', '0+', '0-', '00', '0+',
                 '+-', '+0', '++', '+-', '+0', '++', '+-', '+0', '++']
 
+    def test_pickle(self):
+        for value in (TRIT_NEG, TRIT_ZERO, TRIT_POS):
+            assert pickle.loads(pickle.dumps(value)) is value
+
+        source = Trits('+-0' * 1000)
+        result = pickle.loads(pickle.dumps(source))
+        assert type(result) is Trits
+        assert result == source
+        assert str(result) == str(source)
+        assert len(pickle.dumps(source)) < len(source.glyphs)
+        # A view pickles only its own trits, not its parent.
+        view = pickle.loads(pickle.dumps(source[1:4]))
+        assert type(view) is Trits
+        assert str(view) == '-0+'
+
+    def test_view(self):
+        source = Trits('+-0+--0+')
+        view = source[2:7]
+        assert isinstance(view, trit.TritsView)
+        assert view.parent is source
+        assert str(view) == '0+--0'
+        assert view == Trits('0+--0')
+        assert hash(view) == hash(Trits('0+--0'))
+        assert view[1] == TRIT_POS
+        assert view[-1] == TRIT_ZERO
+        with pytest.raises(IndexError):
+            view[5]
+        assert str(view[1:3]) == '+-'
+        assert view[1:3].parent is source
+        assert '+--' in view
+        assert '-0+' not in view
+        assert str(-view) == '0-++0'
+        assert int(Int(view)) == 15
+
+        # Each form of a view is built from the same form of its parent.
+        packed = Trits.from_planes(0b1001, 0b0100, 4)[1:3]
+        assert packed.planes == (0b00, 0b10)
+        assert str(packed) == '-0'
+        assert list(Trits('+-0')[:2]) == [TRIT_POS, TRIT_NEG]
+        assert len(Trits('+-0')[3:1]) == 0
+
     def test_contains(self):
         assert [('-' in x) for x in TRIPLETS] == [
                 True, True, True, True, True,  True,  True, True,  True,
@@ -318,6 +378,9 @@ class TestTrits:
         # Bogus operand concatentation
         with pytest.raises(TypeError):
             TRIPLETS[0] + 1
+        # Concatenation onto another kind of sequence
+        assert str('+-' + Trits('00')) == '+-00'
+        assert str([1, -1] + Trits('0')) == '+-0'
 
     def test_repeat(self):
         assert [str(x * 3) for x in TRIPLETS] == [
@@ -436,6 +499,115 @@ class TestTrits:
         x, y = inputs
         assert (x >= y) == expected
 
+    def test_planes(self):
+        assert Trits('').planes == (0, 0)
+        assert Trits('+0-').planes == (0b100, 0b001)
+        assert Trits('--0+', 6).planes == (0b000001, 0b001100)
+        assert [Trits.from_planes(*x.planes, len(x)) for x in TRIPLETS] == (
+                TRIPLETS)
+        assert str(Trits.from_planes(0b1, 0b110, 5)) == '00--+'
+        assert str(Trits.from_planes(0b1111, 0, 2)) == '++'
+        with pytest.raises(ValueError):
+            Trits.from_planes(0b11, 0b10, 2)
+
+    def test_packed_copy(self):
+        x = Trits('+-0+-', 3)
+        assert str(Trits(x)) == '0+-'
+        assert str(Trits(x, 2)) == '+-'
+        assert str(Trits(x, 6)) == '0000+-'
+        assert isinstance(Int.from_planes(1, 0, 2), Int)
+        assert int(Int.from_planes(1, 0b10, 2)) == -2
+
+    def test_packed_large(self):
+        a = Trits('+-0' * 1000)
+        b = Trits('0-+' * 1000, 4000)
+        assert str(a & b) == '0' * 1000 + '0-0' * 1000
+        assert str(a | b) == '0' * 1000 + '+-+' * 1000
+        assert (a ^ b).is_zero() is False
+        assert str(-a) == '-+0' * 1000
+        assert len(b.trim()) == 2999
+        assert a > b and b < a and a != b
+
+
+class TestOperator:
+    def test_table(self):
+        op = trit.BinaryOperator('----00-0+', 'AND')
+        assert op == trit.AND
+        assert op.id == int('000011012', 3)
+        assert trit.BinaryOperator(op.id).glyphs == op.glyphs
+        assert trit.UnaryOperator([1, 0, -1]) == trit.NOT
+        assert trit.UnaryOperator(0).glyphs == '---'
+        assert trit.UnaryOperator(26).glyphs == '+++'
+        assert str(op) == 'AND'
+        assert repr(trit.NOT) == "UnaryOperator('+0-')"
+        assert trit.BinaryOperator.from_function(
+                lambda a, b: a if a == b else ZERO) == trit.CONS
+        with pytest.raises(ValueError):
+            trit.BinaryOperator(3 ** 9)
+        with pytest.raises(ValueError):
+            trit.UnaryOperator('+-')
+
+    def test_apply(self):
+        a = Trits('---000+++')
+        b = Trits('-0+-0+-0+')
+        for op in (trit.AND, trit.OR, trit.XOR, trit.NAND, trit.NANY):
+            assert str(op(a, b)) == op.glyphs
+            assert [op(x, y) for x, y in BINARY] == [
+                    TRITS[x] for x in op.glyphs]
+            assert op.lookup(POS, NEG) == op.glyphs[6]
+        for i in range(0, 3 ** 9, 97):
+            op = trit.BinaryOperator(i)
+            assert str(op.apply(a, b)) == op.glyphs
+            # The shorter operand is padded with zeroes.
+            assert str(op.apply('+', '-0')) == op.lookup(ZERO, NEG) + (
+                    op.lookup(POS, ZERO))
+        for i in range(27):
+            op = trit.UnaryOperator(i)
+            assert str(op.apply('-0+')) == op.glyphs
+            assert op(TRIT_ZERO) == TRITS[op.glyphs[1]]
+
+    def test_source(self):
+        # The built-in operations reduce to the simplest plane formulas.
+        assert 'return (ap & bp, an | bn)' in trit.AND.source
+        assert 'return (ap | bp, an & bn)' in trit.OR.source
+        assert 'return (0, mask)' in trit.BinaryOperator(0).source
+
+
+class TestTritsBuilder:
+    def test_build(self):
+        builder = trit.TritsBuilder('+-')
+        builder.append(0)
+        builder.append(TRIT_NEG)
+        builder.extend(Trits('0+'))
+        builder += [1, 1]
+        builder.insert(0, '-')
+        assert len(builder) == 9
+        assert str(builder) == '-+-0-0+++'
+        assert builder.freeze() == Trits('-+-0-0+++')
+        assert builder[1] is TRIT_POS
+        assert builder[1:4] == Trits('+-0')
+        assert list(builder)[:2] == [TRIT_NEG, TRIT_POS]
+
+    def test_modify(self):
+        builder = trit.TritsBuilder(Trits('+0-+0-'))
+        builder[0] = '-'
+        builder[1:3] = '+++'
+        del builder[-1]
+        assert builder.pop() is TRIT_ZERO
+        assert str(builder) == '-++++'
+        builder.clear()
+        assert builder.freeze() == Trits('')
+        with pytest.raises(ValueError):
+            builder.append('x')
+
+    def test_large(self):
+        builder = trit.TritsBuilder()
+        for i in range(20000):
+            builder.extend('+-0')
+        result = builder.freeze()
+        assert len(result) == 60000
+        assert result.glyphs == '+-0' * 20000
+
 
 class TestInt:
     def test_init(self):
@@ -452,6 +624,28 @@ class TestInt:
         with pytest.raises(NotImplementedError):
             int(integer.IntMixin())
 
+    @pytest.mark.parametrize("size", [40, 500, 3000])
+    def test_init_large(self, size):
+        half = 3 ** size // 2
+        for x in (half, -half, half // 7, -(2 ** size), 3 ** (size - 1)):
+            value = Int(x)
+            assert int(value) == x
+            assert int(Int(str(value))) == x
+            assert len(value) == integer.order(x)
+        assert len(Int(half)) == size
+        assert len(Int(half + 1)) == size + 1
+        assert int(UInt(3 ** size)) == 3 ** size
+        assert str(UInt(3 ** size - 1)) == '+' * size
+
+    def test_add_large(self):
+        a = 3 ** 500 // 7
+        b = -(2 ** 700)
+        assert int(Int(a) + Int(b)) == a + b
+        assert int(Int(a) - Int(b)) == a - b
+        assert int(Int(a) + 5) == a + 5
+        assert Int(a) > Int(b)
+        assert Int(b) < Int(a) - Int(a)
+
     def test_int(self):
         assert [int(Int(x)) for x in TRIPLETS] == list(range(-13, 14))
         assert False not in [
@@ -487,6 +681,21 @@ class TestInt:
         assert [int(Int(x) * Int(y)) for x, y in BINARY_INTS] == [
                 x * y for x, y in BINARY_INTS]
 
+    @pytest.mark.parametrize("size", [10, 60, 400])
+    def test_mul_large(self, size):
+        values = [3 ** size - 1, -(2 ** (size * 3 // 2)) + 7, 5 ** size, -1]
+        for x in values:
+            for y in values:
+                assert int(Int(x) * Int(y)) == x * y
+                assert int(Int(x).karatsuba_multiply(Int(y))) == x * y
+                assert int(Int(x).toom3_multiply(Int(y))) == x * y
+
+    def test_halve(self):
+        assert [int(Int(x).halve()) for x in range(-20, 21, 2)] == list(
+                range(-10, 11))
+        with pytest.raises(ValueError):
+            Int(7).halve()
+
     def test_div(self):
         with pytest.raises(ZeroDivisionError):
             Int(1) // Int(0)
@@ -499,6 +708,45 @@ class TestInt:
         assert [Int(x) % Int(y) for x, y in ops] == remains
         assert [divmod(Int(x), Int(y)) for x, y in ops] == divmods
 
+    def test_div_large(self):
+        ops = [
+                (3 ** 30, 2),
+                (-(3 ** 30), 2),
+                (2 ** 200 + 12345, 3 ** 50 - 7),
+                (-(2 ** 200) + 1, -(10 ** 20)),
+                (10 ** 40, -(10 ** 40) - 1),
+                ]
+        for x, y in ops:
+            quotient = abs(x) // abs(y)
+            if (x < 0) != (y < 0):
+                quotient = -quotient
+            q, r = divmod(Int(x), Int(y))
+            assert (int(q), int(r)) == (quotient, x - quotient * y)
+
+    def test_pow(self):
+        for x in range(-4, 5):
+            for y in range(6):
+                assert int(Int(x) ** y) == x ** y
+        assert int(Int(3) ** Int(3)) == 27
+        assert int(2 ** Int(10)) == 1024
+        assert str(Int(0) ** 0) == '+'
+        assert int(Int(-7) ** 301) == (-7) ** 301
+        with pytest.raises(ValueError):
+            Int(2) ** -1
+
+    def test_pow_mod(self):
+        for x in range(-6, 7):
+            for m in (1, 2, 5, -5, 7):
+                for y in range(5):
+                    assert pow(Int(x), y, Int(m)) == Int(x) ** y % Int(m)
+        assert str(pow(Int(-2), 3, Int(5))) == '-0'
+        x = 3 ** 40 + 11
+        m = 2 ** 61 - 1
+        assert int(pow(Int(x), 2000, m)) == pow(x, 2000, m)
+        assert int(pow(Int(-x), 2001, Int(m))) == -pow(x, 2001, m)
+        with pytest.raises(ValueError):
+            pow(Int(2), 3, 0)
+
 
 class TestUInt:
     def test_init(self):
@@ -524,6 +772,106 @@ class TestUInt:
     def test_abs(self):
         assert [abs(UInt(x)) for x in TRIPLETS] == [UInt(x) for x in TRIPLETS]
 
+    def test_pickle(self):
+        for value in (Int(-12345), Int('00+-'), UInt(77), UInt('--0')):
+            result = pickle.loads(pickle.dumps(value))
+            assert type(result) is type(value)
+            assert str(result) == str(value)
+            assert int(result) == int(value)
+
+
+class TestIntN:
+    def test_sized(self):
+        assert IntN.sized(12) is Int12
+        int5 = IntN.sized(5)
+        assert int5.__name__ == 'Int5'
+        assert IntN.sized(5) is int5
+        assert int5.MAX == 121
+        with pytest.raises(ValueError):
+            IntN.sized(0)
+        with pytest.raises(TypeError):
+            IntN(1)
+
+    def test_init(self):
+        assert int(Int12(5)) == 5
+        assert str(Int12(5)) == '000000000+--'
+        assert Int12('+-') == 2
+        assert Int12(Trits('+-')) == Int12(Int12(2))
+        assert Int12(265720) == 265720
+        assert Int12(265721) == -265720
+        assert str(Int12('0+' + '-' * 12)) == '-' * 12
+        assert str(IntN.sized(3)(-14)) == '+++'
+
+    def test_arithmetic(self):
+        assert Int12(265720) + 1 == -265720
+        assert 1 - Int12(-265720) == -265720
+        assert Int12(1000) * 1000 == Int12.wrap(10 ** 6)
+        assert Int12.wrap(265721) == -265720
+        assert Int12(265720).add(Int12(1)) == (Int12(-265720), 1)
+        assert Int12(-265720).add(-1) == (Int12(265720), -1)
+        assert Int12(5).add(6, 1) == (Int12(12), 0)
+        assert Int12(-265720).sub(1) == (Int12(265720), -1)
+        low, high = Int12(265720).mul(265720)
+        assert int(high) * 3 ** 12 + int(low) == 265720 ** 2
+
+    def test_shift(self):
+        word = Int12('+-0+-0+-0+-+')
+        assert str(word << 2) == '0+-0+-0+-+00'
+        assert str(word >> 2) == '00+-0+-0+-0+'
+        result, carry = word.shift_left(2)
+        assert (result, carry) == (word << 2, int(Int('+-')))
+        result, carry = word.shift_right(2)
+        assert (result, carry) == (word >> 2, int(Int('-+')))
+
+    def test_logic(self):
+        for x in TRIPLETS:
+            for y in TRIPLETS:
+                a = IntN.sized(3)(x)
+                b = IntN.sized(3)(y)
+                assert str(a & b) == str(x & y)
+                assert str(a | b) == str(x | y)
+                assert str(a ^ b) == str(x ^ y)
+                assert str(~a) == str(-x)
+        assert Int12.from_planes(*Int12(-1234).planes) == -1234
+        assert Int12(-1234).trits == Int(-1234)
+
+
+class TestTryte:
+    def test_tables(self):
+        assert len(tryte.GLYPHS) == len(tryte.VALUES) == 729
+        assert tryte.GLYPHS[0] == '------'
+        assert tryte.GLYPHS[364] == '000000'
+        assert False not in [
+                tryte.VALUES[x] == int(Int(x)) for x in tryte.GLYPHS]
+        assert False not in [
+                tryte.PLANE_VALUES[p] == i - 364
+                for i, p in enumerate(tryte.PLANES)]
+
+    @pytest.mark.parametrize("size", [1, 5, 6, 7, 12, 13])
+    def test_add(self, size):
+        half = 3 ** size // 2
+        values = (0, 1, -1, half, -half, half // 3, -half // 5)
+        for x in values:
+            a = integer.int_to_glyphs(x, size)
+            for y in values:
+                b = integer.int_to_glyphs(y, size)
+                for carry in (-1, 0, 1):
+                    result, out = tryte.add(a, b, carry)
+                    assert len(result) == size
+                    total = integer.glyphs_to_int(result) + out * 3 ** size
+                    assert total == x + y + carry
+                result, out = tryte.subtract(a, b)
+                total = integer.glyphs_to_int(result) + out * 3 ** size
+                assert total == x - y
+                assert tryte.compare(a, b) == (x > y) - (x < y)
+        assert tryte.add('', '') == ('', 0)
+        assert tryte.add('+' * 7, '+') == ('-' * 7, 1)
+        assert tryte.compare('000+', '-') == 1
+
+    def test_negate(self):
+        assert tryte.negate('+0-') == '-0+'
+        assert tryte.negate('') == ''
+
 
 class TestUTF6t:
     @pytest.mark.parametrize(
@@ -619,6 +967,108 @@ class TestUTF6t:
         # Continuation without initial
         with pytest.raises(ValueError):
             UTF6t.decode('-+++++0-----')
+        # Not a trit
+        with pytest.raises(ValueError):
+            UTF6t.decode('-+++x+')
+
+    def test_chars(self):
+        text = 'a\u2713bc\U0001d11e d\xe9'
+        utf = UTF6t.from_glyphs(UTF6t(text).glyphs)
+        assert utf._string is None
+        assert len(utf.chars) == len(text)
+        assert list(utf.char_offsets) == [0, 6, 18, 24, 30, 48, 54, 60, 66]
+        assert [utf.chars[i] for i in range(-8, 8)] == list(text * 2)
+        assert utf.chars[1:5] == text[1:5]
+        assert utf.chars[::3] == text[::3]
+        assert utf.chars[6:2] == ''
+        assert ''.join(utf.chars) == text
+        assert utf.window(1, 4) == UTF6t(text[1:4])
+        assert utf.window(1, 4).string == text[1:4]
+        with pytest.raises(IndexError):
+            utf.chars[8]
+        # Only the characters asked for have been decoded.
+        assert utf._string is None
+        assert utf.string == text
+
+        ascii = UTF6t('hello')
+        assert ascii.char_offsets == range(0, 31, 6)
+        assert ascii.chars[-1] == 'o'
+
+    def test_validate(self):
+        # A stray continuation tryte in the third character.
+        glyphs = UTF6t('ab').glyphs + '0-----' + UTF6t('cd').glyphs
+        utf = UTF6t.from_glyphs(glyphs)
+        assert utf.chars[:2] == 'ab'
+        assert utf.chars[3] == 'd'
+        utf.validate(0, 2)
+        utf.validate(3)
+        with pytest.raises(ValueError):
+            utf.validate(1, 3)
+        with pytest.raises(ValueError):
+            utf.validate()
+        with pytest.raises(ValueError):
+            UTF6t(Trits(glyphs))
+
+    def test_sort_key(self):
+        assert character.sort_key(UTF6t('hello')) == b'hello'
+        assert character.sort_key('') == b''
+        # Tritwise order breaks down across characters of different sizes,
+        # but the sort key doesn't.
+        texts = [
+                '', 'a', 'ab', 'b', '\xf2', '\xf3', '\u2713', '\ue6a8',
+                '\ue6a9', '\ue6a9a', '\U0001d11e', '\U0010ffff']
+        assert sorted(texts, key=lambda x: Trits(UTF6t(x))) != texts
+        utfs = [UTF6t(x) for x in reversed(texts)]
+        assert sorted(utfs, key=character.sort_key) == [
+                UTF6t(x) for x in texts]
+        assert [x.string for x in sorted(utfs)] == texts
+        with pytest.raises(ValueError):
+            character.sort_key('-xxxxx')
+
+    def test_pickle(self):
+        text = UTF6t('Schrödinger’s 🐈')
+        result = pickle.loads(pickle.dumps(text))
+        assert type(result) is UTF6t
+        assert result.glyphs == text.glyphs
+        assert result.string == text.string
+
+    def test_compare(self):
+        assert UTF6t('ab') < UTF6t('abc')
+        assert UTF6t('abc') > UTF6t('ab')
+        assert UTF6t('b') > UTF6t('abc')
+        assert UTF6t('\ue6a8') < UTF6t('\ue6a9')
+        assert UTF6t('ab') == UTF6t('ab')
+        assert UTF6t('ab') != UTF6t('abc')
+
+    def test_codec(self):
+        text = 'h\xe9llo \u2713 \U0001d11e\n' * 3
+        data = text.encode('utf-6t')
+        assert data.decode('ascii') == UTF6t(text).glyphs
+        assert data.decode('utf-6t') == text
+        assert codecs.lookup('utf6t').name == 'utf-6t'
+        with pytest.raises(ValueError):
+            b'+00000'.decode('utf-6t')
+
+        decoder = codecs.getincrementaldecoder('utf-6t')()
+        pieces = [decoder.decode(data[i:i + 7]) for i in range(0, 500, 7)]
+        assert ''.join(pieces) + decoder.decode(b'', True) == text
+
+        reader = codecs.getreader('utf-6t')(io.BytesIO(data))
+        assert reader.read(3) + reader.read() == text
+
+    def test_codec_file(self, tmp_path):
+        path = tmp_path / 'text.6t'
+        text = 'caf\xe9 \u2717\n' * 1000
+        with open(path, 'w', encoding='utf-6t', newline='') as stream:
+            stream.write(text)
+        with open(path, encoding='utf-6t', newline='') as stream:
+            assert stream.readline() == 'caf\xe9 \u2717\n'
+            assert stream.read() == text[7:]
+
+        source = io.BytesIO(text.encode('utf-8'))
+        target = io.BytesIO()
+        character.transcode(source, target, 'utf-8', 'utf-6t')
+        assert target.getvalue() == path.read_bytes()
 
 
 class TestRegister:
@@ -658,6 +1108,43 @@ class TestRegister:
         r.put('+-0+0-+')
         assert str(r) == '-0+0-+'
 
+    def test_set_packed(self):
+        r = Register('+-', 4)
+        assert r.planes == (0b10, 0b01)
+        r[0] = TRIT_NEG
+        assert r.planes == (0b10, 0b1001)
+        assert str(r & Trits('++++')) == '-0+-'
+        assert r.is_zero() is False
+        r.clear()
+        assert r.is_zero() is True
+
+    def test_view(self):
+        r = Register('+-0+-0', 6)
+        view = r[1:4]
+        whole = r.get_trits()
+        assert str(view) == '-0+'
+        assert str(whole) == '+-0+-0'
+        # Views share the contents until the Register changes, and then keep
+        # the values they were taken from.
+        assert view.parent._trits is r.trits
+        r[2] = TRIT_POS
+        assert str(r) == '+-++-0'
+        assert str(view) == '-0+'
+        assert str(whole) == '+-0+-0'
+        assert str(r[1:4]) == '-++'
+        r.clear()
+        assert str(r.get_trits()) == '000000'
+
+    def test_pickle(self):
+        r = Register('+-', 4)
+        result = pickle.loads(pickle.dumps(r))
+        assert type(result) is Register
+        assert len(result) == 4
+        assert str(result) == '00+-'
+        result[0] = TRIT_POS
+        assert str(result) == '+0+-'
+        assert str(r) == '00+-'
+
 
 class TestInstruction:
     def test_bad_instruction_size(self):
@@ -61,6 +61,15 @@ def test_hardware_int_to_trits(inputs, expected):
     assert out == expected
 
 
+def test_hardware_int_to_trits_large():
+    size = 2000
+    n = 3 ** size // 2 - 5
+    trits = util.int_to_trits(n, size)
+    assert trits == '+' * (size - 2) + '0-'
+    assert util.trits_to_int(trits) == n
+    assert util.trits_to_int(tuple(trits)) == n
+
+
 @pytest.mark.parametrize(
         "inputs",
         [
@@ -0,0 +1,123 @@
+import io
+import os
+
+import pytest
+
+from ternary.hardware import (
+        arithmetic, codegen, component, computer, cpu, netlist, simulator,
+        util)
+from ternary.trit import ZERO, POS, NAND
+from tests.test_hardware_netlist import MUL_PROGRAM, random_inputs
+
+
+def test_hardware_codegen_nest():
+    table = codegen.nest(NAND.outputs)
+    assert table['+']['+'] == '-'
+    assert table['-']['+'] == '+'
+    assert table['0']['0'] == '0'
+
+
+@pytest.mark.parametrize(
+        "cls,size",
+        (
+            (arithmetic.Add12, 25),
+            (arithmetic.Comparator12, 24),
+            (cpu.ALU, 30),
+            ))
+def test_hardware_codegen_combinational(cls, size):
+    comp = cls()
+    sim = codegen.CompiledEvaluator(netlist.Netlist(cls()), None)
+    for inputs in random_inputs(size, 50):
+        comp.clear_cache()
+        expected = comp.get_outputs(inputs)
+        assert sim.get_outputs(inputs) == tuple(expected)
+
+
+def test_hardware_codegen_constants():
+    comp = component.Component(
+            ('a',),
+            ('out', 'x'),
+            {'X': component.Not, 'Y': component.NAnd},
+            {
+                'out': 'Y.out',
+                'x': 'X.out',
+                'X.in': POS,
+                'Y.a': 'X.out',
+                'Y.b': 'a',
+                })
+    sim = codegen.CompiledEvaluator(netlist.Netlist(comp), None)
+    # The NOT gate only has a constant input, so it is worked out in advance.
+    assert 'NOT' not in sim.source
+    assert sim.source.count('NAND_2') == 1
+    assert sim.get_outputs((POS,)) == (POS, '-')
+    assert sim.get_outputs(('-',)) == (POS, '-')
+
+
+def test_hardware_codegen_get_value():
+    comp = cpu.ALU()
+    net = netlist.Netlist(comp)
+    sim = codegen.CompiledEvaluator(net, None)
+    ref = netlist.Evaluator(net)
+    inputs = random_inputs(30, 1)[0]
+    sim.set_inputs(inputs)
+    ref.set_inputs(inputs)
+    # Wires inside the generated functions are filled in on demand.
+    names = [name for name, wire in net.wires.items()
+             if wire not in sim.stored]
+    assert names
+    for name in names[:50]:
+        assert sim.get_value(name) == ref.get_value(name)
+
+
+def test_hardware_codegen_computer():
+    comp = computer.Computer()
+    comp.load_program(MUL_PROGRAM)
+    sim = codegen.CompiledEvaluator(netlist.Netlist(comp), None)
+
+    sim.set_inputs(POS)
+    sim.tick()
+    sim.set_inputs(ZERO)
+    exit_addr = util.MIN_ADDR + len(MUL_PROGRAM) // 12
+    pc = util.trits_to_int(comp.get_program_address())
+    while pc < exit_addr:
+        sim.tick()
+        pc = util.trits_to_int(comp.get_program_address())
+
+    addr3 = util.int_to_trits(3, 11)
+    result = util.trits_to_int(comp.get_ram_contents(addr3))
+    assert result == -77 * 3
+
+
+def test_hardware_codegen_cache(tmp_path):
+    net = netlist.Netlist(arithmetic.Add12())
+    first = codegen.CompiledEvaluator(net, str(tmp_path))
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    assert files[0].endswith('.code')
+
+    second = codegen.CompiledEvaluator(net, str(tmp_path))
+    assert os.listdir(tmp_path) == files
+    inputs = random_inputs(25, 1)[0]
+    assert second.get_outputs(inputs) == first.get_outputs(inputs)
+
+    # A damaged cache entry is replaced.
+    path = tmp_path / files[0]
+    path.write_bytes(b'junk')
+    third = codegen.CompiledEvaluator(net, str(tmp_path))
+    assert third.get_outputs(inputs) == first.get_outputs(inputs)
+    assert path.read_bytes() != b'junk'
+
+    # A different netlist gets its own entry.
+    net = netlist.Netlist(arithmetic.Inc12())
+    codegen.CompiledEvaluator(net, str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_hardware_codegen_simulator(tmp_path, monkeypatch):
+    monkeypatch.setenv('BTERN_CACHE_DIR', str(tmp_path))
+    sim = simulator.Simulator()
+    sim.load(io.StringIO('\n'.join(
+        MUL_PROGRAM[i:i + 12] for i in range(0, len(MUL_PROGRAM), 12))))
+    sim.execute()
+    assert sim.get_ram_contents(3) == -77 * 3
+    assert len(os.listdir(tmp_path)) == 1
@@ -26,6 +26,16 @@ def test_hardware_computer_mov_d():
     assert seq_matches(comp.get_d(), '0-0++-00+--+')
 
 
+def test_hardware_computer_load_words():
+    comp = computer.Computer()
+    comp.load_program(['--0++-00+---', '+-0++-00+--+'])
+    comp.reset()
+    comp.step()
+    comp.step()
+    assert seq_matches(comp.get_a(), '0-0++-00+---')
+    assert seq_matches(comp.get_d(), '0-0++-00+--+')
+
+
 def test_hardware_computer_mov_a2():
     comp = computer.Computer()
     program = (
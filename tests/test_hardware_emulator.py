@@ -77,6 +77,16 @@ def test_hardware_emulator_mul():
     assert emu.get_ram(3) == 154
 
 
+def test_hardware_emulator_load_text():
+    emu = emulator.Emulator()
+    emu.load_text(('-00000000001  MOV 1 A', '', 'NNNNNNNNNNNN'))
+    assert emu.program == ['-0000000000+', '000000000000']
+    assert emu.comments == {0: 'MOV 1 A', 1: ''}
+
+    with pytest.raises(ValueError, match="Invalid characters"):
+        emu.load_text(('-0000000000x',))
+
+
 def test_hardware_emulator_load_binary():
     program = BytesIO(
             b'\xf6\x01yy\xcap\xe6\xd6xyy\xe5y\x94\xe9y(y\xcb\xebxyy\xd4\x9d'
@@ -86,3 +96,6 @@ def test_hardware_emulator_load_binary():
     emu.load(program)
     emu.execute()
     assert emu.get_ram(3) == -231
+
+    with pytest.raises(ValueError):
+        emu.load_binary(BytesIO(b'\xf3\x00'))
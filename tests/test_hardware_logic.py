@@ -405,3 +405,49 @@ def test_hardware_shift_right12(inputs, expected):
     comp = logic.ShiftRight12()
     out = comp.get_outputs(inputs)
     assert seq_matches(out, expected)
+
+
+def test_hardware_component_resolved():
+    comp = logic.Mux()
+    comp.set_inputs((N, Z, P, P))
+    assert comp.get_outputs() == (P,)
+    # Inputs of subcomponents are resolved to slots, not names.
+    for sub in comp.components.values():
+        assert len(sub.sources) == len(sub.inputs)
+        for function, arg in sub.sources:
+            assert isinstance(arg, int) or arg in (N, Z, P)
+
+    # The string API still works on top of the slots.
+    name, sub = next(iter(comp.components.items()))
+    assert comp.get_value(f'{name}.{sub.inputs[0]}') == sub.input_values[0]
+    assert comp.get_value('out') == P
+    assert comp.get_output('out') == P
+    assert comp.get_value(Z) == Z
+
+
+def test_hardware_component_reconnect():
+    comp = component.Component(
+            ('a', 'b'),
+            ('out',),
+            {'X': component.NAnd},
+            {'out': 'X.out', 'X.a': 'a', 'X.b': 'b'})
+    assert comp.get_outputs((P, P)) == (N,)
+
+    comp.add_connection('X.b', N)
+    comp.clear_cache()
+    assert comp.get_outputs((P, P)) == (P,)
+
+
+def test_hardware_component_missing():
+    comp = component.Component(
+            ('a',),
+            ('out', 'other'),
+            {'X': component.NAnd},
+            {'out': 'X.out', 'X.a': 'a', 'other': 'a'})
+    # Connections that lead nowhere only fail when they are needed.
+    comp.set_inputs((N,))
+    assert comp.get_value('other') == N
+    with pytest.raises(ValueError):
+        comp.get_value('out')
+    with pytest.raises(ValueError):
+        comp.get_value('nothing')
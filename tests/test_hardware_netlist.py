@@ -0,0 +1,280 @@
+import itertools
+import random
+
+import pytest
+
+from ternary.hardware import (
+        arithmetic, component, computer, cpu, logic, memory, netlist, util)
+from ternary import trit
+from ternary.trit import ZERO, POS
+from tests.util import seq_matches, TRITS, BINARY, TRINARY
+
+
+MUL_PROGRAM = (
+        '-00000000000'  # 01. MOV 0 A
+        '+000000-00++'  # 02. MOV -77 D
+        '00++0++00000'  # 03. CPY D M
+        '-0000000000+'  # 04. MOV 1 A
+        '+000000000+0'  # 05. MOV 3 D
+        '00++0++00000'  # 06. CPY D M
+        '-000000000+0'  # 07. MOV 3 A
+        '00++++-00000'  # 08. CLR M
+        '-0000000000+'  # 09. MOV 1 A
+        '0+0+0++00000'  # 10. CPY M D
+        '-000000000+-'  # 11. MOV 2 A
+        '00++0++00000'  # 12. CPY D M
+        '-00000000000'  # 13. LOOP: MOV 0 A
+        '0+0+0++00000'  # 14. CPY M D
+        '-000000000+0'  # 15. MOV 3 A
+        '000+00+00000'  # 16. ADD D M M
+        '-000000000+-'  # 17. MOV 2 A
+        '0+00-0000000'  # 18. DEC M D
+        '00++0++00000'  # 19. CPY D M
+        '---------00-'  # 20. MOV LOOP A
+        '0+++0++000+-'  # 21. CHK D JGT
+        )
+
+
+def random_inputs(size: int, count: int) -> list:
+    rand = random.Random(size)
+    return [tuple(rand.choices(TRITS, k=size)) for _ in range(count)]
+
+
+@pytest.mark.parametrize(
+        "cls,cases",
+        (
+            (logic.And, BINARY),
+            (logic.Mux, [a + b for a in TRINARY for b in BINARY]),
+            (arithmetic.FullAdd, TRINARY),
+            (arithmetic.Add12, random_inputs(25, 50)),
+            (arithmetic.Comparator12, random_inputs(24, 50)),
+            (cpu.ALU, random_inputs(30, 50)),
+            ))
+def test_hardware_netlist_combinational(cls, cases):
+    comp = cls()
+    sim = netlist.Evaluator(netlist.Netlist(cls()))
+    for inputs in cases:
+        comp.clear_cache()
+        expected = comp.get_outputs(inputs)
+        assert seq_matches(sim.get_outputs(inputs), expected)
+
+
+def test_hardware_netlist_structure():
+    net = netlist.Netlist(logic.Mux())
+    assert all(isinstance(node, netlist.GateNode) for node in net.nodes)
+    assert net.blocks == []
+    # Every node comes after the nodes that drive its inputs.
+    seen = set(net.inputs) | set(net.constants.values())
+    for node in net.nodes:
+        assert all(wire in seen for wire in node.inputs)
+        seen.update(node.outputs)
+    assert net.get_wire('out') == net.outputs[0]
+
+
+def test_hardware_netlist_opaque():
+    net = netlist.Netlist(memory.Register12())
+    assert len(net.blocks) == 12
+    assert all(
+            isinstance(node.component, memory.DataFlipFlop)
+            for node in net.blocks)
+    # A flip flop's output does not depend on its inputs.
+    assert all(node.dependencies == () for node in net.blocks)
+
+    net = netlist.Netlist(memory.DataFlipFlop())
+    assert [node.name for node in net.nodes] == ['']
+    sim = netlist.Evaluator(net)
+    sim.set_inputs((POS, POS))
+    assert sim.get_outputs() == (ZERO,)
+    assert sim.tick() is True
+    assert sim.get_outputs() == (POS,)
+
+
+def test_hardware_netlist_register():
+    comp = memory.Register12()
+    net = netlist.Netlist(comp)
+    sim = netlist.Evaluator(net)
+    value = tuple('+-0+-0+-0+-0')
+    sim.set_inputs(value + (POS,))
+    assert sim.get_outputs() == tuple(ZERO * 12)
+    sim.tick()
+    assert sim.get_outputs() == value
+    assert comp.get_contents() == ''.join(value)
+
+    sim.set_inputs(tuple(ZERO * 12) + (ZERO,))
+    assert sim.tick() is False
+    assert sim.get_value('out[0]') == POS
+    assert sim.get_value('T1.Mux.out') == '-'
+
+
+def test_hardware_netlist_cpu():
+    a = cpu.CPU()
+    b = cpu.CPU()
+    sim = netlist.Evaluator(netlist.Netlist(b))
+    for inputs in random_inputs(25, 30):
+        a.clear_cache()
+        a.set_inputs(inputs)
+        sim.set_inputs(inputs)
+        assert seq_matches(sim.get_outputs(), a.get_outputs())
+        assert a.tick() == sim.tick()
+        assert a.get_a() == b.get_a()
+        assert a.get_d() == b.get_d()
+        assert a.get_pc() == b.get_pc()
+
+
+def test_hardware_netlist_computer():
+    comp = computer.Computer()
+    comp.load_program(MUL_PROGRAM)
+    sim = netlist.Evaluator(netlist.Netlist(comp))
+
+    sim.set_inputs(POS)
+    sim.tick()
+    sim.set_inputs(ZERO)
+    exit_addr = util.MIN_ADDR + len(MUL_PROGRAM) // 12
+    pc = util.trits_to_int(comp.get_program_address())
+    while pc < exit_addr:
+        sim.tick()
+        pc = util.trits_to_int(comp.get_program_address())
+
+    addr3 = util.int_to_trits(3, 11)
+    result = util.trits_to_int(comp.get_ram_contents(addr3))
+    assert result == -77 * 3
+
+
+def test_hardware_netlist_errors():
+    comp = component.Component(
+            ('a',),
+            ('out',),
+            {'X': component.Not},
+            {'out': 'X.out'})
+    with pytest.raises(ValueError):
+        netlist.Netlist(comp)
+
+    comp = component.Component(
+            ('a',),
+            ('out',),
+            {'X': component.NAnd, 'Y': component.Not},
+            {
+                'out': 'Y.out',
+                'X.a': 'a',
+                'X.b': 'Y.out',
+                'Y.in': 'X.out',
+                })
+    with pytest.raises(ValueError):
+        netlist.Netlist(comp)
+
+    net = netlist.Netlist(logic.And())
+    with pytest.raises(ValueError):
+        net.get_wire('nothing')
+
+
+def test_hardware_netlist_event():
+    a = computer.Computer()
+    b = computer.Computer()
+    a.load_program(MUL_PROGRAM)
+    b.load_program(MUL_PROGRAM)
+    full = netlist.Evaluator(netlist.Netlist(a))
+    sim = netlist.EventEvaluator(netlist.Netlist(b))
+    size = len(sim.netlist.nodes)
+
+    for runner in (full, sim):
+        runner.set_inputs(POS)
+        runner.tick()
+        runner.set_inputs(ZERO)
+    assert sim.evaluations == size
+
+    for _ in range(40):
+        assert full.tick() == sim.tick()
+        assert full.get_outputs() == sim.get_outputs()
+        assert a.get_a() == b.get_a()
+        assert a.get_d() == b.get_d()
+        assert a.get_program_address() == b.get_program_address()
+    addr3 = util.int_to_trits(3, 11)
+    assert util.trits_to_int(b.get_ram_contents(addr3)) == -77 * 3
+    # Only a fraction of the nodes are evaluated on each cycle.
+    assert sim.evaluations < size * 20
+
+    # Setting the same inputs again doesn't evaluate anything.
+    count = sim.evaluations
+    sim.set_inputs(ZERO)
+    sim.get_outputs()
+    assert sim.evaluations == count
+
+    sim.invalidate()
+    sim.get_outputs()
+    assert sim.evaluations == count + size
+
+
+def test_hardware_netlist_event_inputs():
+    comp = arithmetic.Add12()
+    sim = netlist.EventEvaluator(netlist.Netlist(arithmetic.Add12()))
+    for inputs in random_inputs(25, 50):
+        comp.clear_cache()
+        expected = comp.get_outputs(inputs)
+        assert seq_matches(sim.get_outputs(inputs), expected)
+
+
+@pytest.mark.parametrize(
+        "cls",
+        (
+            logic.And, logic.Or, logic.Xor, logic.IsZero, logic.Mux,
+            logic.Demux, arithmetic.Sum, arithmetic.HalfAdd,
+            arithmetic.FullAdd, arithmetic.Comparator, arithmetic.Inc,
+            ))
+def test_hardware_netlist_sliced_truth_table(cls):
+    comp = cls()
+    sim = netlist.SlicedEvaluator(netlist.Netlist(cls()))
+    table = sim.truth_table()
+    cases = list(itertools.product(TRITS, repeat=len(comp.inputs)))
+    assert len(table) == len(cases)
+    for inputs, outputs in zip(cases, table):
+        comp.clear_cache()
+        assert seq_matches(outputs, comp.get_outputs(inputs))
+
+
+def test_hardware_netlist_sliced_comparator():
+    # Every one of the 3 ** 12 inputs, checked against the same comparison
+    # done directly on the planes: the sign of the highest non-zero trit.
+    sim = netlist.SlicedEvaluator(netlist.Netlist(arithmetic.Comparator12()))
+    size = 12
+    count = 3 ** size
+    mask = (1 << count) - 1
+    planes = []
+    for i in range(size):
+        run = 3 ** i
+        column = ''.join(x * run for x in TRITS) * 3 ** (size - 1 - i)
+        planes.append(trit.Trits.from_glyphs(column[::-1]).planes)
+    (pos, neg), = sim.evaluate_planes(planes, count)
+
+    expected_pos = expected_neg = 0
+    undecided = mask
+    for p, n in reversed(planes):
+        expected_pos |= undecided & p
+        expected_neg |= undecided & n
+        undecided &= ~(p | n)
+    assert pos == expected_pos
+    assert neg == expected_neg
+
+
+def test_hardware_netlist_sliced_add():
+    sim = netlist.SlicedEvaluator(netlist.Netlist(arithmetic.Add12()))
+    rand = random.Random(12)
+    pairs = [
+            (rand.randint(util.MIN_INT, util.MAX_INT),
+             rand.randint(util.MIN_INT, util.MAX_INT))
+            for _ in range(2000)]
+    # The buses have the least significant trit at index 0.
+    vectors = [
+            tuple(util.int_to_trits(a, 12)[::-1])
+            + tuple(util.int_to_trits(b, 12)[::-1])
+            for a, b in pairs]
+    results = sim.evaluate(vectors)
+    for (a, b), out in zip(pairs, results):
+        total = (a + b - util.MIN_INT) % util.INT_RANGE + util.MIN_INT
+        assert util.trits_to_int(out[::-1]) == total
+
+    assert sim.get_planes('out[0]') == sim.get_planes('Add0.sum')
+
+
+def test_hardware_netlist_sliced_errors():
+    with pytest.raises(ValueError):
+        netlist.SlicedEvaluator(netlist.Netlist(memory.Register12()))
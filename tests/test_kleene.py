@@ -0,0 +1,131 @@
+from itertools import product
+
+import pytest
+
+from ternary import kleene
+from ternary.trit import Trit, Trits, TRIT_NEG, TRIT_ZERO, TRIT_POS
+
+
+ROWS = list(product('-0+', repeat=3))
+COLUMNS = [''.join(x) for x in zip(*ROWS)]
+
+
+def reference(text):
+    expression = kleene.parse(text)
+    return ''.join(
+            str(expression.evaluate(dict(zip('abc', row)))) for row in ROWS)
+
+
+@pytest.mark.parametrize(
+        "text,expected",
+        [
+            ('a', 'a'),
+            ('a & ~b | c', 'a & ~b | c'),
+            ('a|b&c', 'a | b & c'),
+            ('(a | b) & c', '(a | b) & c'),
+            ('~(a ^ b) ^ c', '~(a ^ b) ^ c'),
+            ('~~a & +', '~~a & +'),
+            ('a & (b & c)', 'a & b & c'),
+            ])
+def test_kleene_parse(text, expected):
+    assert str(kleene.parse(text)) == expected
+
+
+@pytest.mark.parametrize("text", ['', 'a &', '(a', 'a b', 'a $ b', '~', ')'])
+def test_kleene_parse_invalid(text):
+    with pytest.raises(ValueError):
+        kleene.parse(text)
+
+
+def test_kleene_operators():
+    a, b, c = kleene.variables('a b c')
+    assert str(a & ~b | c) == 'a & ~b | c'
+    assert str((a | b) ^ '-') == '(a | b) ^ -'
+    assert str(1 & a) == '+ & a'
+    assert str(-a) == '~a'
+    assert (a & b).variables == ('a', 'b')
+    assert (c | a & c).variables == ('c', 'a')
+    assert (a & ~b | c).evaluate({'a': '+', 'b': '-', 'c': 0}) == TRIT_POS
+
+
+@pytest.mark.parametrize(
+        "text",
+        [
+            'a & ~b | c',
+            'a ^ b ^ c',
+            '~(a | b) & (b | c)',
+            '(a & b) | (b & a) | ~~c',
+            'a & + | b & - | c ^ 0',
+            'a ^ + ^ b ^ - ^ c',
+            '(a ^ b) & ~(a ^ b) | c',
+            ])
+def test_kleene_compile(text):
+    formula = kleene.compile(text)
+    expected = reference(text)
+    assert str(formula(*COLUMNS)) == expected
+    assert formula.table == expected
+    result = formula(
+            a=Trits(COLUMNS[0]), b=list(COLUMNS[1]), c=COLUMNS[2])
+    assert type(result) is Trits
+    assert str(result) == expected
+
+
+def test_kleene_steps():
+    # Repeated and commuted subexpressions are only computed once, and
+    # constants are folded away.
+    formula = kleene.compile('(a & b) | (b & a) | ~~c')
+    assert [x[0] for x in formula.steps] == ['&', '|']
+    formula = kleene.compile('a & + | b & - | c ^ 0')
+    assert [x[:2] for x in formula.steps] == [('|', (0, 5))]
+    assert formula.constants == {5: TRIT_ZERO}
+    formula = kleene.compile('a ^ +')
+    assert formula.steps == [('~', (0,), 2)]
+    assert formula.constants == {}
+    formula = kleene.compile('+ & 0')
+    assert formula.variables == ()
+    assert str(formula()) == '0'
+
+
+def test_kleene_table():
+    formula = kleene.compile('a & ~b')
+    assert formula.table == '---00-+0-'
+    assert formula(TRIT_POS, TRIT_NEG) == TRIT_POS
+    assert formula(TRIT_ZERO, TRIT_POS) == TRIT_NEG
+    names = ' '.join('v{}'.format(i) for i in range(10))
+    formula = kleene.compile(' | '.join(names.split()))
+    assert formula.table is None
+    assert formula(*([TRIT_NEG] * 9 + [TRIT_ZERO])) == TRIT_ZERO
+
+
+def test_kleene_columns():
+    formula = kleene.compile('a | b')
+    with pytest.raises(ValueError):
+        formula('+-', '+')
+    with pytest.raises(TypeError):
+        formula('+')
+    with pytest.raises(TypeError):
+        formula('+', '-', '0')
+    with pytest.raises(TypeError):
+        formula('+', a='-')
+    with pytest.raises(TypeError):
+        formula('+', c='-')
+    assert str(formula('+-0', [Trit('-'), 0, -1])) == '+00'
+
+
+def test_kleene_arrays():
+    np = pytest.importorskip('numpy')
+    from ternary.array import TritArray
+
+    for text in ('a & ~b | c', '~(a | b) & (b | c)', 'a ^ + ^ b ^ - ^ c'):
+        formula = kleene.compile(text)
+        expected = reference(text)
+        columns = [TritArray.from_string(x) for x in COLUMNS]
+        result = formula(*columns)
+        assert isinstance(result, TritArray)
+        assert str(result) == expected
+        result = formula(*[x.data * 5 for x in columns])
+        assert isinstance(result, np.ndarray)
+        assert str(TritArray.wrap(result)) == expected
+        # Evaluating with the pipeline gives the same as the composed table.
+        data = [x.data for x in columns]
+        assert str(TritArray.wrap(formula.run_array_steps(data))) == expected
@@ -0,0 +1,80 @@
+import multiprocessing
+import pickle
+
+import pytest
+
+from ternary import shared
+from ternary.trit import Trit, Trits
+
+
+GLYPHS = ('0+-0-0+--+' * 101)[:1003]
+
+
+@pytest.fixture
+def block():
+    result = shared.SharedTrits.create(Trits.from_glyphs(GLYPHS))
+    yield result
+    result.close()
+    result.unlink()
+
+
+def count_positive(args):
+    source, start, stop = args
+    return source.read(start, stop).count('+')
+
+
+def test_shared_read(block):
+    assert len(block) == 1003
+    assert block.read() == GLYPHS
+    assert block.read(3, 14) == GLYPHS[3:14]
+    assert block.read(-7) == GLYPHS[-7:]
+    assert block.read(40, 30) == ''
+    assert block.to_trits() == Trits(GLYPHS)
+
+
+@pytest.mark.parametrize(
+        "key",
+        [
+            slice(None),
+            slice(4, 6),
+            slice(3, 900, 7),
+            slice(None, None, -1),
+            slice(10, 10),
+            ])
+def test_shared_slice(block, key):
+    assert str(block[key]) == GLYPHS[key]
+
+
+def test_shared_index(block):
+    assert block[1] == Trit('+')
+    assert block[-1] == Trit(GLYPHS[-1])
+    with pytest.raises(IndexError):
+        block[1003]
+
+
+def test_shared_attach(block):
+    with pickle.loads(pickle.dumps(block)) as other:
+        assert other.name == block.name
+        assert len(other) == 1003
+        assert other.read(997) == GLYPHS[997:]
+
+    with shared.SharedTrits(block.name) as other:
+        assert other[100:110] == block[100:110]
+
+
+def test_shared_pool(block):
+    ranges = [(block, i, i + 100) for i in range(0, 1003, 100)]
+    with multiprocessing.get_context('fork').Pool(2) as pool:
+        counts = pool.map(count_positive, ranges)
+    assert sum(counts) == GLYPHS.count('+')
+
+
+def test_shared_empty():
+    block = shared.SharedTrits.create('')
+    try:
+        assert len(block) == 0
+        assert block.read() == ''
+        assert str(block[:]) == ''
+    finally:
+        block.close()
+        block.unlink()